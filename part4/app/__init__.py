@@ -1,39 +1,79 @@
-from flask import Flask, send_from_directory
+from flask import Flask
 from flask_restx import Api
-from flask_bcrypt import Bcrypt
-from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-import os
+from app.persistence.cache import ReadThroughCache
+from app.persistence.engines import RoutingSession, add_replica_binds, configure_engines
+from app.security.password_hasher import PasswordHasher, PasswordHasherBusy
+from app.security.rate_limit import LoginRateLimiter
+from app.security.tokens import CachingJWTManager, TokenDenylist
+from app.web.assets import StaticAssets
+from app.web.compression import ResponseCompression
+from importlib import import_module
 
 # Create extension instances
-bcrypt = Bcrypt()
-jwt = JWTManager()
-db = SQLAlchemy()
+password_hasher = PasswordHasher()
+login_limiter = LoginRateLimiter()
+jwt = CachingJWTManager()
+revoked_tokens = TokenDenylist()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+cache = ReadThroughCache()
+principals = ReadThroughCache()
+unknown_emails = ReadThroughCache()
+assets = StaticAssets()
+compression = ResponseCompression()
 
-def create_app(config_class="config.DevelopmentConfig"):
+# API namespace modules and their URL prefixes, imported by create_app
+API_NAMESPACES = [
+    ('app.api.v1.users', '/api/v1/users'),
+    ('app.api.v1.amenities', '/api/v1/amenities'),
+    ('app.api.v1.places', '/api/v1/places'),
+    ('app.api.v1.reviews', '/api/v1/reviews'),
+    ('app.api.v1.auth', '/api/v1/auth'),
+    ('app.api.v1.export', '/api/v1/export'),
+    ('app.api.v1.metrics', '/api/v1/metrics'),
+]
+
+def create_app(config_class="config.DevelopmentConfig", **config_overrides):
     app = Flask(__name__)
     
-    # Load configuration
+    # Load configuration; keyword arguments override single settings
+    # (e.g. SQLALCHEMY_READ_REPLICA_URIS=[])
     app.config.from_object(config_class)
+    app.config.update(config_overrides)
     
     # Initialize extensions
-    bcrypt.init_app(app)
+    password_hasher.init_app(app)
+    login_limiter.init_app(app)
     jwt.init_app(app)
+    revoked_tokens.init_app(app)
+    add_replica_binds(app)
     db.init_app(app)
+    configure_engines(app, db)
+    cache.init_app(app)
+    principals.init_app(app, prefix='PRINCIPAL_CACHE_')
+    unknown_emails.init_app(app, prefix='UNKNOWN_EMAIL_CACHE_')
     CORS(app)  # Enable CORS for frontend-backend communication
     
-    # Serve frontend files
-    @app.route('/')
-    def index():
-        return send_from_directory('../frontend', 'index.html')
+    # Authorization comes from the user's current state, not the claims frozen at login
+    @jwt.user_lookup_loader
+    def load_principal(jwt_header, jwt_data):
+        from app.services import facade
+        return facade.get_user_principal(jwt_data['sub'])
+    
+    @jwt.token_in_blocklist_loader
+    def token_revoked(jwt_header, jwt_data):
+        # Logged-out tokens, and tokens issued before the user's token_version
+        # was bumped (or for a deleted user)
+        if revoked_tokens.is_revoked(jwt_data['jti']):
+            return True
+        from app.services import facade
+        principal = facade.get_user_principal(jwt_data['sub'])
+        return principal is None or jwt_data.get('token_version', 0) != principal['token_version']
     
-    @app.route('/<path:filename>')
-    def serve_static(filename):
-        # Don't serve API routes as static files
-        if filename.startswith('api/'):
-            return "Not Found", 404
-        return send_from_directory('../frontend', filename)
+    # Serve frontend files under content-hashed names, precompressed
+    assets.init_app(app)
+    compression.init_app(app)
     
     # Initialize API with updated doc path to avoid conflicts
     api = Api(
@@ -44,55 +84,29 @@ def create_app(config_class="config.DevelopmentConfig"):
         doc='/api/v1/doc/'  # Changed from '/api/v1/' to avoid conflict with static files
     )
 
-    # Register namespaces
-    from app.api.v1.users import api as users_ns
-    api.add_namespace(users_ns, path='/api/v1/users')
-
-    from app.api.v1.amenities import api as amenities_ns
-    api.add_namespace(amenities_ns, path='/api/v1/amenities')
-
-    from app.api.v1.places import api as places_ns
-    api.add_namespace(places_ns, path='/api/v1/places')
-
-    from app.api.v1.reviews import api as reviews_ns
-    api.add_namespace(reviews_ns, path='/api/v1/reviews')
+    @api.errorhandler(PasswordHasherBusy)
+    def handle_hasher_busy(error):
+        # Shed login/signup load instead of queueing behind a saturated pool
+        return {'message': str(error)}, 503, {'Retry-After': '1'}
 
-    # Register auth namespace
-    from app.api.v1.auth import api as auth_ns
-    api.add_namespace(auth_ns, path='/api/v1/auth')
+    # Register namespaces (flask-restx builds their routes at registration,
+    # which Flask requires before the first request)
+    for module, path in API_NAMESPACES:
+        api.add_namespace(import_module(module).api, path=path)
 
-    # Initialize database and create admin user
     with app.app_context():
-        # Create tables if they don't exist
-        db.create_all()
+        # Bring the primary database schema up to date (replicas are read-only).
+        # Deployed databases are set up once with python -m scripts.init_db
+        # instead of on every worker boot
+        from app.persistence.migrations import migrate, check_schema
+        if app.config.get('SCHEMA_AUTO_MIGRATE'):
+            migrate(db.engine)
+        if app.config.get('SCHEMA_CHECK_ON_STARTUP', True):
+            check_schema(db.engine)
         
-        try:
+        # In-memory test databases live and die with the app
+        if app.config.get('ADMIN_BOOTSTRAP_ON_STARTUP'):
             from app.services import facade
-            
-            # Check if admin user already exists
-            admin = facade.get_user_by_email('admin@hbnb.com')
-            if not admin:
-                admin_data = {
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'email': 'admin@hbnb.com',
-                    'password': 'admin123'
-                }
-                admin = facade.create_user(admin_data)
-                admin.is_admin = True
-                admin.save()  # Save to database
-                print("✅ Admin user created automatically on startup")
-                print("   Email: admin@hbnb.com")
-                print("   Password: admin123")
-            else:
-                # Ensure existing user is admin
-                if not admin.is_admin:
-                    admin.is_admin = True
-                    admin.save()
-                print("✅ Admin user ready")
-                print("   Email: admin@hbnb.com") 
-                print("   Password: admin123")
-        except Exception as e:
-            print(f"⚠️  Admin user creation failed: {e}")
+            facade.ensure_admin_user()
 
     return app
\ No newline at end of file
@@ -1,6 +1,9 @@
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_current_user
 from app.services import facade
+from app.api.v1.conditional import collection_version, entity_version, conditional
+from app.api.v1.serializers import serialize_with
+from app.api.v1.bulk import read_bulk_rows, bulk_response
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -30,8 +33,7 @@ class AmenityList(Resource):
         """Create a new amenity (Admin only)"""
         try:
             # Check if user is admin
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             if not is_admin:
                 api.abort(403, 'Admin privileges required')
@@ -47,24 +49,45 @@ class AmenityList(Resource):
                 api.abort(400, str(e))
 
     @api.response(200, 'List of amenities retrieved successfully')
-    @api.marshal_list_with(amenity_response)
+    @api.response(304, 'Not modified')
+    @serialize_with(api, amenity_response, as_list=True)
     def get(self):
-        """Retrieve a list of all amenities (Public access)"""
-        amenities = facade.get_all_amenities()
-        return [amenity.to_dict() for amenity in amenities], 200
+        """Retrieve a list of all amenities (Public access, supports conditional requests)"""
+        etag, last_modified = collection_version('amenities', *facade.get_amenities_version())
+        return conditional(etag, last_modified, facade.get_all_amenities)
+
+@api.route('/bulk')
+class AmenityBulk(Resource):
+    @jwt_required()
+    @api.expect([amenity_model])
+    @api.response(201, 'All amenities created')
+    @api.response(207, 'Some amenities could not be created, see per-row results')
+    @api.response(400, 'Unreadable request body')
+    @api.response(403, 'Admin privileges required')
+    def post(self):
+        """Create many amenities from a JSON array or NDJSON body (Admin only)"""
+        if not get_current_user()['is_admin']:
+            api.abort(403, 'Admin privileges required')
+        try:
+            rows = read_bulk_rows()
+        except ValueError as e:
+            api.abort(400, str(e))
+        return bulk_response(facade.bulk_create_amenities(rows))
 
 @api.route('/<string:amenity_id>')
 @api.param('amenity_id', 'The amenity identifier')
 class AmenityResource(Resource):
     @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(304, 'Not modified')
     @api.response(404, 'Amenity not found')
     @api.marshal_with(amenity_response)
     def get(self, amenity_id):
-        """Get amenity details by ID (Public access)"""
-        amenity = facade.get_amenity(amenity_id)
+        """Get amenity details by ID (Public access, supports conditional requests)"""
+        amenity = facade.get_amenity_details(amenity_id)
         if not amenity:
             api.abort(404, f"Amenity with id {amenity_id} not found")
-        return amenity.to_dict(), 200
+        etag, last_modified = entity_version(amenity)
+        return conditional(etag, last_modified, lambda: amenity)
 
     @jwt_required()
     @api.expect(amenity_model, validate=True)
@@ -78,8 +101,7 @@ class AmenityResource(Resource):
         """Update an amenity's information (Admin only)"""
         try:
             # Check if user is admin
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             if not is_admin:
                 api.abort(403, 'Admin privileges required')
@@ -1,6 +1,11 @@
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import (create_access_token, create_refresh_token, decode_token, jwt_required,
+                                get_jwt_identity, get_jwt, get_current_user)
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from app.services import facade
+from app import login_limiter, revoked_tokens
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -10,34 +15,89 @@ login_model = api.model('Login', {
     'password': fields.String(required=True, description='User password')
 })
 
+logout_model = api.model('Logout', {
+    'refresh_token': fields.String(description='Refresh token to revoke along with the access token')
+})
+
 @api.route('/login')
 class Login(Resource):
-    @api.expect(login_model)
+    @api.expect(login_model, validate=True)
     @api.response(200, 'Login successful')
     @api.response(401, 'Invalid credentials')
+    @api.response(429, 'Too many failed login attempts')
     def post(self):
         """Authenticate user and return a JWT token"""
         credentials = api.payload
+        ip = request.remote_addr
         
-        # Step 1: Retrieve the user based on the provided email
-        user = facade.get_user_by_email(credentials['email'])
+        # Step 0: Refuse IPs/emails with too many recent failures, before any password check
+        retry_after = login_limiter.retry_after(ip, credentials['email'])
+        if retry_after:
+            return {'error': 'Too many failed login attempts'}, 429, {'Retry-After': str(retry_after)}
         
-        # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
+        # Step 1-2: Retrieve the user by email and check the password
+        # (an outdated password hash is upgraded on success)
+        user = facade.authenticate_user(credentials['email'], credentials['password'])
+        if not user:
+            login_limiter.record_failure(ip, credentials['email'])
             return {'error': 'Invalid credentials'}, 401
+        login_limiter.record_success(ip, credentials['email'])
 
-        # Step 3: Create a JWT token with user ID as identity and custom claims
+        # Step 3: Create a short-lived access token with user ID as identity and
+        # custom claims (is_admin is informational; permissions are checked against
+        # the user's current state, and token_version allows revocation), plus a
+        # refresh token to renew it
+        claims = {'email': user.email, 'token_version': user.token_version}
         access_token = create_access_token(
             identity=str(user.id),
+            additional_claims={'is_admin': user.is_admin, **claims}
+        )
+        refresh_token = create_refresh_token(identity=str(user.id), additional_claims=claims)
+        
+        # Step 4: Return the JWT tokens to the client
+        return {'access_token': access_token, 'refresh_token': refresh_token}, 200
+
+@api.route('/refresh')
+class Refresh(Resource):
+    @jwt_required(refresh=True)
+    @api.response(200, 'Access token renewed')
+    @api.response(401, 'Invalid, expired or revoked refresh token')
+    def post(self):
+        """Exchange a refresh token (as the Bearer token) for a new access token"""
+        refresh_claims = get_jwt()
+        principal = get_current_user()
+        access_token = create_access_token(
+            identity=refresh_claims['sub'],
             additional_claims={
-                'is_admin': user.is_admin,
-                'email': user.email
+                'is_admin': principal['is_admin'],
+                'email': refresh_claims.get('email'),
+                'token_version': principal['token_version']
             }
         )
-        
-        # Step 4: Return the JWT token to the client
         return {'access_token': access_token}, 200
 
+@api.route('/logout')
+class Logout(Resource):
+    @jwt_required()
+    @api.expect(logout_model)
+    @api.response(200, 'Logged out')
+    @api.response(401, 'Invalid or missing token')
+    def post(self):
+        """Revoke the current access token and, if given, the refresh token"""
+        claims = get_jwt()
+        revoked_tokens.revoke(claims['jti'], claims['exp'])
+        
+        refresh_token = (request.get_json(silent=True) or {}).get('refresh_token')
+        if refresh_token:
+            try:
+                refresh_claims = decode_token(refresh_token)
+            except (PyJWTError, JWTExtendedException):
+                api.abort(400, 'Invalid refresh token')
+            if refresh_claims['sub'] != claims['sub'] or refresh_claims['type'] != 'refresh':
+                api.abort(400, 'Invalid refresh token')
+            revoked_tokens.revoke(refresh_claims['jti'], refresh_claims['exp'])
+        return {'message': 'Logged out'}, 200
+
 @api.route('/protected')
 class ProtectedResource(Resource):
     @jwt_required()
@@ -54,6 +114,6 @@ class ProtectedResource(Resource):
         return {
             'message': f'Hello, user {current_user_id}',
             'user_id': current_user_id,
-            'is_admin': jwt_data.get('is_admin', False),
+            'is_admin': get_current_user()['is_admin'],
             'email': jwt_data.get('email', 'N/A')
         }, 200
\ No newline at end of file
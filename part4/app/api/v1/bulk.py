@@ -0,0 +1,49 @@
+"""Request parsing and responses shared by the bulk create endpoints."""
+import json
+from flask import request
+
+# Largest number of rows accepted by one bulk request
+MAX_BULK_ROWS = 10000
+
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/jsonl')
+
+
+def read_bulk_rows():
+    """Read the request body as a JSON array, or as NDJSON (one JSON value per line).
+
+    NDJSON bodies are read line by line from the request stream. Raises
+    ValueError when the body cannot be parsed or holds too many rows.
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        rows = []
+        for number, line in enumerate(request.stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                raise ValueError(f"Invalid JSON on line {number}")
+            if len(rows) > MAX_BULK_ROWS:
+                break
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            raise ValueError("Expected a JSON array or an NDJSON body")
+    
+    if not rows:
+        raise ValueError("No rows to create")
+    if len(rows) > MAX_BULK_ROWS:
+        raise ValueError(f"At most {MAX_BULK_ROWS} rows per request")
+    return rows
+
+
+def bulk_response(results):
+    """Summarize per-row results: 201 when every row was created, 207 otherwise."""
+    created = sum(1 for result in results if result['status'] == 201)
+    body = {
+        'created': created,
+        'failed': len(results) - created,
+        'results': results
+    }
+    return body, 201 if created == len(results) else 207
@@ -0,0 +1,85 @@
+"""HTTP conditional request helpers (ETag / Last-Modified) for read endpoints."""
+import hashlib
+from datetime import datetime, timezone
+from flask import request
+from werkzeug.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Build a strong ETag value from the given version parts."""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def _as_datetime(value):
+    """Accept datetimes or the ISO strings produced by to_dict()."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def entity_version(details):
+    """Get (etag, last_modified) for a serialized entity and any nested entities.
+
+    Every nested dictionary carrying an id and updated_at (owner, amenities,
+    reviews) contributes, so an expansion changes the ETag when it changes.
+    """
+    stamps = []
+
+    def collect(value):
+        if isinstance(value, dict):
+            if 'id' in value and 'updated_at' in value:
+                stamps.append((value['id'], value['updated_at']))
+            for child in value.values():
+                collect(child)
+        elif isinstance(value, list):
+            for child in value:
+                collect(child)
+
+    collect(details)
+    etag = make_etag(*(f'{entity_id}@{updated_at}' for entity_id, updated_at in stamps))
+    last_modified = max((_as_datetime(updated_at) for _, updated_at in stamps), default=None)
+    return etag, last_modified
+
+
+def collection_version(name, count, max_updated_at):
+    """Get (etag, last_modified) for a collection from its row count and latest update.
+
+    The query string is part of the ETag so each page or filter has its own.
+    """
+    etag = make_etag(name, count, max_updated_at, request.query_string.decode('utf-8'))
+    return etag, _as_datetime(max_updated_at)
+
+
+def validator_headers(etag, last_modified):
+    """Response headers that let clients revalidate with If-None-Match/If-Modified-Since."""
+    headers = {
+        'ETag': quote_etag(etag),
+        # Clients may store the response but must revalidate before reuse
+        'Cache-Control': 'no-cache'
+    }
+    if last_modified:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def is_not_modified(etag, last_modified):
+    """Check the request's conditional headers; If-None-Match takes precedence."""
+    if request.if_none_match:
+        # Weak comparison: compressed responses carry the weak form of the ETag
+        return request.if_none_match.contains_weak(etag)
+    if last_modified and request.if_modified_since:
+        # HTTP dates have one-second resolution
+        modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        return modified <= request.if_modified_since
+    return False
+
+
+def conditional(etag, last_modified, load):
+    """Return a 304 without a body when the client copy is current.
+
+    `load` is only called, and its result only serialized, on a 200.
+    """
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(etag, last_modified):
+        return None, 304, headers
+    return load(), 200, headers
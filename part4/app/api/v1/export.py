@@ -0,0 +1,85 @@
+import csv
+import io
+from flask import Response, stream_with_context
+from flask_restx import Namespace, Resource, reqparse
+from flask_jwt_extended import jwt_required, get_current_user
+from app.services import facade
+from app.api.v1.serializers import dumps
+
+api = Namespace('export', description='Streaming collection exports (Admin only)')
+
+# Rows encoded per chunk of the chunked response
+ROWS_PER_CHUNK = 500
+
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv', 'csv'),
+}
+
+export_parser = reqparse.RequestParser()
+export_parser.add_argument('format', type=str, default='ndjson', location='args',
+                           choices=tuple(EXPORT_FORMATS),
+                           help='ndjson (one JSON object per line) or csv')
+
+
+def _batches(rows, size=ROWS_PER_CHUNK):
+    """Group an iterator of rows into lists of at most size rows."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ndjson_chunks(rows):
+    """Encode rows as NDJSON, one chunk per batch of rows."""
+    for batch in _batches(rows):
+        yield b''.join(dumps(row) + b'\n' for row in batch)
+
+
+def csv_chunks(columns, rows):
+    """Encode rows as CSV with a header line, one chunk per batch of rows."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator='\n')
+    writer.writeheader()
+    for batch in _batches(rows):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header of an empty collection
+        yield buffer.getvalue().encode('utf-8')
+
+
+@api.route('/<string:entity>')
+@api.param('entity', 'users, places, reviews or amenities')
+class Export(Resource):
+    @jwt_required()
+    @api.expect(export_parser)
+    @api.response(200, 'Collection streamed as NDJSON or CSV')
+    @api.response(403, 'Admin privileges required')
+    @api.response(404, 'Unknown collection')
+    def get(self, entity):
+        """Stream a whole collection as NDJSON or CSV (Admin only)
+        
+        Rows are read through a server-side cursor and sent with chunked
+        transfer encoding, so memory use stays flat for any collection size.
+        """
+        if not get_current_user()['is_admin']:
+            api.abort(403, 'Admin privileges required')
+        args = export_parser.parse_args()
+        
+        try:
+            columns, rows = facade.export_collection(entity)
+        except ValueError as e:
+            api.abort(404, str(e))
+        
+        mimetype, extension = EXPORT_FORMATS[args['format']]
+        chunks = csv_chunks(columns, rows) if args['format'] == 'csv' else ndjson_chunks(rows)
+        return Response(stream_with_context(chunks), mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename={entity}.{extension}'
+        })
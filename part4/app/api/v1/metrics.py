@@ -0,0 +1,27 @@
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required, get_current_user
+from app.services import facade
+
+api = Namespace('metrics', description='Runtime metrics (Admin only)')
+
+@api.route('/cache')
+class CacheMetrics(Resource):
+    @jwt_required()
+    @api.response(200, 'Cache statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    def get(self):
+        """Get read-through cache hit/miss counters for this worker (Admin only)"""
+        if not get_current_user()['is_admin']:
+            api.abort(403, 'Admin privileges required')
+        return facade.get_cache_stats(), 200
+
+@api.route('/password-hashing')
+class PasswordHashingMetrics(Resource):
+    @jwt_required()
+    @api.response(200, 'Password hashing statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    def get(self):
+        """Get password hashing pool queue depth and counters for this worker (Admin only)"""
+        if not get_current_user()['is_admin']:
+            api.abort(403, 'Admin privileges required')
+        return facade.get_password_hashing_stats(), 200
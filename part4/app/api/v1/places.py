@@ -1,6 +1,9 @@
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource, fields, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_current_user
 from app.services import facade
+from app.api.v1.conditional import collection_version, entity_version, conditional
+from app.api.v1.serializers import serialize_with
+from app.api.v1.bulk import read_bulk_rows, bulk_response
 
 api = Namespace('places', description='Place operations')
 
@@ -17,6 +20,13 @@ user_model = api.model('PlaceUser', {
     'email': fields.String(description='Email of the owner')
 })
 
+review_model = api.model('PlaceReview', {
+    'id': fields.String(description='Review ID'),
+    'text': fields.String(description='Text of the review'),
+    'rating': fields.Integer(description='Rating of the place (1-5)'),
+    'user_id': fields.String(description='ID of the user')
+})
+
 # Define the place model for input validation and documentation
 place_model = api.model('Place', {
     'title': fields.String(required=True, description='Title of the place'),
@@ -33,9 +43,73 @@ place_list_model = api.model('PlaceList', {
     'title': fields.String(description='Title of the place'),
     'latitude': fields.Float(description='Latitude'),
     'longitude': fields.Float(description='Longitude'),
-    'price': fields.Float(description='Price per night')  # ADDED THIS FIELD
+    'price': fields.Float(description='Price per night'),  # ADDED THIS FIELD
+    'review_count': fields.Integer(description='Number of reviews'),
+    'average_rating': fields.Float(description='Average review rating (0 when unreviewed)')
 })
 
+# Output model for one page of places (keyset pagination)
+place_page_model = api.model('PlacePage', {
+    'places': fields.List(fields.Nested(place_list_model)),
+    'limit': fields.Integer(description='Maximum number of places in this page'),
+    'next_cursor': fields.String(description='Cursor for the next page, null on the last page')
+})
+
+# Pagination bounds for the place list
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Default radius of a location search
+DEFAULT_RADIUS_KM = 10.0
+
+# Query parameters for the place list
+place_list_parser = reqparse.RequestParser()
+place_list_parser.add_argument('limit', type=int, default=DEFAULT_PAGE_SIZE, location='args',
+                               help='Number of places per page (1-100)')
+place_list_parser.add_argument('cursor', type=str, location='args',
+                               help='Opaque cursor returned as next_cursor by the previous page')
+place_list_parser.add_argument('min_price', type=float, location='args',
+                               help='Minimum price per night')
+place_list_parser.add_argument('max_price', type=float, location='args',
+                               help='Maximum price per night')
+place_list_parser.add_argument('q', type=str, location='args',
+                               help='Text to match in the title or description')
+place_list_parser.add_argument('near', type=str, location='args',
+                               help='Centre of a location search as "latitude,longitude"')
+place_list_parser.add_argument('radius_km', type=float, default=DEFAULT_RADIUS_KM, location='args',
+                               help='Radius of the location search in kilometres')
+place_list_parser.add_argument('amenities', type=str, location='args',
+                               help="Comma-separated amenity ID's that places must all have")
+place_list_parser.add_argument('sort', type=str, default='created_at', location='args',
+                               choices=('created_at', 'price', '-price', 'rating'),
+                               help='Sort order: created_at, price, -price or rating (best first)')
+
+
+def parse_place_search(args):
+    """Turn place list query arguments into facade search keywords."""
+    search = {
+        'min_price': args['min_price'],
+        'max_price': args['max_price'],
+        'q': args['q']
+    }
+    
+    if args['near']:
+        try:
+            latitude, longitude = (float(part) for part in args['near'].split(','))
+        except ValueError:
+            raise ValueError('near must be "latitude,longitude"')
+        if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+            raise ValueError('near is out of range')
+        if args['radius_km'] <= 0:
+            raise ValueError('radius_km must be positive')
+        search['near'] = (latitude, longitude)
+        search['radius_km'] = args['radius_km']
+    
+    if args['amenities']:
+        search['amenity_ids'] = [part.strip() for part in args['amenities'].split(',') if part.strip()]
+    
+    return search
+
 # Output model for detailed place (PUBLIC - no authentication needed)
 place_detail_model = api.model('PlaceDetail', {
     'id': fields.String(description='Place ID'),
@@ -46,10 +120,58 @@ place_detail_model = api.model('PlaceDetail', {
     'longitude': fields.Float(description='Longitude of the place'),
     'owner': fields.Nested(user_model),
     'amenities': fields.List(fields.Nested(amenity_model)),
+    'reviews': fields.List(fields.Nested(review_model), description='Only present with include=reviews'),
+    'review_count': fields.Integer(description='Number of reviews'),
+    'average_rating': fields.Float(description='Average review rating (0 when unreviewed)'),
     'created_at': fields.DateTime(description='Creation date'),
     'updated_at': fields.DateTime(description='Last update date')
 })
 
+# Output model for a place found by proximity
+nearby_place_model = api.inherit('NearbyPlace', place_list_model, {
+    'distance_km': fields.Float(description='Great-circle distance from the search point')
+})
+
+# Query parameters for proximity search
+nearby_parser = reqparse.RequestParser()
+nearby_parser.add_argument('lat', type=float, required=True, location='args',
+                           help='Latitude of the search point')
+nearby_parser.add_argument('lng', type=float, required=True, location='args',
+                           help='Longitude of the search point')
+nearby_parser.add_argument('radius_km', type=float, location='args',
+                           help='Only return places within this radius (default: k nearest)')
+nearby_parser.add_argument('limit', type=int, default=DEFAULT_PAGE_SIZE, location='args',
+                           help='Maximum number of places (1-100)')
+
+# Output models for full-text search results
+search_result_model = api.inherit('PlaceSearchResult', place_list_model, {
+    'title_highlight': fields.String(description='HTML-escaped title with matched terms wrapped in <mark>'),
+    'snippet': fields.String(description='HTML-escaped description excerpt with matched terms wrapped in <mark>')
+})
+
+search_page_model = api.model('PlaceSearchPage', {
+    'places': fields.List(fields.Nested(search_result_model)),
+    'limit': fields.Integer(description='Maximum number of places in this page'),
+    'next_cursor': fields.String(description='Cursor for the next page, null on the last page')
+})
+
+# Query parameters for full-text search
+search_parser = reqparse.RequestParser()
+search_parser.add_argument('q', type=str, required=True, location='args',
+                           help='Words to search for in titles and descriptions')
+search_parser.add_argument('limit', type=int, default=DEFAULT_PAGE_SIZE, location='args',
+                           help='Maximum number of places per page (1-100)')
+search_parser.add_argument('cursor', type=str, location='args',
+                           help='next_cursor from the previous page')
+
+# Query parameters for place details
+DEFAULT_PLACE_INCLUDES = ('owner', 'amenities')
+
+place_detail_parser = reqparse.RequestParser()
+place_detail_parser.add_argument('include', type=str, location='args',
+                                 help='Comma-separated relationships to expand: owner, amenities, reviews '
+                                      '(default: owner,amenities)')
+
 @api.route('/')
 class PlaceList(Resource):
     @jwt_required()
@@ -76,24 +198,112 @@ class PlaceList(Resource):
             else:
                 api.abort(400, str(e))
 
+    @api.expect(place_list_parser)
     @api.response(200, 'List of places retrieved successfully')
-    @api.marshal_list_with(place_list_model)
+    @api.response(304, 'Not modified')
+    @api.response(400, 'Invalid pagination or search parameters')
+    @serialize_with(api, place_page_model)
+    def get(self):
+        """Search places with filters, sorting and pagination (Public access, supports conditional requests)"""
+        args = place_list_parser.parse_args()
+        limit = args['limit']
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            api.abort(400, f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        
+        try:
+            search = parse_place_search(args)
+            etag, last_modified = collection_version('places', *facade.get_places_version())
+            return conditional(etag, last_modified, lambda: facade.get_places_page(
+                limit=limit, cursor=args['cursor'], sort=args['sort'], **search
+            ))
+        except ValueError as e:
+            api.abort(400, str(e))
+
+@api.route('/bulk')
+class PlaceBulk(Resource):
+    @jwt_required()
+    @api.expect([place_model])
+    @api.response(201, 'All places created')
+    @api.response(207, 'Some places could not be created, see per-row results')
+    @api.response(400, 'Unreadable request body')
+    @api.response(401, 'Authentication required')
+    def post(self):
+        """Create many places from a JSON array or NDJSON body (Authentication required)
+        
+        Places are owned by the current user; admins may set owner_id per row.
+        """
+        try:
+            rows = read_bulk_rows()
+        except ValueError as e:
+            api.abort(400, str(e))
+        
+        is_admin = get_current_user()['is_admin']
+        return bulk_response(facade.bulk_create_places(rows, get_jwt_identity(), rows_set_owner=is_admin))
+
+@api.route('/nearby')
+class NearbyPlaceList(Resource):
+    @api.expect(nearby_parser)
+    @api.response(200, 'Nearby places retrieved successfully')
+    @api.response(400, 'Invalid search parameters')
+    @serialize_with(api, nearby_place_model, as_list=True)
     def get(self):
-        """Retrieve a list of all places (Public access)"""
-        places = facade.get_all_places()
+        """Get the places nearest to a point, ordered by distance (Public access)"""
+        args = nearby_parser.parse_args()
+        if not -90 <= args['lat'] <= 90 or not -180 <= args['lng'] <= 180:
+            api.abort(400, 'lat/lng out of range')
+        if not 1 <= args['limit'] <= MAX_PAGE_SIZE:
+            api.abort(400, f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        if args['radius_km'] is not None and args['radius_km'] <= 0:
+            api.abort(400, 'radius_km must be positive')
+        
+        try:
+            places = facade.get_nearby_places(args['lat'], args['lng'], limit=args['limit'],
+                                              radius_km=args['radius_km'])
+        except ValueError as e:
+            api.abort(400, str(e))
         return places, 200
 
+@api.route('/search')
+class PlaceSearch(Resource):
+    @api.expect(search_parser)
+    @api.response(200, 'Search results retrieved successfully')
+    @api.response(400, 'Invalid search parameters')
+    @serialize_with(api, search_page_model)
+    def get(self):
+        """Full-text search of places, best match first (Public access)"""
+        args = search_parser.parse_args()
+        if not 1 <= args['limit'] <= MAX_PAGE_SIZE:
+            api.abort(400, f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        
+        try:
+            return facade.search_places(args['q'], limit=args['limit'], cursor=args['cursor']), 200
+        except ValueError as e:
+            api.abort(400, str(e))
+
 @api.route('/<string:place_id>')
 @api.param('place_id', 'The place identifier')
 class PlaceResource(Resource):
+    @api.expect(place_detail_parser)
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Not modified')
+    @api.response(400, 'Invalid include parameter')
     @api.response(404, 'Place not found')
     def get(self, place_id):
         """Get place details by ID (Public access)"""
-        place = facade.get_place(place_id)
+        args = place_detail_parser.parse_args()
+        if args['include'] is None:
+            include = DEFAULT_PLACE_INCLUDES
+        else:
+            include = tuple(part.strip() for part in args['include'].split(',') if part.strip())
+            unknown = set(include) - set(facade.PLACE_INCLUDES)
+            if unknown:
+                api.abort(400, f"Unknown include: {', '.join(sorted(unknown))}")
+        
+        place = facade.get_place(place_id, include=include)
         if not place:
             api.abort(404, f"Place with id {place_id} not found")
-        return place, 200
+        etag, last_modified = entity_version(place)
+        return conditional(etag, last_modified, lambda: place)
 
     @jwt_required()
     @api.expect(place_model, validate=True)
@@ -106,16 +316,15 @@ class PlaceResource(Resource):
         try:
             # Get current authenticated user and claims
             current_user = get_jwt_identity()
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
-            # Get the place to check ownership
-            place = facade.get_place(place_id)
-            if not place:
+            # Check ownership with a single-column lookup; update_place loads the place
+            owner_id = facade.get_place_owner_id(place_id)
+            if owner_id is None:
                 api.abort(404, f"Place with id {place_id} not found")
             
             # Check if current user owns the place OR is an admin
-            if not is_admin and place.get('owner', {}).get('id') != current_user:
+            if not is_admin and owner_id != current_user:
                 api.abort(403, 'Unauthorized action')
             
             place_data = api.payload
@@ -1,6 +1,7 @@
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_current_user
 from app.services import facade
+from app.api.v1.bulk import read_bulk_rows, bulk_response
 
 api = Namespace('reviews', description='Review operations')
 
@@ -16,8 +17,9 @@ class ReviewList(Resource):
     @jwt_required()
     @api.expect(review_model)
     @api.response(201, 'Review successfully created')
-    @api.response(400, 'Invalid input data')
+    @api.response(400, 'Invalid input data, own place or already reviewed')
     @api.response(401, 'Authentication required')
+    @api.response(404, 'Place not found')
     def post(self):
         """Create a new review (Authentication required)"""
         try:
@@ -25,39 +27,41 @@ class ReviewList(Resource):
             current_user = get_jwt_identity()
             
             review_data = api.payload.copy()
-            place_id = review_data.get('place_id')
             
-            # Check if place exists
-            place = facade.get_place(place_id)
-            if not place:
-                api.abort(404, f"Place with id {place_id} not found")
-            
-            # Check if user is trying to review their own place
-            if place.get('owner', {}).get('id') == current_user:
-                api.abort(400, 'You cannot review your own place')
-            
-            # Check if user has already reviewed this place
-            existing_reviews = facade.get_reviews_by_place(place_id)
-            user_already_reviewed = any(
-                review.user_id == current_user for review in existing_reviews
-            )
-            if user_already_reviewed:
-                api.abort(400, 'You have already reviewed this place')
-            
-            # Set user_id to current authenticated user
+            # Set user_id to current authenticated user; the facade rejects reviews
+            # of unknown places, of the user's own place and duplicate reviews
             review_data['user_id'] = current_user
             
             new_review = facade.create_review(review_data)
             return new_review.to_dict(), 201
             
         except ValueError as e:
-            api.abort(400, str(e))
+            if "not found" in str(e):
+                api.abort(404, str(e))
+            else:
+                api.abort(400, str(e))
 
     def get(self):
         """Get all reviews (Public access)"""
         reviews = facade.get_all_reviews()
         return [review.to_dict() for review in reviews], 200
 
+@api.route('/bulk')
+class ReviewBulk(Resource):
+    @jwt_required()
+    @api.expect([review_model])
+    @api.response(201, 'All reviews created')
+    @api.response(207, 'Some reviews could not be created, see per-row results')
+    @api.response(400, 'Unreadable request body')
+    @api.response(401, 'Authentication required')
+    def post(self):
+        """Create many reviews by the current user from a JSON array or NDJSON body (Authentication required)"""
+        try:
+            rows = read_bulk_rows()
+        except ValueError as e:
+            api.abort(400, str(e))
+        return bulk_response(facade.bulk_create_reviews(rows, get_jwt_identity()))
+
 @api.route('/<review_id>')
 class ReviewResource(Resource):
     def get(self, review_id):
@@ -77,8 +81,7 @@ class ReviewResource(Resource):
         try:
             # Get current authenticated user and claims
             current_user = get_jwt_identity()
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             # Get the review to check ownership
             review = facade.get_review(review_id)
@@ -108,8 +111,7 @@ class ReviewResource(Resource):
         try:
             # Get current authenticated user and claims
             current_user = get_jwt_identity()
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             # Get the review to check ownership
             review = facade.get_review(review_id)
@@ -0,0 +1,115 @@
+"""Compiled JSON serializers for list endpoints.
+
+flask-restx's marshal() looks up and dispatches on every field object of a
+model for every row of every response, and then the result is encoded by
+the generic JSON encoder. compile_model() walks an api.model once and
+returns a plain function producing the same dictionaries, and
+serialize_with() is a drop-in for @api.marshal_with / @api.marshal_list_with
+that encodes its output directly, with orjson when it is installed.
+
+Endpoints opt in one at a time by swapping the decorator; field types the
+compiler does not know fall back to the field's own output().
+"""
+import json
+from functools import wraps
+from flask import Response, current_app
+from flask_restx import fields
+from flask_restx.utils import unpack
+
+try:
+    import orjson
+except ImportError:  # optional dependency, json is used instead
+    orjson = None
+
+
+def _format_datetime(value):
+    # to_dict() and cached rows already hold ISO strings
+    return value if isinstance(value, str) else value.isoformat()
+
+
+# Exact field class -> converter for non-null values (same results as field.format)
+_CONVERTERS = {
+    fields.String: str,
+    fields.Integer: int,
+    fields.Float: float,
+    fields.Boolean: bool,
+}
+
+
+def _compile_field(field):
+    """Converter for non-null values of field, or None if it must use field.output()."""
+    if field.mask is not None or callable(field.default):
+        return None
+    if type(field) in _CONVERTERS:
+        return _CONVERTERS[type(field)]
+    if type(field) is fields.DateTime and field.dt_format == 'iso8601':
+        return _format_datetime
+    if type(field) is fields.Nested:
+        return compile_model(field.nested)
+    if type(field) is fields.List:
+        item = _compile_field(field.container)
+        if item is None:
+            return None
+        if type(field.container) is fields.Nested:
+            # A null item becomes a model of nulls, as in marshal()
+            return lambda values: [item(v) for v in values]
+        return lambda values: [None if v is None else item(v) for v in values]
+    return None
+
+
+def compile_model(model):
+    """Build a function serializing one dict or object like marshal(obj, model)."""
+    model = getattr(model, 'resolved', model)
+    plan = []
+    for name, field in model.items():
+        # Models may name a field class instead of an instance
+        field = field() if isinstance(field, type) else field
+        attribute = field.attribute or name
+        convert = _compile_field(field)
+        if convert is None or not isinstance(attribute, str) or '.' in attribute:
+            plan.append((name, None, None, field))
+        else:
+            # What marshal() outputs for a missing or null value
+            plan.append((name, attribute, convert, field.output(name, {})))
+
+    def serialize(obj):
+        get = obj.get if isinstance(obj, dict) else (lambda key: getattr(obj, key, None))
+        data = {}
+        for name, attribute, convert, fallback in plan:
+            if convert is None:
+                data[name] = fallback.output(name, obj)
+                continue
+            value = get(attribute)
+            data[name] = fallback if value is None else convert(value)
+        return data
+
+    return serialize
+
+
+def dumps(data):
+    """Encode data as compact JSON bytes (orjson unless JSON_SERIALIZER is 'json')."""
+    if orjson is not None and current_app.config.get('JSON_SERIALIZER', 'orjson') == 'orjson':
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def serialize_with(api, model, as_list=False, code=200, description=None):
+    """Decorator like api.marshal_with(model) (as_list: marshal_list_with) on the fast path.
+
+    The view returns data, (data, status) or (data, status, headers) as
+    usual; a None body (e.g. a 304) is sent empty.
+    """
+    serializer = compile_model(model)
+    convert = (lambda rows: [serializer(row) for row in rows]) if as_list else serializer
+    documented = [model] if as_list else model
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data, status, headers = unpack(view(*args, **kwargs))
+            if data is None:
+                return Response(status=status, headers=headers)
+            return Response(dumps(convert(data)), status=status, headers=headers,
+                            mimetype='application/json')
+        return api.doc(responses={str(code): (description, documented)})(wrapper)
+    return decorator
@@ -1,6 +1,8 @@
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_current_user
 from app.services import facade
+from app.api.v1.conditional import collection_version, entity_version, conditional
+from app.api.v1.serializers import serialize_with
 
 # Create the namespace
 api = Namespace('users', description='User operations')
@@ -54,8 +56,7 @@ class UserList(Resource):
         """Create a new user (Admin only)"""
         try:
             # Check if user is admin
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             if not is_admin:
                 api.abort(403, 'Admin privileges required')
@@ -70,11 +71,12 @@ class UserList(Resource):
             else:
                 api.abort(400, str(e))
     
-    @api.marshal_list_with(user_response)
+    @api.response(304, 'Not modified')
+    @serialize_with(api, user_response, as_list=True)
     def get(self):
-        """List all users (Public access)"""
-        users = facade.get_all_users()
-        return [user.to_dict() for user in users], 200
+        """List all users (Public access, supports If-None-Match/If-Modified-Since)"""
+        etag, last_modified = collection_version('users', *facade.get_users_version())
+        return conditional(etag, last_modified, facade.get_all_users)
 
 @api.route('/<string:user_id>')
 @api.param('user_id', 'The user identifier')
@@ -82,14 +84,16 @@ class UserResource(Resource):
     """Handle operations on a single user"""
     
     @api.response(200, 'Success')
+    @api.response(304, 'Not modified')
     @api.response(404, 'User not found')
     @api.marshal_with(user_response)
     def get(self, user_id):
-        """Get user details by ID (Public access)"""
-        user = facade.get_user(user_id)
+        """Get user details by ID (Public access, supports If-None-Match/If-Modified-Since)"""
+        user = facade.get_user_details(user_id)
         if not user:
             api.abort(404, f"User with id {user_id} not found")
-        return user.to_dict(), 200
+        etag, last_modified = entity_version(user)
+        return conditional(etag, last_modified, lambda: user)
     
     @jwt_required()
     @api.response(200, 'User successfully updated')
@@ -102,8 +106,7 @@ class UserResource(Resource):
         try:
             # Get current authenticated user and claims
             current_user = get_jwt_identity()
-            claims = get_jwt()
-            is_admin = claims.get('is_admin', False)
+            is_admin = get_current_user()['is_admin']
             
             # Check authorization
             if not is_admin and user_id != current_user:
@@ -1,5 +1,6 @@
 """Base model with common attributes for all our models."""
 from app import db
+from app.persistence.unit_of_work import save_changes
 import uuid
 from datetime import datetime
 
@@ -13,9 +14,9 @@ class BaseModel(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def save(self):
-        """Update the updated_at timestamp."""
+        """Update the updated_at timestamp and save (committed with the current unit of work)."""
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        save_changes()
     
     def to_dict(self):
         """Convert object to dictionary (for JSON responses)."""
@@ -0,0 +1,109 @@
+"""Geohash cells and great-circle distances for proximity searches."""
+import math
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+# Precision stored on places (cells of roughly 5m x 5m)
+GEOHASH_PRECISION = 9
+
+# Cell width and height in degrees for each geohash precision
+CELL_DEGREES = {
+    precision: (360.0 / 2 ** ((5 * precision + 1) // 2), 180.0 / 2 ** (5 * precision // 2))
+    for precision in range(1, GEOHASH_PRECISION + 1)
+}
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Encode coordinates as a geohash string of the given precision."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def cell_min_extent_km(precision, latitude):
+    """Smallest side of a cell at this precision near the given latitude, in kilometres."""
+    width, height = CELL_DEGREES[precision]
+    # Use the poleward edge of the neighbourhood, where cells are narrowest
+    edge_latitude = min(90.0, abs(latitude) + height)
+    return min(width * KM_PER_DEGREE * math.cos(math.radians(edge_latitude)), height * KM_PER_DEGREE)
+
+
+def neighbourhood(latitude, longitude, precision):
+    """The cell containing the point plus its (up to) eight neighbours."""
+    width, height = CELL_DEGREES[precision]
+    cells = set()
+    for d_lat in (-height, 0.0, height):
+        lat = latitude + d_lat
+        if not -90.0 <= lat <= 90.0:
+            continue
+        for d_lng in (-width, 0.0, width):
+            lng = (longitude + d_lng + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(lat, lng, precision))
+    return cells
+
+
+def covering_cells(latitude, longitude, radius_km):
+    """Geohash prefixes whose union covers every point within radius_km.
+
+    Picks the finest precision whose cells are at least radius_km wide, so the
+    3x3 neighbourhood of the centre cell contains the whole circle. Returns
+    None when the radius is too large for cells to narrow the search.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        if cell_min_extent_km(precision, latitude) >= radius_km:
+            return neighbourhood(latitude, longitude, precision)
+    return None
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """Latitude range and longitude ranges enclosing every point within radius_km.
+
+    Returns ((min_lat, max_lat), lng_ranges). There are two longitude ranges
+    when the box crosses the antimeridian, and none (any longitude) when it
+    reaches a pole.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = max(-90.0, latitude - lat_delta), min(90.0, latitude + lat_delta)
+    # A degree of longitude is shortest at the poleward edge of the box
+    edge_latitude = max(abs(min_lat), abs(max_lat))
+    if edge_latitude >= 90.0:
+        return (min_lat, max_lat), []
+    lng_delta = lat_delta / math.cos(math.radians(edge_latitude))
+    if lng_delta >= 180.0:
+        return (min_lat, max_lat), []
+    west, east = longitude - lng_delta, longitude + lng_delta
+    if west < -180.0:
+        return (min_lat, max_lat), [(west + 360.0, 180.0), (-180.0, east)]
+    if east > 180.0:
+        return (min_lat, max_lat), [(west, 180.0), (-180.0, east - 360.0)]
+    return (min_lat, max_lat), [(west, east)]
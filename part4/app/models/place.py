@@ -1,18 +1,41 @@
 """Place model for our application with SQLAlchemy relationships."""
 from app.models.base import BaseModel
+from app.models.geo import encode_geohash, GEOHASH_PRECISION
 from app import db
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import validates
+from sqlalchemy.ext.hybrid import hybrid_property
 
 # Association table for many-to-many relationship between Place and Amenity
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True),
+    # The primary key covers lookups by place_id; this one serves amenity -> places
+    db.Index('idx_place_amenity_amenity_id', 'amenity_id')
 )
 
+# SQL of Place.rating_average (also used by the migration adding the column)
+RATING_AVERAGE_SQL = ("CASE WHEN review_count > 0 "
+                      "THEN CAST(rating_sum AS FLOAT) / review_count ELSE 0.0 END")
+
 class Place(BaseModel):
     """Represents a place that can be rented."""
     
     __tablename__ = 'places'
+    __table_args__ = (
+        # Supports keyset pagination ordered by (created_at, id)
+        db.Index('idx_places_created_at_id', 'created_at', 'id'),
+        # Supports price filters and keyset pagination ordered by (price, id)
+        db.Index('idx_places_price_id', 'price', 'id'),
+        # Supports the bounding-box prefilter of location searches
+        db.Index('idx_places_location', 'latitude', 'longitude'),
+        # Foreign key lookups (places of an owner, owner cache invalidation)
+        db.Index('idx_places_owner_id', 'owner_id'),
+        # Supports keyset pagination ordered by (rating_average, id)
+        db.Index('idx_places_rating_average_id', 'rating_average', 'id'),
+        # Full-text index rows are keyed by search_rowid
+        db.Index('idx_places_search_rowid', 'search_rowid', unique=True),
+    )
     
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=True)
@@ -20,9 +43,23 @@ class Place(BaseModel):
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     
+    # Geohash cell of (latitude, longitude), kept in sync by the coordinate validators
+    geohash = db.Column(db.String(GEOHASH_PRECISION), nullable=True, index=True)
+    
+    # Stable integer key of the place's full-text index row, assigned by the
+    # insert trigger below. SQLite's implicit rowid cannot serve: with a
+    # string primary key, VACUUM may renumber it.
+    search_rowid = db.Column(db.Integer, nullable=True, server_default=db.FetchedValue())
+    
     # Foreign key to User
     owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
     
+    # Denormalized review aggregates, maintained by the facade's review methods
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Average of the aggregates, computed by the database so it can be indexed
+    rating_average = db.Column(db.Float, db.Computed(RATING_AVERAGE_SQL, persisted=False))
+    
     # Relationships
     reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan')
     amenities = db.relationship('Amenity', secondary=place_amenity, lazy='subquery',
@@ -38,6 +75,20 @@ class Place(BaseModel):
         self.latitude = latitude
         self.longitude = longitude
         self.owner_id = owner_id
+        self.review_count = 0
+        self.rating_sum = 0
+    
+    @hybrid_property
+    def average_rating(self):
+        """Average review rating computed from the stored aggregates."""
+        if not self.review_count:
+            return 0.0
+        return self.rating_sum / self.review_count
+    
+    @average_rating.expression
+    def average_rating(cls):
+        """SQL expression for average_rating: the indexed rating_average column."""
+        return cls.rating_average.label('average_rating')
     
     @validates('price')
     def validate_price(self, key, price):
@@ -59,6 +110,7 @@ class Place(BaseModel):
             raise ValueError("Latitude must be a number")
         if not -90 <= latitude <= 90:
             raise ValueError("Latitude must be between -90 and 90")
+        self._update_geohash(latitude, self.longitude)
         return latitude
     
     @validates('longitude')
@@ -70,8 +122,14 @@ class Place(BaseModel):
             raise ValueError("Longitude must be a number")
         if not -180 <= longitude <= 180:
             raise ValueError("Longitude must be between -180 and 180")
+        self._update_geohash(self.latitude, longitude)
         return longitude
     
+    def _update_geohash(self, latitude, longitude):
+        """Recompute the geohash cell once both coordinates are known."""
+        if latitude is not None and longitude is not None:
+            self.geohash = encode_geohash(latitude, longitude)
+    
     @validates('title')
     def validate_title(self, key, title):
         """Validate title using SQLAlchemy validator."""
@@ -116,6 +174,40 @@ class Place(BaseModel):
             'price': self.price,
             'latitude': self.latitude,
             'longitude': self.longitude,
-            'owner_id': self.owner_id
+            'owner_id': self.owner_id,
+            'review_count': self.review_count,
+            'average_rating': self.average_rating
         })
-        return data
\ No newline at end of file
+        return data
+
+
+# SQLite FTS5 index over place titles and descriptions. It uses places as its
+# external content table, keyed by places.search_rowid, and is kept current by
+# triggers, so every write path, including bulk SQL, updates it.
+PLACE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+        title, description, content='places', content_rowid='search_rowid',
+        tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_insert AFTER INSERT ON places BEGIN
+        UPDATE places SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM places)
+        WHERE id = new.id AND search_rowid IS NULL;
+        INSERT INTO places_fts(rowid, title, description)
+        SELECT search_rowid, title, description FROM places WHERE id = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_delete AFTER DELETE ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.search_rowid, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_update AFTER UPDATE OF title, description ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.search_rowid, old.title, old.description);
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.search_rowid, new.title, new.description);
+    END""",
+]
+
+for statement in PLACE_SEARCH_DDL:
+    event.listen(Place.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(Place.__table__, 'before_drop',
+             DDL('DROP TABLE IF EXISTS places_fts').execute_if(dialect='sqlite'))
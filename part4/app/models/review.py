@@ -7,6 +7,12 @@ class Review(BaseModel):
     """Represents a review of a place."""
     
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # Foreign key lookup: reviews of a place
+        db.Index('idx_reviews_place_id', 'place_id'),
+        # One review per user and place; also serves lookups of a user's reviews
+        db.Index('unique_user_place_review', 'user_id', 'place_id', unique=True),
+    )
     
     text = db.Column(db.Text, nullable=False)
     rating = db.Column(db.Integer, nullable=False)
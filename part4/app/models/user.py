@@ -14,6 +14,8 @@ class User(BaseModel):
     email = db.Column(db.String(120), nullable=False, unique=True)
     password = db.Column(db.String(128), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
+    # Bumped to revoke every token issued so far (e.g. on password change)
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     
     # Relationships
     places = db.relationship('Place', backref='owner', lazy=True, cascade='all, delete-orphan')
@@ -26,6 +28,7 @@ class User(BaseModel):
         self.last_name = last_name
         self.email = email
         self.is_admin = False
+        self.token_version = 0
         
         # Hash the password if provided
         if password:
@@ -33,17 +36,25 @@ class User(BaseModel):
     
     def hash_password(self, password):
         """Hashes the password before storing it."""
-        # Import bcrypt here to avoid circular imports
-        from app import bcrypt
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        # Import the hasher here to avoid circular imports
+        from app import password_hasher
+        self.password = password_hasher.hash(password)
     
     def verify_password(self, password):
-        """Verifies if the provided password matches the hashed password."""
+        """Verifies if the provided password matches the hashed password.
+        
+        A matching hash made under an older policy (algorithm or cost) is
+        replaced by a current one; the change is saved with the session.
+        """
         if not self.password:
             return False
-        # Import bcrypt here to avoid circular imports
-        from app import bcrypt
-        return bcrypt.check_password_hash(self.password, password)
+        # Import the hasher here to avoid circular imports
+        from app import password_hasher
+        if not password_hasher.check(self.password, password):
+            return False
+        if password_hasher.needs_rehash(self.password):
+            self.password = password_hasher.hash(password)
+        return True
     
     @validates('email')
     def validate_email(self, key, email):
@@ -23,6 +23,16 @@ class AmenityRepository(SQLAlchemyRepository):
             self.model.name.ilike(f'%{pattern}%')
         ).all()
     
+    def get_existing_names(self, names):
+        """Get the lowercased names among the given ones that already exist, in one query."""
+        lowered = {name.lower() for name in names if name}
+        if not lowered:
+            return set()
+        rows = db.session.query(db.func.lower(self.model.name)).filter(
+            db.func.lower(self.model.name).in_(lowered)
+        )
+        return {name for name, in rows}
+    
     def count_amenities(self):
         """Count total number of amenities."""
         return self.model.query.count()
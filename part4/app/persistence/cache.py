@@ -0,0 +1,185 @@
+"""Read-through cache for serialized repository lookups."""
+import copy
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached values (JSON-serializable dictionaries and lists)."""
+
+    @abstractmethod
+    def get(self, key):
+        """Return the cached value, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """Store a value for `ttl` seconds."""
+        pass
+
+    @abstractmethod
+    def delete(self, *keys):
+        """Remove the given keys if present."""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Remove every cached value."""
+        pass
+
+    def stats(self):
+        """Backend-specific statistics."""
+        return {}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process cache with TTL expiry and LRU eviction."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Hand out a copy so callers cannot mutate the cached value
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache on any client speaking the redis-py API (get/set/delete/scan_iter).
+
+    Values are stored as JSON, so every worker process sees the same entries and
+    invalidations.
+    """
+
+    def __init__(self, client, prefix='hbnb:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, prefix='hbnb:'):
+        """Create a backend from a redis:// URL (requires the redis package)."""
+        import redis
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        # Milliseconds, rounded up: redis rejects an expiry of 0 (ttl < 1s)
+        self.client.set(self.prefix + key, json.dumps(value), px=max(1, math.ceil(ttl * 1000)))
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+class ReadThroughCache:
+    """Cache front-end used by the facade, configured from the Flask app.
+
+    Misses call the loader and store its result; None results are not cached.
+    """
+
+    def __init__(self, backend=None, default_ttl=300):
+        self.backend = backend or InMemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app, prefix='CACHE_'):
+        """Select the backend from <prefix>* configuration (CACHE_* by default) and reset counters."""
+        backend = app.config.get(f'{prefix}BACKEND', 'memory')
+        if backend == 'memory':
+            self.backend = InMemoryCacheBackend(app.config.get(f'{prefix}MAX_ENTRIES', 1024))
+        elif backend == 'redis':
+            self.backend = RedisCacheBackend.from_url(app.config[f'{prefix}REDIS_URL'])
+        elif isinstance(backend, CacheBackend):
+            self.backend = backend
+        else:
+            raise ValueError(f"Unknown cache backend: {backend}")
+        self.default_ttl = app.config.get(f'{prefix}DEFAULT_TTL', 300)
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, loader, ttl=None):
+        """Return the cached value for key, loading and caching it on a miss."""
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = loader()
+        if value is not None:
+            self.backend.set(key, value, ttl or self.default_ttl)
+        return value
+
+    def get(self, key):
+        """Return the cached value for key, or None."""
+        return self.backend.get(key)
+
+    def set(self, key, value, ttl=None):
+        """Store a value directly (for values that have no loader)."""
+        self.backend.set(key, value, ttl or self.default_ttl)
+
+    def invalidate(self, *keys):
+        """Drop the given keys."""
+        self.backend.delete(*keys)
+
+    def clear(self):
+        """Drop every cached value."""
+        self.backend.clear()
+
+    def stats(self):
+        """Hit/miss counters for this process plus backend statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            **self.backend.stats()
+        }
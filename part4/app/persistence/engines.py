@@ -0,0 +1,154 @@
+"""Database engine setup: SQLite connection pragmas and read/write routing to replicas."""
+import random
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from app.models.geo import haversine_km
+
+# Bind key prefix of the read-only engines (see SQLALCHEMY_READ_REPLICA_URIS)
+REPLICA_BIND_PREFIX = 'replica_'
+
+# Pragmas that change the database file rather than the connection; they are
+# only issued on the primary, whose connections may write.
+WRITER_ONLY_PRAGMAS = ('journal_mode', 'synchronous')
+
+# Raw SQL starting with one of these is a read and may go to a replica
+READ_STATEMENTS = ('SELECT', 'WITH')
+
+# Key in session.info set once the session has written: later reads go to the
+# primary so they see those writes. Sessions are scoped to a request.
+_STICKY_KEY = 'read_your_writes'
+_REPLICA_KEY = 'replica_bind'
+
+
+def set_sqlite_pragmas(engine, pragmas):
+    """Issue the given pragmas on every new DBAPI connection of a SQLite engine."""
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+        cursor.close()
+
+
+def register_sqlite_functions(engine):
+    """Make haversine_km(lat1, lng1, lat2, lng2) callable from SQL on a SQLite engine."""
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function('haversine_km', 4, haversine_km, deterministic=True)
+
+
+def _begin_sqlite_transaction(connection):
+    # pysqlite would only BEGIN before the first INSERT/UPDATE/DELETE: DDL and
+    # SAVEPOINTs before it ran outside any transaction, and a RELEASE
+    # committed for good. Its transaction handling is off; BEGIN here instead.
+    connection.connection.driver_connection.isolation_level = None
+    connection.exec_driver_sql('BEGIN')
+
+
+def enable_sqlite_transactions(engine):
+    """Make every SQLAlchemy transaction on a SQLite engine a real one.
+
+    SQLAlchemy's workaround for pysqlite: every transaction, including one
+    that only reads or runs DDL, starts with an explicit BEGIN, so nested
+    units of work (SAVEPOINTs) and migrations roll back as a whole.
+    """
+    if engine.dialect.name == 'sqlite' and not event.contains(
+            engine, 'begin', _begin_sqlite_transaction):
+        event.listen(engine, 'begin', _begin_sqlite_transaction)
+
+
+def add_replica_binds(app):
+    """Register SQLALCHEMY_READ_REPLICA_URIS as binds before the engines are created."""
+    replica_uris = app.config.get('SQLALCHEMY_READ_REPLICA_URIS') or []
+    if replica_uris:
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        for index, uri in enumerate(replica_uris):
+            binds[f'{REPLICA_BIND_PREFIX}{index}'] = uri
+        app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def replica_keys(engines):
+    """Bind keys of the configured read replicas."""
+    return [key for key in engines if key and key.startswith(REPLICA_BIND_PREFIX)]
+
+
+def configure_engines(app, db):
+    """Apply SQLITE_PRAGMAS to the primary engine and the read-only subset to replicas.
+
+    SQLite engines also get explicit BEGINs (see enable_sqlite_transactions)
+    and the SQL functions of register_sqlite_functions.
+    """
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    read_pragmas = {name: value for name, value in pragmas.items()
+                    if name not in WRITER_ONLY_PRAGMAS}
+    # Refuse writes even if a replica URI itself is not read-only
+    read_pragmas['query_only'] = 'ON'
+    with app.app_context():
+        engines = db.engines
+        set_sqlite_pragmas(engines[None], pragmas)
+        for key in replica_keys(engines):
+            set_sqlite_pragmas(engines[key], read_pragmas)
+        for engine in engines.values():
+            enable_sqlite_transactions(engine)
+            register_sqlite_functions(engine)
+
+
+def is_write(clause):
+    """Whether a statement may modify data (DML, DDL or non-SELECT raw SQL)."""
+    if clause is None:
+        return False
+    if isinstance(clause, UpdateBase):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith(READ_STATEMENTS)
+    return not getattr(clause, 'is_select', False)
+
+
+def stick_to_primary(session):
+    """Send the session's remaining queries to the primary engine."""
+    session.info[_STICKY_KEY] = True
+
+
+class RoutingSession(Session):
+    """Session that sends reads to a replica and writes to the primary.
+
+    Each session (one per request) picks one replica for all its reads, so a
+    request sees a single snapshot. Queries go to the primary instead while
+    flushing and once the session is sticky: after any write (read-your-writes)
+    or from the start of a unit of work (so check-then-write use cases read
+    the primary).
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            replica = self._replica_engine()
+            if replica is not None:
+                if is_write(clause):
+                    stick_to_primary(self)
+                elif not (self._flushing or self.info.get(_STICKY_KEY)):
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _replica_engine(self):
+        """The replica this session reads from, picked at random on first use."""
+        engines = self._db.engines
+        key = self.info.get(_REPLICA_KEY)
+        if key is None:
+            keys = replica_keys(engines)
+            if not keys:
+                return None
+            key = self.info[_REPLICA_KEY] = random.choice(keys)
+        return engines[key]
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _after_flush(session, flush_context):
+    stick_to_primary(session)
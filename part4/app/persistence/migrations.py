@@ -0,0 +1,253 @@
+"""Versioned schema migrations for the primary database.
+
+Each migration runs once, in its own transaction, and is recorded in the
+schema_migrations table. Migrations add tables, columns and indexes in
+place, so existing data is kept. Every step is also safe on a database
+created from the current models, which is why a fresh database simply
+runs them all.
+"""
+from datetime import datetime
+from sqlalchemy import bindparam, inspect, text
+from app import db
+from app.models.geo import encode_geohash
+from app.models.place import PLACE_SEARCH_DDL, RATING_AVERAGE_SQL
+from app.persistence.engines import enable_sqlite_transactions
+
+MIGRATIONS_TABLE = 'schema_migrations'
+
+
+def _columns(connection, table):
+    return {column['name'] for column in inspect(connection).get_columns(table)}
+
+
+def create_tables(connection):
+    """Create the tables (with their indexes) that do not exist yet."""
+    db.metadata.create_all(bind=connection)
+
+
+def add_place_rating_aggregates(connection):
+    """Add places.review_count/rating_sum and compute them from the reviews."""
+    existing = _columns(connection, 'places')
+    for name in ('review_count', 'rating_sum'):
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE places ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"))
+    connection.execute(text("""
+        UPDATE places SET
+            review_count = (SELECT count(*) FROM reviews WHERE reviews.place_id = places.id),
+            rating_sum = (SELECT coalesce(sum(rating), 0) FROM reviews WHERE reviews.place_id = places.id)
+    """))
+
+
+def add_place_geohash(connection):
+    """Add places.geohash and fill it in for existing places."""
+    if 'geohash' not in _columns(connection, 'places'):
+        connection.execute(text("ALTER TABLE places ADD COLUMN geohash VARCHAR(9)"))
+    rows = connection.execute(text(
+        "SELECT id, latitude, longitude FROM places WHERE geohash IS NULL")).all()
+    if rows:
+        connection.execute(text("UPDATE places SET geohash = :geohash WHERE id = :id"), [
+            {'id': place_id, 'geohash': encode_geohash(latitude, longitude)}
+            for place_id, latitude, longitude in rows
+        ])
+
+
+def create_indexes(connection, names):
+    """Create the named model indexes that the database lacks.
+
+    CREATE INDEX builds the index from the existing rows in place; the
+    tables are neither copied nor rewritten.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in names:
+                index.create(bind=connection, checkfirst=True)
+
+
+def add_model_indexes(connection):
+    """Create the keyset, location and foreign-key indexes declared on the models."""
+    create_indexes(connection, {
+        'idx_places_created_at_id', 'idx_places_price_id', 'idx_places_location',
+        'idx_places_owner_id', 'ix_places_geohash', 'idx_reviews_place_id',
+        'idx_place_amenity_amenity_id'
+    })
+
+
+def _add_place_search_rowid(connection):
+    """Add places.search_rowid, numbering existing places, and its unique index."""
+    if 'search_rowid' not in _columns(connection, 'places'):
+        connection.execute(text("ALTER TABLE places ADD COLUMN search_rowid INTEGER"))
+    connection.execute(text("""
+        UPDATE places SET search_rowid = rowid + (SELECT coalesce(max(search_rowid), 0) FROM places)
+        WHERE search_rowid IS NULL
+    """))
+    create_indexes(connection, {'idx_places_search_rowid'})
+
+
+def add_place_search_index(connection):
+    """Create the places full-text index and fill it from existing places."""
+    if connection.dialect.name != 'sqlite':
+        return
+    _add_place_search_rowid(connection)
+    for statement in PLACE_SEARCH_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO places_fts(places_fts) VALUES ('rebuild')"))
+
+
+def add_unique_user_place_review(connection):
+    """Enforce one review per user and place.
+
+    The API always rejected second reviews, so duplicates can only come from
+    concurrent requests; the earliest review of each pair is kept and the
+    aggregates of the affected places are recomputed. The unique index also
+    replaces idx_reviews_user_id, since it starts with user_id.
+    """
+    affected = [place_id for place_id, in connection.execute(text("""
+        SELECT DISTINCT place_id FROM reviews
+        GROUP BY user_id, place_id HAVING count(*) > 1
+    """))]
+    if affected:
+        connection.execute(text("""
+            DELETE FROM reviews WHERE id NOT IN (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY user_id, place_id ORDER BY created_at, id) AS position
+                    FROM reviews
+                ) WHERE position = 1
+            )
+        """))
+        connection.execute(text("""
+            UPDATE places SET
+                review_count = (SELECT count(*) FROM reviews WHERE reviews.place_id = places.id),
+                rating_sum = (SELECT coalesce(sum(rating), 0) FROM reviews WHERE reviews.place_id = places.id)
+            WHERE id IN :place_ids
+        """).bindparams(bindparam('place_ids', expanding=True)), {'place_ids': affected})
+    connection.execute(text("DROP INDEX IF EXISTS idx_reviews_user_id"))
+    create_indexes(connection, {'unique_user_place_review'})
+
+
+def add_user_token_version(connection):
+    """Add users.token_version (0 for existing users, so their tokens stay valid)."""
+    if 'token_version' not in _columns(connection, 'users'):
+        connection.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
+
+
+def add_place_rating_average(connection):
+    """Add the generated places.rating_average column and its keyset index.
+
+    A VIRTUAL column (the only kind ALTER TABLE can add) costs no storage;
+    the index stores its values, so sorting by rating is an index scan.
+    """
+    if 'rating_average' not in _columns(connection, 'places'):
+        connection.execute(text(
+            f"ALTER TABLE places ADD COLUMN rating_average FLOAT "
+            f"GENERATED ALWAYS AS ({RATING_AVERAGE_SQL}) VIRTUAL"))
+    create_indexes(connection, {'idx_places_rating_average_id'})
+
+
+def rekey_place_search_index(connection):
+    """Key the full-text index by places.search_rowid instead of the implicit rowid.
+
+    With a string primary key, VACUUM may renumber places.rowid, which left
+    the index pointing at the wrong places. The index is recreated and filled.
+    """
+    if connection.dialect.name != 'sqlite':
+        return
+    _add_place_search_rowid(connection)
+    for name in ('places_fts_insert', 'places_fts_delete', 'places_fts_update'):
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    connection.execute(text("DROP TABLE IF EXISTS places_fts"))
+    for statement in PLACE_SEARCH_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO places_fts(places_fts) VALUES ('rebuild')"))
+
+
+# (version, name, function) in the order they must be applied; never renumber
+MIGRATIONS = [
+    (1, 'create_tables', create_tables),
+    (2, 'place_rating_aggregates', add_place_rating_aggregates),
+    (3, 'place_geohash', add_place_geohash),
+    (4, 'model_indexes', add_model_indexes),
+    (5, 'place_search_index', add_place_search_index),
+    (6, 'unique_user_place_review', add_unique_user_place_review),
+    (7, 'user_token_version', add_user_token_version),
+    (8, 'place_rating_average', add_place_rating_average),
+    (9, 'rekey_place_search_index', rekey_place_search_index),
+]
+
+
+def _ensure_migrations_table(connection):
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} ("
+        "version INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, applied_at DATETIME NOT NULL)"
+    ))
+
+
+def applied_versions(engine):
+    """Versions already recorded in the database."""
+    if not inspect(engine).has_table(MIGRATIONS_TABLE):
+        return set()
+    with engine.connect() as connection:
+        return {version for version, in connection.execute(
+            text(f"SELECT version FROM {MIGRATIONS_TABLE}"))}
+
+
+def pending_migrations(engine):
+    """Migrations not applied yet, as (version, name) pairs."""
+    applied = applied_versions(engine)
+    return [(version, name) for version, name, _ in MIGRATIONS if version not in applied]
+
+
+def migrate(engine, log=None):
+    """Apply pending migrations in order, each in its own transaction.
+
+    Returns the (version, name) pairs that were applied.
+    """
+    # DDL must run inside each migration's transaction, which pysqlite
+    # does not do by itself
+    enable_sqlite_transactions(engine)
+    applied = []
+    done = applied_versions(engine)
+    for version, name, upgrade in MIGRATIONS:
+        if version in done:
+            continue
+        with engine.begin() as connection:
+            _ensure_migrations_table(connection)
+            upgrade(connection)
+            connection.execute(
+                text(f"INSERT INTO {MIGRATIONS_TABLE} (version, name, applied_at) "
+                     "VALUES (:version, :name, :applied_at)"),
+                {'version': version, 'name': name, 'applied_at': datetime.utcnow()}
+            )
+        applied.append((version, name))
+        if log:
+            log(f"Applied migration {version}: {name}")
+    return applied
+
+
+def missing_indexes(engine):
+    """Names of indexes declared on the models that the database lacks."""
+    inspector = inspect(engine)
+    missing = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            missing.extend(index.name for index in table.indexes)
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        missing.extend(index.name for index in table.indexes if index.name not in existing)
+    return sorted(missing)
+
+
+def check_schema(engine):
+    """Raise RuntimeError unless all migrations are applied and all indexes exist."""
+    problems = []
+    pending = pending_migrations(engine)
+    if pending:
+        problems.append("pending migrations: " + ", ".join(f"{v} {n}" for v, n in pending))
+    missing = missing_indexes(engine)
+    if missing:
+        problems.append("missing indexes: " + ", ".join(missing))
+    if problems:
+        raise RuntimeError(
+            "Database schema is out of date (" + "; ".join(problems) + "). "
+            "Run: python -m scripts.init_db"
+        )
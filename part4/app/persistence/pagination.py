@@ -0,0 +1,29 @@
+"""Opaque cursor helpers for keyset pagination."""
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(sort, sort_value, obj_id):
+    """Encode a keyset position (sort value, id) for the named sort as an opaque URL-safe token."""
+    if isinstance(sort_value, datetime):
+        sort_value = {'datetime': sort_value.isoformat()}
+    payload = json.dumps([sort, sort_value, obj_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort):
+    """Decode a token produced by encode_cursor back into (sort value, id).
+
+    Raises ValueError if the token is malformed or was issued for another sort.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, sort_value, obj_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if isinstance(sort_value, dict):
+            sort_value = datetime.fromisoformat(sort_value['datetime'])
+    except (TypeError, ValueError, KeyError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort:
+        raise ValueError("Cursor does not match the requested sort")
+    return sort_value, str(obj_id)
@@ -1,6 +1,39 @@
 """Place-specific repository for database operations."""
-from app.models.place import Place
+import html
+from sqlalchemy.orm import joinedload, selectinload, lazyload
+import math
+from app.models.place import Place, place_amenity, PLACE_SEARCH_DDL
+from app.models.geo import (
+    GEOHASH_PRECISION, bounding_box, covering_cells, neighbourhood,
+    cell_min_extent_km, haversine_km, encode_geohash
+)
+from app.models.review import Review
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.unit_of_work import save_changes
+from app import db
+
+def fts_query(text):
+    """Turn free text into a safe FTS5 query: every word must match, the last as a prefix."""
+    words = text.split()
+    if not words:
+        return None
+    phrases = ['"' + word.replace('"', '""') + '"' for word in words]
+    phrases[-1] += '*'
+    return ' '.join(phrases)
+
+# Match delimiters emitted by highlight()/snippet(); control characters that
+# cannot appear in escaped text, swapped for <mark> tags by highlight_html()
+MATCH_START, MATCH_END = '\x02', '\x03'
+
+def highlight_html(fragment):
+    """HTML-escape a highlighted fragment and wrap its matches in <mark> tags.
+    
+    Titles and descriptions are user input, so only the markers become markup.
+    """
+    if fragment is None:
+        return None
+    escaped = html.escape(fragment, quote=True)
+    return escaped.replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
 
 class PlaceRepository(SQLAlchemyRepository):
     """Repository for Place entity with specific place operations."""
@@ -8,10 +41,135 @@ class PlaceRepository(SQLAlchemyRepository):
     def __init__(self):
         super().__init__(Place)
 
+    def get_place_with_relations(self, place_id, include=('owner', 'amenities')):
+        """Get a place with the requested relationships eagerly loaded.
+        
+        The owner is joined into the place query and each included collection
+        is fetched with a single SELECT ... IN, so the number of statements is
+        bounded by the number of includes rather than by the data size.
+        """
+        options = []
+        if 'owner' in include:
+            options.append(joinedload(self.model.owner))
+        # Override the mapper's lazy='subquery' default unless amenities are wanted
+        if 'amenities' in include:
+            options.append(selectinload(self.model.amenities))
+        else:
+            options.append(lazyload(self.model.amenities))
+        if 'reviews' in include:
+            options.append(selectinload(self.model.reviews))
+        
+        return self.model.query.options(*options).filter_by(id=place_id).first()
+
+    def search_filters(self, min_price=None, max_price=None, q=None, near=None,
+                       radius_km=None, amenity_ids=None):
+        """Build SQL criteria for searching places, to combine with get_page.
+        
+        `near` is a (latitude, longitude) pair; places within `radius_km` of it
+        match (ValueError if the radius is too large, see _radius_filters).
+        `amenity_ids` matches places that have all of the given amenities.
+        """
+        filters = []
+        if min_price is not None:
+            filters.append(self.model.price >= min_price)
+        if max_price is not None:
+            filters.append(self.model.price <= max_price)
+        
+        if q and fts_query(q):
+            # Served by the places_fts full-text index instead of a LIKE scan
+            filters.append(db.text(
+                "places.search_rowid IN (SELECT rowid FROM places_fts WHERE places_fts MATCH :fts_query)"
+            ).bindparams(fts_query=fts_query(q)))
+        
+        if near is not None:
+            filters.extend(self._radius_filters(near[0], near[1], radius_km))
+        
+        if amenity_ids:
+            amenity_ids = set(amenity_ids)
+            with_all_amenities = db.select(place_amenity.c.place_id).where(
+                place_amenity.c.amenity_id.in_(amenity_ids)
+            ).group_by(place_amenity.c.place_id).having(
+                db.func.count(place_amenity.c.amenity_id) == len(amenity_ids)
+            )
+            filters.append(self.model.id.in_(with_all_amenities))
+        
+        return filters
+
+    def search_text(self, text, limit, after=None):
+        """Full-text search over titles and descriptions, best BM25 match first.
+        
+        Returns a page of rows carrying the place list columns plus `rank`,
+        `title_highlight` and `snippet` (raw text with matches between
+        MATCH_START and MATCH_END; see highlight_html), and the
+        (rank, id) keyset position to resume from, or None on the last page.
+        Title matches weigh ten times more than description matches.
+        """
+        match = fts_query(text)
+        if not match:
+            return [], None
+        
+        keyset = ''
+        params = {'match': match, 'limit': limit + 1,
+                  'match_start': MATCH_START, 'match_end': MATCH_END}
+        if after:
+            keyset = "AND (rank > :after_rank OR (rank = :after_rank AND places.id > :after_id))"
+            params['after_rank'], params['after_id'] = after
+        
+        rows = db.session.execute(db.text(f"""
+            SELECT * FROM (
+                SELECT places.id, places.title, places.latitude, places.longitude, places.price,
+                       places.review_count,
+                       CASE WHEN places.review_count > 0
+                            THEN CAST(places.rating_sum AS FLOAT) / places.review_count
+                            ELSE 0.0 END AS average_rating,
+                       bm25(places_fts, 10.0, 1.0) AS rank,
+                       highlight(places_fts, 0, :match_start, :match_end) AS title_highlight,
+                       snippet(places_fts, 1, :match_start, :match_end, '…', 16) AS snippet
+                FROM places_fts JOIN places ON places.search_rowid = places_fts.rowid
+                WHERE places_fts MATCH :match
+            ) AS places
+            WHERE 1 = 1 {keyset}
+            ORDER BY rank, places.id
+            LIMIT :limit
+        """), params).all()
+        
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (rows[-1].rank, rows[-1].id)
+    
+    def rebuild_search_index(self):
+        """Create the full-text index if missing and rebuild it from the places table.
+        
+        Needed for databases created before the index existed, or to repair
+        an index that no longer matches the places table.
+        """
+        for statement in PLACE_SEARCH_DDL:
+            db.session.execute(db.text(statement))
+        db.session.execute(db.text("INSERT INTO places_fts(places_fts) VALUES ('rebuild')"))
+        save_changes()
+    
+    def get_owner_id(self, place_id):
+        """Get the owner id of a place (None if the place does not exist), without loading it."""
+        return db.session.query(self.model.owner_id).filter_by(id=place_id).scalar()
+    
+    def get_owner_ids(self, place_ids):
+        """Map each existing place id among place_ids to its owner id, in one query."""
+        if not place_ids:
+            return {}
+        rows = db.session.query(self.model.id, self.model.owner_id).filter(
+            self.model.id.in_(set(place_ids))
+        )
+        return dict(rows.all())
+    
     def get_places_by_owner(self, owner_id):
         """Get all places owned by a specific user."""
         return self.model.query.filter_by(owner_id=owner_id).all()
     
+    def get_place_ids_by_owner(self, owner_id):
+        """Get the ids of the places owned by a user, without loading the places."""
+        return [place_id for place_id, in db.session.query(self.model.id).filter_by(owner_id=owner_id)]
+    
     def get_places_by_price_range(self, min_price=None, max_price=None):
         """Get places within a specific price range."""
         query = self.model.query
@@ -23,18 +181,155 @@ class PlaceRepository(SQLAlchemyRepository):
             
         return query.all()
     
-    def get_places_by_location(self, latitude, longitude, radius=1.0):
-        """Get places within a radius of given coordinates (simple implementation)."""
-        # Simple bounding box search (for production, use spatial databases)
-        lat_min = latitude - radius
-        lat_max = latitude + radius
-        lng_min = longitude - radius
-        lng_max = longitude + radius
+    def _cell_filter(self, cells):
+        """SQL criterion matching places inside any of the given geohash cells.
         
-        return self.model.query.filter(
-            self.model.latitude.between(lat_min, lat_max),
-            self.model.longitude.between(lng_min, lng_max)
-        ).all()
+        Prefixes are expressed as index range scans ('{' sorts after every
+        geohash character).
+        """
+        return db.or_(*[
+            db.and_(self.model.geohash >= cell, self.model.geohash < cell + '{')
+            for cell in cells
+        ])
+    
+    # Candidates read per result row: SQL orders by a flat-earth approximation,
+    # so a margin covers rows the haversine refinement moves across the cut
+    DISTANCE_CANDIDATE_FACTOR = 2
+    
+    def _approximate_distance(self, latitude, longitude):
+        """SQL expression ordering places like their distance from the point.
+        
+        Squared equirectangular distance in degrees of latitude, with the
+        longitude difference wrapped across the antimeridian.
+        """
+        lng_scale = max(math.cos(math.radians(latitude)), 1e-6)
+        d_lng = db.func.abs(self.model.longitude - longitude)
+        dx = db.case((d_lng > 180.0, 360.0 - d_lng), else_=d_lng) * lng_scale
+        dy = self.model.latitude - latitude
+        return dx * dx + dy * dy
+    
+    def _box_filter(self, latitude, longitude, radius_km):
+        """SQL criterion for the bounding box of the circle (uses idx_places_location)."""
+        (min_lat, max_lat), lng_ranges = bounding_box(latitude, longitude, radius_km)
+        criteria = [self.model.latitude.between(min_lat, max_lat)]
+        if lng_ranges:
+            criteria.append(db.or_(*[self.model.longitude.between(west, east)
+                                     for west, east in lng_ranges]))
+        return db.and_(*criteria)
+    
+    def _radius_filters(self, latitude, longitude, radius_km):
+        """SQL criteria for places within radius_km of the coordinates.
+        
+        The geohash cells covering the circle and its bounding box narrow the
+        search through the indexes; the haversine distance (a SQL function,
+        see register_sqlite_functions) then decides. Raises ValueError when
+        the radius is too large for cells to narrow the search.
+        """
+        cells = covering_cells(latitude, longitude, radius_km)
+        if not cells:
+            raise ValueError("radius_km is too large for a proximity search")
+        distance = db.func.haversine_km(latitude, longitude, self.model.latitude, self.model.longitude)
+        return [self._cell_filter(cells), self._box_filter(latitude, longitude, radius_km),
+                distance <= radius_km]
+    
+    def _nearest_candidates(self, query, latitude, longitude, limit):
+        """Run a candidate query nearest first in SQL, bounded by limit.
+        
+        Returns (place, distance_km) pairs ranked by haversine distance.
+        """
+        query = query.order_by(self._approximate_distance(latitude, longitude), self.model.id)
+        rows = query.limit(limit * self.DISTANCE_CANDIDATE_FACTOR).all()
+        ranked = [(row, haversine_km(latitude, longitude, row.latitude, row.longitude))
+                  for row in rows]
+        ranked.sort(key=lambda pair: pair[1])
+        return ranked
+    
+    def _location_columns(self, columns):
+        """Make sure a projection carries the coordinates needed for distances."""
+        if not columns:
+            return None
+        return list(columns) + [c for c in ('latitude', 'longitude') if c not in columns]
+    
+    def get_places_by_location(self, latitude, longitude, radius_km=10.0, limit=20, columns=None):
+        """Get up to limit (place, distance_km) pairs within radius_km of the coordinates, nearest first.
+        
+        Places are matched with _radius_filters (ValueError if the radius is
+        too large), ordered and limited in SQL by an approximate distance, and
+        only those candidates are ranked by the haversine distance.
+        """
+        query = self._select(self._location_columns(columns)).filter(
+            *self._radius_filters(latitude, longitude, radius_km))
+        return self._nearest_candidates(query, latitude, longitude, limit)[:limit]
+    
+    def _densest_precision(self, latitude, longitude, k):
+        """Finest precision whose neighbourhood holds at least k places.
+        
+        Binary search with counts capped at k, so each probe reads at most k
+        index entries however dense the area is.
+        """
+        low, high = 1, GEOHASH_PRECISION
+        while low < high:
+            precision = (low + high + 1) // 2
+            cells = neighbourhood(latitude, longitude, precision)
+            capped = db.session.query(self.model.id).filter(self._cell_filter(cells)).limit(k).subquery()
+            if db.session.query(db.func.count()).select_from(capped).scalar() >= k:
+                low = precision
+            else:
+                high = precision - 1
+        return low
+    
+    def get_nearest_places(self, latitude, longitude, k, columns=None):
+        """Get the k nearest (place, distance_km) pairs to the coordinates, nearest first.
+        
+        Searches the 3x3 cell neighbourhood at decreasing precision until the
+        k-th candidate is closer than the neighbourhood is guaranteed to reach.
+        Every probe reads a bounded, nearest-first candidate set; places
+        outside the coarsest neighbourhood (thousands of kilometres away)
+        are never considered, so fewer than k may be returned.
+        """
+        columns = self._location_columns(columns)
+        ranked = []
+        for precision in range(self._densest_precision(latitude, longitude, k), 0, -1):
+            cells = neighbourhood(latitude, longitude, precision)
+            query = self._select(columns).filter(self._cell_filter(cells))
+            ranked = self._nearest_candidates(query, latitude, longitude, k)
+            if len(ranked) >= k and ranked[k - 1][1] <= cell_min_extent_km(precision, latitude):
+                break
+        return ranked[:k]
+    
+    def backfill_geohashes(self):
+        """Compute the geohash of places stored before the column existed."""
+        places = self.model.query.filter(self.model.geohash.is_(None)).all()
+        for place in places:
+            place.geohash = encode_geohash(place.latitude, place.longitude)
+        save_changes()
+        return len(places)
+    
+    def adjust_rating_aggregates(self, place_id, count_delta, rating_delta):
+        """Apply a delta to a place's review aggregates without committing.
+        
+        The increment is done in SQL so concurrent writers cannot lose updates;
+        committing with the review change in the same unit of work makes it atomic.
+        """
+        self.model.query.filter_by(id=place_id).update({
+            self.model.review_count: self.model.review_count + count_delta,
+            self.model.rating_sum: self.model.rating_sum + rating_delta
+        }, synchronize_session='fetch')
+    
+    def recompute_rating_aggregates(self):
+        """Recompute review_count and rating_sum for every place in one statement."""
+        review_count = db.select(db.func.count(Review.id)).where(
+            Review.place_id == self.model.id
+        ).scalar_subquery()
+        rating_sum = db.select(db.func.coalesce(db.func.sum(Review.rating), 0)).where(
+            Review.place_id == self.model.id
+        ).scalar_subquery()
+        
+        result = db.session.execute(
+            db.update(self.model).values(review_count=review_count, rating_sum=rating_sum)
+        )
+        save_changes()
+        return result.rowcount
     
     def count_places(self):
         """Count total number of places."""
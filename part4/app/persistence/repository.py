@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from app import db
+from app.persistence.unit_of_work import unit_of_work, save_changes
 
 class Repository(ABC):
     @abstractmethod
@@ -11,7 +13,7 @@ class Repository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self):
+    def get_all(self, columns=None):
         pass
 
     @abstractmethod
@@ -37,8 +39,11 @@ class InMemoryRepository(Repository):
     def get(self, obj_id):
         return self._storage.get(obj_id)
 
-    def get_all(self):
-        return list(self._storage.values())
+    def get_all(self, columns=None):
+        if not columns:
+            return list(self._storage.values())
+        Row = namedtuple('Row', columns)
+        return [Row(*(getattr(obj, c) for c in columns)) for obj in self._storage.values()]
 
     def update(self, obj_id, data):
         obj = self.get(obj_id)
@@ -71,17 +76,104 @@ class SQLAlchemyRepository(Repository):
         self.model = model
 
     def add(self, obj):
-        """Add an object to the database"""
+        """Add an object to the database (committed with the current unit of work)"""
         db.session.add(obj)
-        db.session.commit()
+        save_changes()
+
+    def add_all(self, objs):
+        """Add several objects in one transaction and return their ids.
+
+        The ids are read after the flush, so the caller does not reload each
+        expired object after the commit. Inside an enclosing unit of work this
+        is a savepoint; either way it is rolled back as a whole on error.
+        """
+        with unit_of_work():
+            db.session.add_all(objs)
+            db.session.flush()
+            ids = [obj.id for obj in objs]
+        return ids
 
     def get(self, obj_id):
         """Get an object by ID"""
         return self.model.query.get(obj_id)
 
-    def get_all(self):
-        """Get all objects of this model type"""
-        return self.model.query.all()
+    def get_many(self, obj_ids):
+        """Get the objects with the given ids in one IN query, as a dict keyed by id"""
+        if not obj_ids:
+            return {}
+        objs = self.model.query.filter(self.model.id.in_(set(obj_ids))).all()
+        return {obj.id: obj for obj in objs}
+
+    def get_existing_ids(self, obj_ids):
+        """Get the subset of the given ids that exist, in one IN query"""
+        if not obj_ids:
+            return set()
+        rows = db.session.query(self.model.id).filter(self.model.id.in_(set(obj_ids)))
+        return {obj_id for obj_id, in rows}
+
+    def _select(self, columns=None):
+        """Build a query for full entities, or for named rows of the given columns.
+
+        Column projections skip ORM identity building and relationship loading.
+        """
+        if not columns:
+            return self.model.query
+        return db.session.query(*[getattr(self.model, c) for c in columns])
+
+    def get_all(self, columns=None):
+        """Get all objects of this model type, or named rows when columns are given"""
+        return self._select(columns).all()
+
+    def stream(self, columns, batch_size=1000):
+        """Yield named rows of the given columns for every object, ordered by id.
+
+        Rows are fetched batch_size at a time from a server-side cursor and
+        never enter the identity map, so memory stays flat however many
+        rows there are.
+        """
+        query = self._select(columns).order_by(self.model.id)
+        yield from query.execution_options(yield_per=batch_size)
+
+    def get_collection_version(self):
+        """Get (row count, latest updated_at) as a cheap version stamp for the collection"""
+        return db.session.query(
+            db.func.count(self.model.id), db.func.max(self.model.updated_at)
+        ).one()
+
+    def get_page(self, limit, after=None, columns=None, sort='created_at', descending=False,
+                 filters=()):
+        """Get one page of objects ordered by (sort, id) using keyset pagination.
+
+        `after` is the (sort value, id) of the last row of the previous page and
+        `filters` are extra SQL criteria. Returns the page and the keyset
+        position to resume from, or None when there are no more rows. With
+        `columns`, rows are named rows that always include the sort column and `id`.
+        """
+        if columns:
+            columns = list(columns) + [c for c in (sort, 'id') if c not in columns]
+        sort_column = getattr(self.model, sort)
+        
+        query = self._select(columns).filter(*filters)
+        if descending:
+            query = query.order_by(sort_column.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(sort_column, self.model.id)
+        
+        if after:
+            # A row-value comparison lets the (sort, id) index seek straight
+            # to the position; the equivalent OR form falls back to a scan
+            position = db.tuple_(sort_column, self.model.id)
+            if descending:
+                query = query.filter(position < tuple(after))
+            else:
+                query = query.filter(position > tuple(after))
+        
+        # Fetch one extra row to know whether another page exists
+        items = query.limit(limit + 1).all()
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, (getattr(items[-1], sort), items[-1].id)
 
     def update(self, obj_id, data):
         """Update an object with new data"""
@@ -89,7 +181,7 @@ class SQLAlchemyRepository(Repository):
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            save_changes()
         return obj
 
     def delete(self, obj_id):
@@ -97,7 +189,7 @@ class SQLAlchemyRepository(Repository):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            save_changes()
 
     def get_by_attribute(self, attr_name, attr_value):
         """Get object by attribute with case-insensitive string comparison for strings"""
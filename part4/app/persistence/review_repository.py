@@ -41,6 +41,15 @@ class ReviewRepository(SQLAlchemyRepository):
         """Count total reviews for a specific place."""
         return self.model.query.filter_by(place_id=place_id).count()
     
+    def get_reviewed_place_ids(self, user_id, place_ids):
+        """Get the places among place_ids that the user has already reviewed, in one query."""
+        if not place_ids:
+            return set()
+        rows = db.session.query(self.model.place_id).filter(
+            self.model.user_id == user_id, self.model.place_id.in_(set(place_ids))
+        )
+        return {place_id for place_id, in rows}
+    
     def user_has_reviewed_place(self, user_id, place_id):
         """Check if a user has already reviewed a specific place."""
         return self.model.query.filter_by(user_id=user_id, place_id=place_id).first() is not None
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Unit-of-work transactions: one commit per use case instead of one per repository call."""
+from contextlib import contextmanager
+from functools import wraps
+from app import db
+from app.persistence.engines import stick_to_primary
+
+# Key in db.session.info holding the stack of open units of work. Each entry
+# is the list of callbacks to run once the outermost unit of work commits.
+_STACK_KEY = 'unit_of_work_stack'
+
+
+def in_unit_of_work():
+    """Check whether the current session is inside a unit of work."""
+    return bool(db.session.info.get(_STACK_KEY))
+
+
+@contextmanager
+def unit_of_work():
+    """Run a block as one transaction, committed once when the block ends.
+
+    Any exception (including the ValueErrors raised by validation) rolls the
+    whole block back and propagates. Nested units of work run in a SAVEPOINT,
+    so a failing inner block only undoes its own changes.
+    """
+    stack = db.session.info.setdefault(_STACK_KEY, [])
+    nested = bool(stack)
+    # Reads of a write use case must see the primary, as must the rest of the request
+    stick_to_primary(db.session)
+    savepoint = db.session.begin_nested() if nested else None
+    stack.append([])
+    try:
+        yield
+        if nested:
+            savepoint.commit()
+        else:
+            db.session.commit()
+    except BaseException:
+        stack.pop()
+        if nested:
+            savepoint.rollback()
+        else:
+            db.session.rollback()
+        raise
+
+    callbacks = stack.pop()
+    if nested:
+        # Deferred until the enclosing transaction commits
+        stack[-1].extend(callbacks)
+    else:
+        for callback in callbacks:
+            callback()
+
+
+def transactional(method):
+    """Decorator running a facade use case in its own unit of work."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def after_commit(callback):
+    """Run callback once the current unit of work commits (now if there is none).
+
+    Callbacks are dropped if the transaction rolls back. Used for cache
+    invalidation, so readers cannot re-cache data that is not yet committed.
+    """
+    stack = db.session.info.get(_STACK_KEY)
+    if stack:
+        stack[-1].append(callback)
+    else:
+        callback()
+
+
+def save_changes():
+    """Commit now, or just flush when an enclosing unit of work will commit.
+
+    Flushing still sends the SQL, so ids are assigned and constraint errors
+    surface at the call site.
+    """
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
@@ -14,6 +14,11 @@ class UserRepository(SQLAlchemyRepository):
             return None
         return self.model.query.filter_by(email=email).first()
     
+    def get_principal(self, user_id):
+        """Get a user's authorization state (id, is_admin, token_version) as a dict, or None."""
+        row = self._select(['id', 'is_admin', 'token_version']).filter_by(id=user_id).first()
+        return row._asdict() if row else None
+    
     def get_all_admins(self):
         """Get all users with admin privileges."""
         return self.model.query.filter_by(is_admin=True).all()
@@ -0,0 +1,195 @@
+"""Password hashing on a bounded pool of worker processes.
+
+bcrypt and argon2id are deliberately slow (~100-300ms of CPU at production
+cost), so hashing in the request thread lets a burst of logins occupy every
+API worker. The hasher runs them in separate processes instead and admits at most
+workers + queue size calls at a time; callers beyond that fail fast with
+PasswordHasherBusy (a 503) rather than queueing without bound.
+"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from app.security.password_policy import PasswordPolicy
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated or does not answer in time."""
+    pass
+
+
+def _hash(policy, password):
+    """Hash a password under policy (runs in a worker process)."""
+    return policy.hash(password)
+
+
+def _check(policy, hashed, password):
+    """Check a password against a stored hash (runs in a worker process)."""
+    return policy.verify(hashed, password)
+
+
+class PasswordHasher:
+    """Password hashing front-end used by the User model, configured from the Flask app.
+
+    With PASSWORD_HASH_WORKERS = 0 hashing runs inline in the calling thread
+    (the admission limit still applies), which keeps tests and scripts cheap.
+    """
+
+    def __init__(self, policy=None, workers=0, queue_size=0, timeout=10.0):
+        self.policy = policy or PasswordPolicy()
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._dummy_hash = None
+        self._reset_counters()
+
+    def init_app(self, app):
+        """Read the password policy and PASSWORD_HASH_* settings and reset counters."""
+        self.shutdown()
+        self.policy = PasswordPolicy.from_config(app.config)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', 0)
+        self.queue_size = app.config.get('PASSWORD_HASH_QUEUE_SIZE', 0)
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', 10.0)
+        self._dummy_hash = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.pool_restarts = 0
+        self.busy_seconds = 0.0
+        # Moving average of check() latency, including time queued for the pool
+        self.check_seconds = 0.0
+
+    @property
+    def capacity(self):
+        """Calls admitted at once: one running per worker plus the queue."""
+        return max(self.workers, 1) + self.queue_size
+
+    def hash(self, password):
+        """Return the hash of password under the configured policy."""
+        return self._run(_hash, self.policy, password)
+
+    def check(self, hashed, password):
+        """Check password against a stored hash (any supported algorithm or cost)."""
+        start = time.perf_counter()
+        matches = self._run(_check, self.policy, hashed, password)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.check_seconds = (0.8 * self.check_seconds + 0.2 * elapsed
+                                  if self.check_seconds else elapsed)
+        return matches
+
+    def wait_out_check(self, started):
+        """Sleep until a typical check() begun at `started` would have returned.
+
+        Used when there is no hash to check (unknown email), so the caller
+        takes as long as a real check without spending its CPU. Until a
+        check has been timed, a real check against a dummy hash is run.
+        """
+        if not self.check_seconds:
+            if self._dummy_hash is None:
+                self._dummy_hash = self.hash('dummy-password')
+            self.check(self._dummy_hash, 'not-the-password')
+            return
+        remaining = self.check_seconds - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def needs_rehash(self, hashed):
+        """Whether a stored hash predates the configured policy (checked inline)."""
+        return self.policy.needs_rehash(hashed)
+
+    def _run(self, function, *args):
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise PasswordHasherBusy("Password hashing is saturated, retry later")
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        start = time.perf_counter()
+        if not self.workers:
+            try:
+                return function(*args)
+            finally:
+                self._release(start)
+
+        executor = self._pool()
+        try:
+            future = executor.submit(function, *args)
+            result = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            # A job already running keeps its slot until the worker finishes
+            # it, so admission still reflects the real queue depth
+            future.add_done_callback(lambda _: self._release(start))
+            with self._lock:
+                self.timeouts += 1
+            raise PasswordHasherBusy("Password hashing timed out, retry later")
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); the next call starts a new pool
+            self._release(start)
+            self._discard_pool(executor)
+            raise PasswordHasherBusy("Password hashing workers restarted, retry later")
+        except BaseException:
+            self._release(start)
+            raise
+        self._release(start)
+        return result
+
+    def _release(self, start):
+        """Free the admission slot of a call begun at start."""
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            self.busy_seconds += time.perf_counter() - start
+
+    def _pool(self):
+        """The worker pool, started on first use."""
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process can copy held locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def _discard_pool(self, executor):
+        """Forget a broken pool (unless another call already replaced it)."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.pool_restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stop the worker processes (they are restarted on the next call)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """Queue depth and throughput counters for this API process."""
+        with self._lock:
+            running = min(self.pending, max(self.workers, 1))
+            return {
+                'policy': self.policy.describe(),
+                'workers': self.workers,
+                'capacity': self.capacity,
+                'running': running,
+                'queue_depth': self.pending - running,
+                'peak_pending': self.peak_pending,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'timeouts': self.timeouts,
+                'pool_restarts': self.pool_restarts,
+                'avg_ms': self.busy_seconds * 1000 / self.completed if self.completed else 0.0
+            }
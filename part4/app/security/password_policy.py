@@ -0,0 +1,105 @@
+"""Password hashing policy: which algorithm and cost new hashes use.
+
+Stored hashes identify their own algorithm and cost, so a hash made under
+an older policy still verifies; needs_rehash() tells the caller to replace
+it with a hash under the current policy the next time the plain password
+is known (a successful login).
+
+Supported algorithms are 'bcrypt' and 'argon2id' (requires argon2-cffi).
+"""
+import hmac
+
+import bcrypt
+
+ALGORITHMS = ('bcrypt', 'argon2id')
+
+# Prefixes of the hashes each algorithm produces
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+ARGON2ID_PREFIX = '$argon2id$'
+
+
+def _argon2_hasher(time_cost, memory_cost, parallelism):
+    try:
+        from argon2 import PasswordHasher as Argon2Hasher
+    except ImportError:
+        raise RuntimeError("argon2id password hashing requires the argon2-cffi package")
+    return Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def algorithm_of(hashed):
+    """Name of the algorithm that produced a stored hash, or None if unknown."""
+    if hashed.startswith(BCRYPT_PREFIXES):
+        return 'bcrypt'
+    if hashed.startswith(ARGON2ID_PREFIX):
+        return 'argon2id'
+    return None
+
+
+class PasswordPolicy:
+    """Algorithm and cost parameters for new password hashes.
+
+    Instances are small and picklable, so they are sent along with each
+    hashing call to the worker processes of the PasswordHasher.
+    """
+
+    def __init__(self, algorithm='bcrypt', rounds=12, time_cost=3, memory_cost=65536, parallelism=4):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown password hash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        # bcrypt: 2^rounds iterations
+        self.rounds = rounds
+        # argon2id: passes, memory in KiB and lanes
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+
+    @classmethod
+    def from_config(cls, config):
+        """Build the policy from PASSWORD_HASH_ALGORITHM, BCRYPT_LOG_ROUNDS and ARGON2_* settings."""
+        return cls(
+            algorithm=config.get('PASSWORD_HASH_ALGORITHM', 'bcrypt'),
+            rounds=config.get('BCRYPT_LOG_ROUNDS', 12),
+            time_cost=config.get('ARGON2_TIME_COST', 3),
+            memory_cost=config.get('ARGON2_MEMORY_COST', 65536),
+            parallelism=config.get('ARGON2_PARALLELISM', 4)
+        )
+
+    def describe(self):
+        """Short description of the policy, e.g. 'bcrypt rounds=12'."""
+        if self.algorithm == 'bcrypt':
+            return f"bcrypt rounds={self.rounds}"
+        return (f"argon2id time_cost={self.time_cost} memory_cost={self.memory_cost} "
+                f"parallelism={self.parallelism}")
+
+    def hash(self, password):
+        """Hash a password with a fresh salt under this policy."""
+        if self.algorithm == 'bcrypt':
+            return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+        return _argon2_hasher(self.time_cost, self.memory_cost, self.parallelism).hash(password)
+
+    def verify(self, hashed, password):
+        """Check a password against a stored hash of any supported algorithm."""
+        algorithm = algorithm_of(hashed)
+        if algorithm == 'bcrypt':
+            hashed = hashed.encode('utf-8')
+            return hmac.compare_digest(bcrypt.hashpw(password.encode('utf-8'), hashed), hashed)
+        if algorithm == 'argon2id':
+            from argon2.exceptions import VerificationError
+            try:
+                return _argon2_hasher(self.time_cost, self.memory_cost, self.parallelism).verify(
+                    hashed, password)
+            except VerificationError:
+                return False
+        return False
+
+    def needs_rehash(self, hashed):
+        """Whether a stored hash uses another algorithm or cost than this policy.
+
+        Only parses the hash, so it is cheap enough to run in the request thread.
+        """
+        if algorithm_of(hashed) != self.algorithm:
+            return True
+        if self.algorithm == 'bcrypt':
+            # $2b$12$<salt and digest>
+            return int(hashed.split('$')[2]) != self.rounds
+        return _argon2_hasher(self.time_cost, self.memory_cost, self.parallelism).check_needs_rehash(hashed)
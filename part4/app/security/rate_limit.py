@@ -0,0 +1,158 @@
+"""Sliding-window limits on failed logins, per client IP and per email.
+
+Failures are recorded after a rejected password; while an IP or an email
+has reached its limit within the window, further attempts are refused
+before any database lookup or password check, so credential-stuffing
+bursts cost almost nothing.
+"""
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+
+
+class RateLimitBackend(ABC):
+    """Storage of event timestamps per key, pruned to a sliding window."""
+
+    @abstractmethod
+    def add(self, key, now, window):
+        """Record an event for key at time now (seconds)."""
+        pass
+
+    @abstractmethod
+    def events(self, key, now, window):
+        """Timestamps of the key's events within (now - window, now], oldest first."""
+        pass
+
+    @abstractmethod
+    def reset(self, key):
+        """Forget every event of key."""
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process event log; the least recently used keys are dropped beyond max_keys."""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._events = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key, now, window):
+        with self._lock:
+            events = self._events.setdefault(key, deque())
+            events.append(now)
+            self._prune(events, now, window)
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+
+    def events(self, key, now, window):
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                return []
+            self._prune(events, now, window)
+            if not events:
+                del self._events[key]
+                return []
+            return list(events)
+
+    def reset(self, key):
+        with self._lock:
+            self._events.pop(key, None)
+
+    @staticmethod
+    def _prune(events, now, window):
+        while events and events[0] <= now - window:
+            events.popleft()
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Shared event log on any client speaking the redis-py API (sorted sets).
+
+    Every worker process sees the same failures, so limits hold across the
+    whole deployment.
+    """
+
+    def __init__(self, client, prefix='hbnb:login:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, prefix='hbnb:login:'):
+        """Create a backend from a redis:// URL (requires the redis package)."""
+        import redis
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def add(self, key, now, window):
+        pipeline = self.client.pipeline()
+        pipeline.zadd(self.prefix + key, {f'{now}:{uuid.uuid4().hex}': now})
+        pipeline.zremrangebyscore(self.prefix + key, '-inf', now - window)
+        pipeline.expire(self.prefix + key, int(window) + 1)
+        pipeline.execute()
+
+    def events(self, key, now, window):
+        members = self.client.zrangebyscore(
+            self.prefix + key, f'({now - window}', now, withscores=True)
+        return [score for _, score in members]
+
+    def reset(self, key):
+        self.client.delete(self.prefix + key)
+
+
+class LoginRateLimiter:
+    """Failed-login limits used by the auth endpoint, configured from the Flask app."""
+
+    def __init__(self, backend=None, max_per_ip=20, max_per_email=5, window=300):
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.max_per_ip = max_per_ip
+        self.max_per_email = max_per_email
+        self.window = window
+        self.rejected = 0
+
+    def init_app(self, app):
+        """Select the backend and limits from LOGIN_RATE_LIMIT_* configuration."""
+        backend = app.config.get('LOGIN_RATE_LIMIT_BACKEND', 'memory')
+        if backend == 'memory':
+            self.backend = InMemoryRateLimitBackend()
+        elif backend == 'redis':
+            self.backend = RedisRateLimitBackend.from_url(app.config['LOGIN_RATE_LIMIT_REDIS_URL'])
+        elif isinstance(backend, RateLimitBackend):
+            self.backend = backend
+        else:
+            raise ValueError(f"Unknown rate limit backend: {backend}")
+        self.max_per_ip = app.config.get('LOGIN_MAX_FAILURES_PER_IP', 20)
+        self.max_per_email = app.config.get('LOGIN_MAX_FAILURES_PER_EMAIL', 5)
+        self.window = app.config.get('LOGIN_FAILURE_WINDOW', 300)
+        self.rejected = 0
+
+    def _keys(self, ip, email):
+        """Backend keys of an attempt's IP and email."""
+        return f'ip:{ip}', f'email:{email.strip().lower()}'
+
+    def retry_after(self, ip, email):
+        """Seconds until an attempt is allowed again, or 0 if it is allowed now."""
+        now = time.time()
+        wait = 0
+        for key, limit in zip(self._keys(ip, email), (self.max_per_ip, self.max_per_email)):
+            events = self.backend.events(key, now, self.window)
+            if len(events) >= limit:
+                # Allowed again once enough of the oldest failures leave the window
+                wait = max(wait, events[len(events) - limit] + self.window - now)
+        if wait:
+            self.rejected += 1
+            return max(int(wait + 0.999), 1)
+        return 0
+
+    def record_failure(self, ip, email):
+        """Count a failed attempt against both the IP and the email."""
+        now = time.time()
+        for key in self._keys(ip, email):
+            self.backend.add(key, now, self.window)
+
+    def record_success(self, ip, email):
+        """Clear the email's failures (the IP keeps its count)."""
+        ip_key, email_key = self._keys(ip, email)
+        self.backend.reset(email_key)
@@ -0,0 +1,141 @@
+"""JWT verification cache and revocation store.
+
+Every protected request decodes its bearer token twice (unverified, then
+with the HMAC check) before any view code runs. Clients resend the same
+token until it expires, so verified claims are kept in an LRU keyed by a
+hash of the token and reused until the token's own expiry. Revocation is
+checked separately on every request: the denylist (logout) and the user's
+token_version (see the principal cache) are both O(1) lookups.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask_jwt_extended import JWTManager
+from flask_jwt_extended.config import config
+
+from app.persistence.cache import RedisCacheBackend
+
+
+class VerifiedTokenCache:
+    """LRU of verified token claims, each valid until the token's exp."""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(encoded_token):
+        """Cache key for a token under the current signing key.
+
+        The key is part of the hash, so a rotated secret cannot reuse
+        claims verified under the old one.
+        """
+        return hashlib.sha256(f'{config.decode_key}\0{encoded_token}'.encode('utf-8')).digest()
+
+    def get(self, key):
+        """Return a copy of the cached claims, or None (also once the token expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, key, claims):
+        if not self.max_entries or 'exp' not in claims:
+            return
+        with self._lock:
+            self._entries[key] = (claims['exp'], dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'misses': self.misses}
+
+
+class CachingJWTManager(JWTManager):
+    """JWTManager that skips re-verifying tokens it has already verified."""
+
+    def __init__(self, app=None, add_context_processor=False):
+        self.verified_tokens = VerifiedTokenCache()
+        super().__init__(app, add_context_processor)
+
+    def init_app(self, app, add_context_processor=False):
+        """Size the cache from JWT_VERIFIED_TOKEN_CACHE_SIZE (0 disables it)."""
+        super().init_app(app, add_context_processor)
+        self.verified_tokens = VerifiedTokenCache(app.config.get('JWT_VERIFIED_TOKEN_CACHE_SIZE', 4096))
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF and expired-token decodes are rare and keep the full checks
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        key = self.verified_tokens.key(encoded_token)
+        claims = self.verified_tokens.get(key)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token)
+            self.verified_tokens.set(key, claims)
+        return claims
+
+
+class TokenDenylist:
+    """jti of revoked (logged out) tokens, kept until the token would have expired.
+
+    'memory' only covers this process; 'redis' shares revocations between
+    all workers.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self._revoked = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Select the store from TOKEN_DENYLIST_BACKEND and forget revocations."""
+        backend = app.config.get('TOKEN_DENYLIST_BACKEND', 'memory')
+        if backend == 'memory':
+            self.backend = None
+        elif backend == 'redis':
+            self.backend = RedisCacheBackend.from_url(
+                app.config['TOKEN_DENYLIST_REDIS_URL'], prefix='hbnb:revoked:')
+        else:
+            raise ValueError(f"Unknown token denylist backend: {backend}")
+        with self._lock:
+            self._revoked.clear()
+
+    def revoke(self, jti, expires_at):
+        """Deny the token with this jti until expires_at (epoch seconds)."""
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return
+        if self.backend is not None:
+            self.backend.set(jti, True, ttl)
+            return
+        now = time.time()
+        with self._lock:
+            self._revoked[jti] = expires_at
+            # Expired entries cannot match a valid token any more
+            if len(self._revoked) % 1024 == 0:
+                self._revoked = {k: v for k, v in self._revoked.items() if v > now}
+
+    def is_revoked(self, jti):
+        if self.backend is not None:
+            return self.backend.get(jti) is not None
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
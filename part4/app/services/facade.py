@@ -1,23 +1,96 @@
 from app.persistence.user_repository import UserRepository
-from app.persistence.place_repository import PlaceRepository
+from app.persistence.place_repository import PlaceRepository, highlight_html
 from app.persistence.review_repository import ReviewRepository
 from app.persistence.amenity_repository import AmenityRepository
+from app.persistence.pagination import encode_cursor, decode_cursor
+from app.persistence.unit_of_work import transactional, unit_of_work, after_commit
+from app import cache, password_hasher, principals, unknown_emails
 
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
 
+import time
+from datetime import datetime
+from functools import cached_property
+from itertools import combinations
+from sqlalchemy.exc import IntegrityError
+
+
+def _serialize_row(row):
+    """Convert a projected row into a JSON-safe dictionary (for caching)."""
+    return {key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row._asdict().items()}
+
+
+def _bulk_error(index, status, message):
+    """Per-row failure entry of a bulk create result."""
+    return {'index': index, 'status': status, 'error': message}
+
 
 class HBnBFacade:
-    def __init__(self):
-        # Using SQLAlchemy repositories for all entities
-        self.user_repo = UserRepository()
-        self.place_repo = PlaceRepository()
-        self.review_repo = ReviewRepository()
-        self.amenity_repo = AmenityRepository()
+    # Columns loaded for list endpoints (projections avoid full entity hydration)
+    USER_LIST_COLUMNS = ['id', 'first_name', 'last_name', 'email', 'is_admin', 'created_at', 'updated_at']
+    AMENITY_LIST_COLUMNS = ['id', 'name', 'created_at', 'updated_at']
+    PLACE_LIST_COLUMNS = ['id', 'title', 'latitude', 'longitude', 'price', 'review_count', 'average_rating']
+
+    # Place list orderings: sort name -> (column, descending)
+    PLACE_SORTS = {
+        'created_at': ('created_at', False),
+        'price': ('price', False),
+        '-price': ('price', True),
+        'rating': ('average_rating', True)
+    }
+
+    # Relationships that get_place can expand
+    PLACE_INCLUDES = ('owner', 'amenities', 'reviews')
+
+    # Amenities change almost never, so they can stay cached longer
+    AMENITY_CACHE_TTL = 3600
+
+    # Rows inserted per transaction by the bulk create methods
+    BULK_BATCH_SIZE = 500
+
+    # Columns of each exportable collection (never the password hash)
+    EXPORT_COLUMNS = {
+        'users': USER_LIST_COLUMNS,
+        'amenities': AMENITY_LIST_COLUMNS,
+        'places': ['id', 'title', 'description', 'price', 'latitude', 'longitude', 'owner_id',
+                   'review_count', 'average_rating', 'created_at', 'updated_at'],
+        'reviews': ['id', 'text', 'rating', 'user_id', 'place_id', 'created_at', 'updated_at']
+    }
+
+    # Rows fetched per round trip while streaming an export
+    EXPORT_BATCH_SIZE = 1000
+
+    # Account created by python -m scripts.init_db
+    DEFAULT_ADMIN = {
+        'first_name': 'Admin',
+        'last_name': 'User',
+        'email': 'admin@hbnb.com',
+        'password': 'admin123'
+    }
+
+    # SQLAlchemy repositories for all entities, created on first use
+    @cached_property
+    def user_repo(self):
+        return UserRepository()
+
+    @cached_property
+    def place_repo(self):
+        return PlaceRepository()
+
+    @cached_property
+    def review_repo(self):
+        return ReviewRepository()
+
+    @cached_property
+    def amenity_repo(self):
+        return AmenityRepository()
 
     # --- User methods ---
+    @transactional
     def create_user(self, user_data):
         """Create a new user"""
         # Check if email already exists using the UserRepository method
@@ -38,22 +111,77 @@ class HBnBFacade:
         if errors:
             raise ValueError(", ".join(errors))
         
-        # Save to repository (will commit to database)
+        # Save to repository (committed when the use case returns)
         self.user_repo.add(user)
+        self._forget_unknown_email(user.email)
         return user
 
+    @transactional
+    def ensure_admin_user(self, user_data=None):
+        """Create the admin account, or restore its admin flag; return (user, created)"""
+        user_data = user_data or self.DEFAULT_ADMIN
+        user = self.user_repo.get_user_by_email(user_data['email'])
+        created = user is None
+        if created:
+            user = self.create_user(user_data)
+        if not user.is_admin:
+            user.is_admin = True
+            self._invalidate_user(user.id)
+        return user, created
+
     def get_user(self, user_id):
         """Get user by ID"""
         return self.user_repo.get(user_id)
 
+    def get_user_details(self, user_id):
+        """Get user details as a dictionary (read-through cached)"""
+        def load():
+            user = self.user_repo.get(user_id)
+            return user.to_dict() if user else None
+        return cache.get_or_load(f'user:{user_id}', load)
+
     def get_user_by_email(self, email):
         """Get user by email"""
         return self.user_repo.get_user_by_email(email)
+
+    def get_user_principal(self, user_id):
+        """Get a user's authorization state (is_admin, token_version), cached for a few seconds"""
+        return principals.get_or_load(user_id, lambda: self.user_repo.get_principal(user_id))
+
+    @transactional
+    def authenticate_user(self, email, password):
+        """Return the user with these credentials, or None
+        
+        Committed, so a password rehashed under the current policy is saved.
+        Unknown emails take as long as a password check, so the response
+        time does not reveal which emails have an account.
+        """
+        started = time.perf_counter()
+        # Emails recently found to have no account skip the database
+        # (UNKNOWN_EMAIL_CACHE_*; a TTL of 0 turns this off)
+        key = self._unknown_email_key(email)
+        user = None
+        if not unknown_emails.get(key):
+            user = self.user_repo.get_user_by_email(email)
+            if not user and unknown_emails.default_ttl:
+                unknown_emails.set(key, True)
+        if not user:
+            password_hasher.wait_out_check(started)
+            return None
+        if not user.verify_password(password):
+            return None
+        return user
     
     def get_all_users(self):
-        """Get all users"""
-        return self.user_repo.get_all()
+        """Get all users as dictionaries (column projection, no password)"""
+        rows = self.user_repo.get_all(columns=self.USER_LIST_COLUMNS)
+        return [row._asdict() for row in rows]
+    
+    def get_users_version(self):
+        """Get (count, latest updated_at) of the users collection"""
+        return self.user_repo.get_collection_version()
     
+    @transactional
     def update_user(self, user_id, user_data):
         """Update user information"""
         user = self.get_user(user_id)
@@ -74,8 +202,11 @@ class HBnBFacade:
             user.last_name = user_data['last_name']
         if 'email' in user_data:
             user.email = user_data['email']
+            self._forget_unknown_email(user.email)
         if 'password' in user_data:
             user.hash_password(user_data['password'])
+            # Tokens issued with the old password stop working
+            user.token_version += 1
         if 'is_admin' in user_data:
             user.is_admin = user_data['is_admin']
         
@@ -86,9 +217,11 @@ class HBnBFacade:
         
         # Save changes to database
         user.save()
+        self._invalidate_user(user_id)
         
         return user
 
+    @transactional
     def make_user_admin(self, user_id):
         """Make a user an admin (for testing purposes)"""
         user = self.get_user(user_id)
@@ -97,9 +230,11 @@ class HBnBFacade:
         
         user.is_admin = True
         user.save()
+        self._invalidate_user(user_id)
         return user
 
     # --- Amenity methods (now using SQLAlchemy) ---
+    @transactional
     def create_amenity(self, amenity_data):
         """Create a new amenity"""
         # Check if amenity with same name already exists
@@ -115,22 +250,38 @@ class HBnBFacade:
         if errors:
             raise ValueError(", ".join(errors))
         
-        # Save to repository (will commit to database)
+        # Save to repository (committed when the use case returns)
         self.amenity_repo.add(amenity)
+        self._invalidate('amenities:all')
         return amenity
 
     def get_amenity(self, amenity_id):
         """Get amenity by ID"""
         return self.amenity_repo.get(amenity_id)
 
+    def get_amenity_details(self, amenity_id):
+        """Get amenity details as a dictionary (read-through cached)"""
+        def load():
+            amenity = self.amenity_repo.get(amenity_id)
+            return amenity.to_dict() if amenity else None
+        return cache.get_or_load(f'amenity:{amenity_id}', load, ttl=self.AMENITY_CACHE_TTL)
+
     def get_amenity_by_name(self, name):
         """Get amenity by name"""
         return self.amenity_repo.get_amenity_by_name(name)
 
     def get_all_amenities(self):
-        """Get all amenities"""
-        return self.amenity_repo.get_all()
+        """Get all amenities as dictionaries (column projection, read-through cached)"""
+        def load():
+            rows = self.amenity_repo.get_all(columns=self.AMENITY_LIST_COLUMNS)
+            return [_serialize_row(row) for row in rows]
+        return cache.get_or_load('amenities:all', load, ttl=self.AMENITY_CACHE_TTL)
+
+    def get_amenities_version(self):
+        """Get (count, latest updated_at) of the amenities collection"""
+        return self.amenity_repo.get_collection_version()
 
+    @transactional
     def update_amenity(self, amenity_id, amenity_data):
         """Update amenity information"""
         amenity = self.get_amenity(amenity_id)
@@ -156,9 +307,15 @@ class HBnBFacade:
         # Save changes to database
         amenity.save()
         
+        # Place details embed amenity names
+        self._invalidate(f'amenity:{amenity_id}', 'amenities:all')
+        for place in amenity.places:
+            self._invalidate_place(place.id)
+        
         return amenity
     
     # --- Place methods (now using SQLAlchemy relationships) ---
+    @transactional
     def create_place(self, place_data):
         """Create a new place"""
         # Check owner exists (using UserRepository)
@@ -189,13 +346,22 @@ class HBnBFacade:
         if errors:
             raise ValueError(", ".join(errors))
         
-        # Save to repository (will commit to database)
+        # Save to repository (committed when the use case returns)
         self.place_repo.add(place)
         return place
 
-    def get_place(self, place_id):
-        """Get place details with relationships"""
-        place = self.place_repo.get(place_id)
+    def get_place(self, place_id, include=('owner', 'amenities')):
+        """Get place details with the requested relationships (read-through cached)"""
+        include = tuple(name for name in self.PLACE_INCLUDES if name in include)
+        return cache.get_or_load(
+            self._place_cache_key(place_id, include),
+            lambda: self._load_place(place_id, include)
+        )
+
+    def _load_place(self, place_id, include):
+        """Build place details with the requested relationships (see PLACE_INCLUDES)"""
+        # Relationships are eagerly loaded up front to avoid N+1 lazy loads
+        place = self.place_repo.get_place_with_relations(place_id, include)
         if not place:
             return None
         
@@ -203,25 +369,91 @@ class HBnBFacade:
         result = place.to_dict()
         
         # Add owner info using relationship
-        if place.owner:
+        if 'owner' in include and place.owner:
             result['owner'] = place.owner.to_dict()
         
         # Add amenities info using relationship
-        result['amenities'] = [amenity.to_dict() for amenity in place.amenities]
+        if 'amenities' in include:
+            result['amenities'] = [amenity.to_dict() for amenity in place.amenities]
+        
+        # Add reviews info using relationship
+        if 'reviews' in include:
+            result['reviews'] = [review.to_dict() for review in place.reviews]
         
         return result
 
     def get_all_places(self):
         """Get all places with basic info including price"""
-        places = self.place_repo.get_all()
-        return [{
-            'id': place.id,
-            'title': place.title,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'price': place.price  # ADDED PRICE HERE
-        } for place in places]
+        rows = self.place_repo.get_all(columns=self.PLACE_LIST_COLUMNS)
+        return [row._asdict() for row in rows]
+
+    def get_places_version(self):
+        """Get (count, latest updated_at) of the places collection"""
+        return self.place_repo.get_collection_version()
+
+    def get_places_page(self, limit=20, cursor=None, sort='created_at', **search):
+        """Get one page of places (basic info) matching the search, in the given sort order
+        
+        `search` accepts min_price, max_price, q, near, radius_km and amenity_ids
+        (see PlaceRepository.search_filters); `sort` is a key of PLACE_SORTS.
+        """
+        if sort not in self.PLACE_SORTS:
+            raise ValueError(f"Invalid sort: {sort}")
+        column, descending = self.PLACE_SORTS[sort]
+        
+        after = decode_cursor(cursor, sort) if cursor else None
+        rows, next_after = self.place_repo.get_page(
+            limit, after, columns=self.PLACE_LIST_COLUMNS, sort=column, descending=descending,
+            filters=self.place_repo.search_filters(**search)
+        )
+        return {
+            'places': [row._asdict() for row in rows],
+            'limit': limit,
+            'next_cursor': encode_cursor(sort, *next_after) if next_after else None
+        }
+
+    def search_places(self, q, limit=20, cursor=None):
+        """Full-text search of place titles and descriptions, best match first
+        
+        Each result carries the basic place info plus title_highlight and
+        snippet: HTML-escaped text with matched terms wrapped in <mark> tags.
+        """
+        if not q or not q.strip():
+            raise ValueError("Search query is required")
+        after = decode_cursor(cursor, 'search') if cursor else None
+        rows, next_after = self.place_repo.search_text(q, limit, after)
+        places = []
+        for row in rows:
+            place = {key: value for key, value in row._asdict().items() if key != 'rank'}
+            place['title_highlight'] = highlight_html(place['title_highlight'])
+            place['snippet'] = highlight_html(place['snippet'])
+            places.append(place)
+        return {
+            'places': places,
+            'limit': limit,
+            'next_cursor': encode_cursor('search', *next_after) if next_after else None
+        }
+
+    def get_nearby_places(self, latitude, longitude, limit=20, radius_km=None):
+        """Get places (basic info plus distance_km) nearest to a point
+        
+        Without radius_km this is a k-nearest-neighbour search for `limit`
+        places; with it, at most `limit` places within the radius (ValueError
+        if the radius is too large to search by cells).
+        """
+        if radius_km is None:
+            ranked = self.place_repo.get_nearest_places(
+                latitude, longitude, limit, columns=self.PLACE_LIST_COLUMNS)
+        else:
+            ranked = self.place_repo.get_places_by_location(
+                latitude, longitude, radius_km, limit=limit, columns=self.PLACE_LIST_COLUMNS)
+        return [{**row._asdict(), 'distance_km': distance} for row, distance in ranked]
+
+    def get_place_owner_id(self, place_id):
+        """Get the owner id of a place for authorization checks (None if not found)"""
+        return self.place_repo.get_owner_id(place_id)
 
+    @transactional
     def update_place(self, place_id, place_data):
         """Update place using relationships"""
         place = self.place_repo.get(place_id)
@@ -235,21 +467,20 @@ class HBnBFacade:
         
         # Update owner if provided
         if 'owner_id' in place_data:
-            new_owner = self.get_user(place_data['owner_id'])
-            if not new_owner:
+            if not self.user_repo.get_existing_ids([place_data['owner_id']]):
                 raise ValueError(f"Owner with id {place_data['owner_id']} not found")
             place.owner_id = place_data['owner_id']
         
-        # Update amenities if provided (many-to-many)
+        # Update amenities if provided (many-to-many), resolved in one query
         if 'amenities' in place_data:
+            amenities = self.amenity_repo.get_many(place_data['amenities'])
             # Clear existing amenities
             place.amenities.clear()
             # Add new amenities
             for amenity_id in place_data['amenities']:
-                amenity = self.get_amenity(amenity_id)
-                if not amenity:
+                if amenity_id not in amenities:
                     raise ValueError(f"Amenity with id {amenity_id} not found")
-                place.add_amenity(amenity)
+                place.add_amenity(amenities[amenity_id])
         
         # Validate and save
         errors = place.validate()
@@ -258,20 +489,30 @@ class HBnBFacade:
         
         # Save changes to database
         place.save()
+        self._invalidate_place(place_id)
         
         return place
 
     # --- Review methods (now using SQLAlchemy relationships) ---
+    @transactional
     def create_review(self, review_data):
-        """Create a new review using relationships"""
+        """Create a new review
+        
+        Users cannot review their own place or review a place twice. Both
+        checks cost one indexed lookup: the place's owner id, and the unique
+        (user_id, place_id) index on insert.
+        """
         # Check user and place exist
-        user = self.get_user(review_data.get('user_id'))
-        if not user:
-            raise ValueError(f"User with id {review_data.get('user_id')} not found")
+        user_id = review_data.get('user_id')
+        if not self.user_repo.get_existing_ids([user_id]):
+            raise ValueError(f"User with id {user_id} not found")
         
-        place = self.place_repo.get(review_data.get('place_id'))
-        if not place:
-            raise ValueError(f"Place with id {review_data.get('place_id')} not found")
+        place_id = review_data.get('place_id')
+        owner_id = self.place_repo.get_owner_id(place_id)
+        if owner_id is None:
+            raise ValueError(f"Place with id {place_id} not found")
+        if owner_id == user_id:
+            raise ValueError('You cannot review your own place')
         
         # Create and validate review
         review = Review(
@@ -285,8 +526,18 @@ class HBnBFacade:
         if errors:
             raise ValueError(", ".join(errors))
         
-        # Save to repository (will commit to database)
-        self.review_repo.add(review)
+        # Insert or conflict: a second review by the same user violates the unique
+        # index, and the savepoint also undoes the aggregate update
+        try:
+            with unit_of_work():
+                # Update the place's rating aggregates in the same transaction
+                self.place_repo.adjust_rating_aggregates(place_id, 1, review.rating)
+                
+                # Save to repository (committed when the use case returns)
+                self.review_repo.add(review)
+        except IntegrityError:
+            raise ValueError('You have already reviewed this place')
+        self._invalidate_place(place_id)
         return review
 
     def get_review(self, review_id):
@@ -306,6 +557,7 @@ class HBnBFacade:
         # Use relationship to get reviews
         return place.reviews
 
+    @transactional
     def update_review(self, review_id, review_data):
         """Update review"""
         review = self.review_repo.get(review_id)
@@ -313,6 +565,7 @@ class HBnBFacade:
             raise ValueError(f"Review with id {review_id} not found")
         
         # Update provided fields
+        old_rating = review.rating
         if 'text' in review_data:
             review.text = review_data['text']
         if 'rating' in review_data:
@@ -322,21 +575,259 @@ class HBnBFacade:
         if errors:
             raise ValueError(", ".join(errors))
         
+        # Keep the place's rating sum in step with the new rating
+        if review.rating != old_rating:
+            self.place_repo.adjust_rating_aggregates(review.place_id, 0, review.rating - old_rating)
+        
         # Save changes to database
         review.save()
+        self._invalidate_place(review.place_id)
         
         return review
 
+    @transactional
     def delete_review(self, review_id):
         """Delete review"""
         review = self.review_repo.get(review_id)
         if not review:
             raise ValueError(f"Review with id {review_id} not found")
         
-        # Delete from repository (will commit to database)
+        # Remove the review from the place's aggregates in the same transaction
+        self.place_repo.adjust_rating_aggregates(review.place_id, -1, -review.rating)
+        
+        # Delete from repository (committed when the use case returns)
+        place_id = review.place_id
         self.review_repo.delete(review_id)
+        self._invalidate_place(place_id)
         return True
 
+    @transactional
+    def recompute_place_ratings(self):
+        """Rebuild every place's review_count and rating_sum from the reviews table"""
+        updated = self.place_repo.recompute_rating_aggregates()
+        after_commit(cache.clear)
+        return updated
+
+    # --- Bulk create methods ---
+    # Each takes a list of row dictionaries and returns one result per row, in
+    # order: {'index', 'status': 201, 'id'} or {'index', 'status', 'error'},
+    # where status is the code the single-row endpoint would have returned.
+    # Referenced ids are resolved with one IN query per kind for the whole list.
+
+    def bulk_create_amenities(self, rows):
+        """Create many amenities, skipping names that already exist"""
+        results = [None] * len(rows)
+        pending = []
+        
+        names = [row.get('name') for row in rows if isinstance(row, dict) and isinstance(row.get('name'), str)]
+        taken = self.amenity_repo.get_existing_names(name.strip() for name in names)
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Row must be a JSON object")
+                amenity = Amenity(name=row.get('name'))
+                if amenity.name.lower() in taken:
+                    results[index] = _bulk_error(index, 409, f"Amenity with name '{amenity.name}' already exists")
+                    continue
+                taken.add(amenity.name.lower())
+                pending.append((index, amenity))
+            except (ValueError, TypeError, AttributeError) as e:
+                results[index] = _bulk_error(index, 400, str(e))
+        
+        self._bulk_insert(self.amenity_repo, pending, results)
+        if pending:
+            self._invalidate('amenities:all')
+        return results
+
+    def bulk_create_places(self, rows, owner_id, rows_set_owner=False):
+        """Create many places owned by owner_id, or by each row's owner_id if rows_set_owner"""
+        results = [None] * len(rows)
+        pending = []
+        place_amenities = {}
+        
+        def owner_of(row):
+            return row.get('owner_id', owner_id) if rows_set_owner else owner_id
+        
+        dict_rows = [row for row in rows if isinstance(row, dict)]
+        owners = self.user_repo.get_existing_ids(
+            {owner_of(row) for row in dict_rows if isinstance(owner_of(row), str)})
+        amenities = self.amenity_repo.get_many({
+            amenity_id for row in dict_rows
+            if isinstance(row.get('amenities', []), list)
+            for amenity_id in row.get('amenities', []) if isinstance(amenity_id, str)
+        })
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Row must be a JSON object")
+                place_owner = owner_of(row)
+                if place_owner not in owners:
+                    results[index] = _bulk_error(index, 404, f"Owner with id {place_owner} not found")
+                    continue
+                amenity_ids = row.get('amenities', [])
+                if not isinstance(amenity_ids, list):
+                    raise ValueError("amenities must be a list of amenity ids")
+                missing = [amenity_id for amenity_id in amenity_ids if amenity_id not in amenities]
+                if missing:
+                    results[index] = _bulk_error(index, 404, f"Amenity with id {missing[0]} not found")
+                    continue
+                
+                place = Place(
+                    title=row.get('title', ''),
+                    description=row.get('description', ''),
+                    price=row.get('price', 0),
+                    latitude=row.get('latitude', 0),
+                    longitude=row.get('longitude', 0),
+                    owner_id=place_owner
+                )
+                errors = place.validate()
+                if errors:
+                    raise ValueError(", ".join(errors))
+                place_amenities[index] = [amenities[amenity_id] for amenity_id in amenity_ids]
+                pending.append((index, place))
+            except (ValueError, TypeError, AttributeError) as e:
+                results[index] = _bulk_error(index, 400, str(e))
+        
+        def attach_amenities(batch):
+            # Attached per batch: the amenity backrefs must only reach places being flushed
+            for index, place in batch:
+                for amenity in place_amenities[index]:
+                    place.add_amenity(amenity)
+        
+        self._bulk_insert(self.place_repo, pending, results, before_insert=attach_amenities)
+        return results
+
+    def bulk_create_reviews(self, rows, user_id):
+        """Create many reviews by one user, applying the single-review rules to each row"""
+        results = [None] * len(rows)
+        pending = []
+        
+        place_ids = {row.get('place_id') for row in rows
+                     if isinstance(row, dict) and isinstance(row.get('place_id'), str)}
+        owners = self.place_repo.get_owner_ids(place_ids)
+        reviewed = self.review_repo.get_reviewed_place_ids(user_id, place_ids)
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Row must be a JSON object")
+                place_id = row.get('place_id')
+                if place_id not in owners:
+                    results[index] = _bulk_error(index, 404, f"Place with id {place_id} not found")
+                    continue
+                if owners[place_id] == user_id:
+                    raise ValueError('You cannot review your own place')
+                if place_id in reviewed:
+                    raise ValueError('You have already reviewed this place')
+                
+                review = Review(
+                    text=row.get('text', ''),
+                    rating=row.get('rating', 0),
+                    place_id=place_id,
+                    user_id=user_id
+                )
+                errors = review.validate()
+                if errors:
+                    raise ValueError(", ".join(errors))
+                reviewed.add(place_id)
+                pending.append((index, review))
+            except (ValueError, TypeError, AttributeError) as e:
+                results[index] = _bulk_error(index, 400, str(e))
+        
+        def adjust_ratings(batch):
+            # One aggregate update per place, in the same transaction as the inserts
+            deltas = {}
+            for _, review in batch:
+                count, rating_sum = deltas.get(review.place_id, (0, 0))
+                deltas[review.place_id] = (count + 1, rating_sum + review.rating)
+            for place_id, (count, rating_sum) in deltas.items():
+                self.place_repo.adjust_rating_aggregates(place_id, count, rating_sum)
+        
+        self._bulk_insert(self.review_repo, pending, results, before_insert=adjust_ratings)
+        for place_id in {review.place_id for _, review in pending}:
+            self._invalidate_place(place_id)
+        return results
+
+    def _bulk_insert(self, repo, pending, results, before_insert=None):
+        """Insert validated (index, obj) pairs in batched transactions, filling in results
+        
+        A batch that violates a constraint is rolled back and retried row by
+        row, so only the offending rows are reported as conflicts.
+        """
+        def insert(batch):
+            # Each batch (or retried row) is its own unit of work
+            with unit_of_work():
+                if before_insert:
+                    before_insert(batch)
+                obj_ids = repo.add_all([obj for _, obj in batch])
+            for (index, _), obj_id in zip(batch, obj_ids):
+                results[index] = {'index': index, 'status': 201, 'id': obj_id}
+        
+        for start in range(0, len(pending), self.BULK_BATCH_SIZE):
+            batch = pending[start:start + self.BULK_BATCH_SIZE]
+            try:
+                insert(batch)
+            except IntegrityError:
+                for index, obj in batch:
+                    try:
+                        insert([(index, obj)])
+                    except IntegrityError as e:
+                        results[index] = _bulk_error(index, 409, f"Conflicts with existing data: {e.orig}")
+
+    # --- Export methods ---
+    def export_collection(self, entity):
+        """Get (columns, rows) for exporting a whole collection
+        
+        `rows` is a generator of JSON-safe dictionaries read through a
+        server-side cursor, so memory use does not grow with the collection.
+        """
+        repos = {'users': self.user_repo, 'amenities': self.amenity_repo,
+                 'places': self.place_repo, 'reviews': self.review_repo}
+        if entity not in repos:
+            raise ValueError(f"Unknown export: {entity}")
+        columns = self.EXPORT_COLUMNS[entity]
+        rows = repos[entity].stream(columns, self.EXPORT_BATCH_SIZE)
+        return columns, (_serialize_row(row) for row in rows)
+
+    # --- Cache helpers ---
+    def get_cache_stats(self):
+        """Get hit/miss counters of the read-through cache"""
+        return cache.stats()
+
+    def get_password_hashing_stats(self):
+        """Get queue depth and counters of the password hashing pool"""
+        return password_hasher.stats()
+
+    def _place_cache_key(self, place_id, include):
+        """Cache key for one include variant of a place's details"""
+        return f"place:{place_id}:{','.join(include)}"
+
+    def _unknown_email_key(self, email):
+        """Cache key marking an email that has no account"""
+        return f"unknown-email:{email}"
+
+    def _forget_unknown_email(self, email):
+        """Drop an email from the unknown-email cache once the current unit of work commits"""
+        key = self._unknown_email_key(email)
+        after_commit(lambda: unknown_emails.invalidate(key))
+
+    def _invalidate(self, *keys):
+        """Drop cache keys once the current unit of work commits"""
+        after_commit(lambda: cache.invalidate(*keys))
+
+    def _invalidate_place(self, place_id):
+        """Drop every cached include variant of a place's details"""
+        keys = [self._place_cache_key(place_id, include)
+                for size in range(len(self.PLACE_INCLUDES) + 1)
+                for include in combinations(self.PLACE_INCLUDES, size)]
+        self._invalidate(*keys)
+
+    def _invalidate_user(self, user_id):
+        """Drop a cached user, their principal and the place details that embed them as owner"""
+        self._invalidate(f'user:{user_id}')
+        after_commit(lambda: principals.invalidate(user_id))
+        for place_id in self.place_repo.get_place_ids_by_owner(user_id):
+            self._invalidate_place(place_id)
+
     # --- Additional relationship methods ---
     def get_user_places(self, user_id):
         """Get all places owned by a user using relationships"""
@@ -0,0 +1,210 @@
+"""Static asset pipeline for the bundled frontend.
+
+Every file under the frontend directory is read once and published under a
+content-hashed name (styles.css -> styles.1a2b3c4d5e.css). References to
+those files in the HTML pages and in styles.css are rewritten to the hashed
+names, so the hashed files can be cached forever (Cache-Control: immutable):
+a change to a file changes its name. Pages keep their own names and are
+revalidated with an ETag, so a repeat page load costs one 304 and no bytes.
+
+Compressible files get gzip (and brotli, when the brotli package is
+installed) variants built at load time; the smallest variant the client
+accepts is sent.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+from flask import Response, abort, request
+
+try:
+    import brotli
+except ImportError:  # optional dependency, only gzip variants are built
+    brotli = None
+
+
+# Content types worth compressing (images are already compressed)
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# Pages and stylesheets whose references to other assets are rewritten
+_REFERENCE_PATTERNS = {
+    '.html': re.compile(r'''(?P<prefix>(?:href|src)=["'])(?P<path>[^"'?#]+)'''),
+    '.css': re.compile(r'''(?P<prefix>url\(\s*["']?)(?P<path>[^"')?#]+)'''),
+}
+
+
+def is_compressible(mimetype):
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def preferred_encodings():
+    """Content codings the current request accepts, best first ('identity' last)."""
+    accepted = request.accept_encodings
+    encodings = [name for name in ('br', 'gzip')
+                 if accepted.quality(name) > 0 and (name != 'br' or brotli is not None)]
+    return encodings + ['identity']
+
+
+def compress(data, encoding, level=None):
+    """Compress data with 'gzip' or 'br' (level None: the maximum)."""
+    if encoding == 'gzip':
+        # A fixed mtime keeps the output, and so the build, reproducible
+        return gzip.compress(data, 9 if level is None else level, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(data, quality=11 if level is None else level)
+    raise ValueError(f"Unknown content encoding: {encoding}")
+
+
+class Asset:
+    """One published file: its bytes per content encoding and cache validator."""
+
+    def __init__(self, path, name, data):
+        self.path = path
+        self.name = name
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.etag = hashlib.sha256(data).hexdigest()[:20]
+        self.variants = {'identity': data}
+        if is_compressible(self.mimetype):
+            for encoding in ('gzip', 'br') if brotli is not None else ('gzip',):
+                compressed = compress(data, encoding)
+                # Tiny files can grow when compressed
+                if len(compressed) < len(data):
+                    self.variants[encoding] = compressed
+
+
+class StaticAssets:
+    """Serves the frontend directory through the content-hashed pipeline."""
+
+    def __init__(self):
+        self.directory = None
+        self.max_age = 31536000
+        self.reload = False
+        self.manifest = {}
+        self._assets = {}
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Build the assets from FRONTEND_DIR and register the frontend routes."""
+        self.directory = os.path.abspath(app.config.get(
+            'FRONTEND_DIR', os.path.join(app.root_path, '..', 'frontend')))
+        self.max_age = app.config.get('STATIC_ASSETS_MAX_AGE', 31536000)
+        # Development: rebuild when a file changes instead of at startup only
+        self.reload = app.config.get('STATIC_ASSETS_RELOAD', False)
+        self.load()
+
+        app.add_url_rule('/', 'index', lambda: self.send('index.html'))
+        app.add_url_rule('/<path:filename>', 'serve_static', self._serve_static)
+
+    def _serve_static(self, filename):
+        # Don't serve API routes as static files
+        if filename.startswith('api/'):
+            return "Not Found", 404
+        return self.send(filename)
+
+    def _files(self):
+        """Relative paths and mtimes of every frontend file, sorted."""
+        files = []
+        for root, dirs, names in os.walk(self.directory):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            for name in sorted(names):
+                if name.startswith('.'):
+                    continue
+                full_path = os.path.join(root, name)
+                files.append((os.path.relpath(full_path, self.directory).replace(os.sep, '/'),
+                              os.stat(full_path).st_mtime_ns))
+        return files
+
+    def load(self):
+        """Read, rewrite, hash and compress every frontend file."""
+        files = self._files()
+        contents = {}
+        for path, _ in files:
+            with open(os.path.join(self.directory, path), 'rb') as handle:
+                contents[path] = handle.read()
+
+        # Images and scripts first, then stylesheets (referencing images),
+        # then pages, so each hash covers the rewritten references
+        order = {'.css': 1, '.html': 2}
+        manifest = {}
+        assets = {}
+        for path in sorted(contents, key=lambda p: (order.get(os.path.splitext(p)[1], 0), p)):
+            extension = os.path.splitext(path)[1]
+            data = contents[path]
+            if extension in _REFERENCE_PATTERNS:
+                data = self._rewrite(path, data, manifest)
+            if extension == '.html':
+                # Pages keep their URL and are revalidated instead
+                assets[path] = Asset(path, path, data)
+                continue
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            stem, _ = os.path.splitext(path)
+            name = f'{stem}.{digest}{extension}'
+            manifest[path] = name
+            # The plain name keeps working, but is revalidated like a page
+            assets[name] = assets[path] = Asset(path, name, data)
+
+        with self._lock:
+            self.manifest = manifest
+            self._assets = assets
+            self._stamp = files
+
+    def _rewrite(self, path, data, manifest):
+        """Point references to published files at their hashed names."""
+        base = os.path.dirname(path)
+        pattern = _REFERENCE_PATTERNS[os.path.splitext(path)[1]]
+
+        def replace(match):
+            reference = match.group('path')
+            if '://' in reference or reference.startswith(('/', 'data:')):
+                return match.group(0)
+            target = os.path.normpath(os.path.join(base, reference)).replace(os.sep, '/')
+            if target not in manifest:
+                return match.group(0)
+            hashed = os.path.relpath(manifest[target], base or '.').replace(os.sep, '/')
+            return match.group('prefix') + hashed
+
+        return pattern.sub(replace, data.decode('utf-8')).encode('utf-8')
+
+    def url_for(self, path):
+        """Published (hashed) name of a frontend file, or the path itself."""
+        return self.manifest.get(path, path)
+
+    def get(self, name):
+        if self.reload and self._files() != self._stamp:
+            self.load()
+        return self._assets.get(name)
+
+    def send(self, name):
+        """Response for a published file, honouring Accept-Encoding and If-None-Match."""
+        asset = self.get(name)
+        if asset is None:
+            abort(404)
+
+        encoding = next(e for e in preferred_encodings() if e in asset.variants)
+        etag = asset.etag if encoding == 'identity' else f'{asset.etag}-{encoding}'
+        response = Response(mimetype=asset.mimetype)
+        if len(asset.variants) > 1:
+            response.vary.add('Accept-Encoding')
+        if name != asset.path:
+            response.headers['Cache-Control'] = f'public, max-age={self.max_age}, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+        response.set_etag(etag)
+
+        if request.if_none_match.contains_weak(etag):
+            response.status_code = 304
+            return response
+        response.set_data(asset.variants[encoding])
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        return response
+
+    def stats(self):
+        """Published files with their raw and compressed sizes."""
+        return [{'path': path, 'name': asset.name,
+                 'sizes': {encoding: len(data) for encoding, data in asset.variants.items()}}
+                for path, asset in sorted(self._assets.items()) if path == asset.path]
@@ -0,0 +1,64 @@
+"""On-the-fly compression of API responses.
+
+List and detail payloads are mostly repeated keys and compress several
+times over; responses at or above COMPRESS_MIN_SIZE bytes are gzip (or
+brotli) encoded when the client accepts it. Smaller bodies are sent as
+they are, where the compression overhead would outweigh the saving.
+Streamed responses (exports) and already encoded ones are left alone.
+"""
+from flask import request
+
+from app.web.assets import compress, preferred_encodings
+
+
+class ResponseCompression:
+    """after_request hook compressing JSON responses above a size threshold."""
+
+    def __init__(self):
+        self.min_size = 1024
+        self.mimetypes = ('application/json',)
+        self.levels = {'gzip': 6, 'br': 4}
+
+    def init_app(self, app):
+        """Configure from COMPRESS_* settings; COMPRESS_MIN_SIZE None disables it."""
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+        self.mimetypes = tuple(app.config.get('COMPRESS_MIMETYPES', ('application/json',)))
+        self.levels = {'gzip': app.config.get('COMPRESS_GZIP_LEVEL', 6),
+                       'br': app.config.get('COMPRESS_BROTLI_QUALITY', 4)}
+        if self.min_size is not None:
+            app.after_request(self.compress_response)
+
+    def compress_response(self, response):
+        if response.status_code == 304:
+            # A 304 has no body (or content type) to go by: match the
+            # validator of the client's copy, weak only if that 200 was encoded
+            etag, weak = response.get_etag()
+            client_etags = request.if_none_match
+            if etag and not weak and client_etags.is_weak(etag) and not client_etags.is_strong(etag):
+                response.vary.add('Accept-Encoding')
+                self._weaken_etag(response)
+            return response
+        if response.mimetype not in self.mimetypes or 'Content-Encoding' in response.headers:
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = preferred_encodings()[0]
+        if encoding == 'identity':
+            return response
+        if (response.status_code < 200 or response.status_code == 204
+                or response.is_streamed or response.direct_passthrough):
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        response.set_data(compress(data, encoding, self.levels[encoding]))
+        response.headers['Content-Encoding'] = encoding
+        self._weaken_etag(response)
+        return response
+
+    @staticmethod
+    def _weaken_etag(response):
+        # The encoded body differs byte for byte; If-None-Match compares weakly
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
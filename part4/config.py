@@ -4,8 +4,95 @@ from datetime import timedelta
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
+    # Short-lived access tokens, renewed with the refresh token from login
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # Verified tokens remembered per process, so repeat requests skip the signature check
+    JWT_VERIFIED_TOKEN_CACHE_SIZE = 4096
+    # Logged-out token ids: 'memory' per process, 'redis' shared by all workers
+    TOKEN_DENYLIST_BACKEND = os.getenv('TOKEN_DENYLIST_BACKEND', 'memory')
+    TOKEN_DENYLIST_REDIS_URL = os.getenv('TOKEN_DENYLIST_REDIS_URL', 'redis://localhost:6379/0')
     DEBUG = False
+    
+    # Frontend served through the asset pipeline: content-hashed files are
+    # cached for STATIC_ASSETS_MAX_AGE seconds, pages are revalidated
+    FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
+    STATIC_ASSETS_MAX_AGE = 31536000
+    STATIC_ASSETS_RELOAD = False
+    
+    # JSON responses of at least COMPRESS_MIN_SIZE bytes are gzip/brotli
+    # encoded for clients accepting it (None disables compression)
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_GZIP_LEVEL = 6
+    COMPRESS_BROTLI_QUALITY = 4
+    
+    # Encoder of the compiled list serializers: 'orjson' (used when installed) or 'json'
+    JSON_SERIALIZER = os.getenv('JSON_SERIALIZER', 'orjson')
+    
+    # Read-through cache for facade lookups ('memory' per process, or 'redis' shared)
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_DEFAULT_TTL = 300
+    CACHE_MAX_ENTRIES = 1024
+    
+    # Per-process cache of each user's authorization state (is_admin,
+    # token_version), read on every authenticated request instead of the
+    # JWT claims. This process drops an entry as soon as the user changes;
+    # other workers pick the change up within the TTL.
+    PRINCIPAL_CACHE_BACKEND = 'memory'
+    PRINCIPAL_CACHE_DEFAULT_TTL = 5
+    PRINCIPAL_CACHE_MAX_ENTRIES = 10000
+    
+    # Emails with no account, remembered so repeated login attempts for them
+    # skip the database. A small store of its own: a credential-stuffing
+    # burst must not evict the read-through cache. With 'memory' a new
+    # account is forgotten at once only by the worker that created it, and
+    # other workers refuse it for up to the TTL; several workers need
+    # 'redis' or a TTL of 0, which turns the cache off.
+    UNKNOWN_EMAIL_CACHE_BACKEND = os.getenv('UNKNOWN_EMAIL_CACHE_BACKEND', 'memory')
+    UNKNOWN_EMAIL_CACHE_REDIS_URL = os.getenv('UNKNOWN_EMAIL_CACHE_REDIS_URL', CACHE_REDIS_URL)
+    UNKNOWN_EMAIL_CACHE_DEFAULT_TTL = 30
+    UNKNOWN_EMAIL_CACHE_MAX_ENTRIES = 1000
+    
+    # PRAGMA name -> value issued on every new SQLite connection
+    SQLITE_PRAGMAS = {}
+    
+    # Optional read-only engines; read queries are spread over them
+    SQLALCHEMY_READ_REPLICA_URIS = []
+    
+    # Apply pending schema migrations when the app starts; otherwise startup
+    # fails while migrations are pending or indexes are missing. Databases
+    # are normally set up once with python -m scripts.init_db, not per boot
+    SCHEMA_AUTO_MIGRATE = False
+    SCHEMA_CHECK_ON_STARTUP = True
+    # Create the admin account in create_app (scripts.init_db does it otherwise)
+    ADMIN_BOOTSTRAP_ON_STARTUP = False
+    
+    # Password hash policy: 'bcrypt' (cost 2^rounds) or 'argon2id' (needs
+    # argon2-cffi). Hashes under another algorithm or cost are upgraded on
+    # login; pick costs with python -m scripts.benchmark_password_cost
+    PASSWORD_HASH_ALGORITHM = os.getenv('PASSWORD_HASH_ALGORITHM', 'bcrypt')
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 3))
+    ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 65536))  # KiB
+    ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 4))
+    
+    # Process pool that runs the hashing; 0 workers hashes in the request
+    # thread. At most workers + queue size hashes are admitted per API
+    # process; further logins get a 503.
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 0))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv('PASSWORD_HASH_QUEUE_SIZE', 16))
+    PASSWORD_HASH_TIMEOUT = 10.0
+    
+    # Failed logins allowed per client IP and per email within the sliding
+    # window (seconds); beyond that logins get a 429 without a password check.
+    # 'memory' counts per process, 'redis' across all workers.
+    LOGIN_RATE_LIMIT_BACKEND = os.getenv('LOGIN_RATE_LIMIT_BACKEND', 'memory')
+    LOGIN_RATE_LIMIT_REDIS_URL = os.getenv('LOGIN_RATE_LIMIT_REDIS_URL', CACHE_REDIS_URL)
+    LOGIN_MAX_FAILURES_PER_IP = 20
+    LOGIN_MAX_FAILURES_PER_EMAIL = 5
+    LOGIN_FAILURE_WINDOW = 300
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -14,9 +101,53 @@ class DevelopmentConfig(Config):
     # SQLAlchemy configuration
     SQLALCHEMY_DATABASE_URI = 'sqlite:///development.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 10))
+    # Pick up frontend edits without restarting
+    STATIC_ASSETS_RELOAD = True
+
+class ProductionConfig(Config):
+    SECRET_KEY = os.getenv('SECRET_KEY')
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
+    
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///production.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Read-only engines for read queries (comma-separated, e.g. Postgres replicas).
+    # The default opens the primary file read-only: in WAL mode readers never wait for the writer.
+    SQLALCHEMY_READ_REPLICA_URIS = os.getenv(
+        'DATABASE_REPLICA_URLS', 'sqlite:///file:production.db?mode=ro&uri=true').split(',')
+    
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',       # WAL stays consistent; only the last commits can be lost on power failure
+        'busy_timeout': 5000,          # wait up to 5s for the write lock instead of failing
+        'mmap_size': 268435456,        # 256MB memory-mapped reads
+        'cache_size': -65536,          # 64MB page cache per connection
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON'
+    }
+    
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 2))
+    
+    # Served by several workers: only a shared unknown-email cache is safe
+    UNKNOWN_EMAIL_CACHE_DEFAULT_TTL = 30 if Config.UNKNOWN_EMAIL_CACHE_BACKEND == 'redis' else 0
+
+class TestingConfig(Config):
+    TESTING = True
+    
+    # In-memory database so every app instance starts from an empty schema
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SCHEMA_AUTO_MIGRATE = True
+    ADMIN_BOOTSTRAP_ON_STARTUP = True
+    
+    # Cheap bcrypt rounds keep the admin bootstrap fast in tests
+    BCRYPT_LOG_ROUNDS = 4
 
 # Simple config dictionary
 config = {
     'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
\ No newline at end of file
@@ -26,6 +26,29 @@ document.addEventListener('DOMContentLoaded', () => {
     // Get token from cookie
     let authToken = getCookie('token');
     
+    // Access tokens are short-lived; renew one with the refresh token from login
+    async function refreshAccessToken() {
+        const refreshToken = getCookie('refresh_token');
+        if (!refreshToken) return null;
+        const response = await fetch(`${API_BASE_URL}/auth/refresh`, {
+            method: 'POST',
+            headers: { 'Authorization': `Bearer ${refreshToken}` }
+        });
+        if (!response.ok) {
+            deleteCookie('refresh_token');
+            return null;
+        }
+        const data = await response.json();
+        setCookie('token', data.access_token, 1);
+        authToken = data.access_token;
+        return authToken;
+    }
+    
+    // Server-side filter state and the cursor of the next places page
+    const PAGE_SIZE = 20;
+    let currentMaxPrice = '';
+    let nextCursor = null;
+    
     // Check authentication and redirect if needed
     function checkAuthentication() {
         const token = getCookie('token');
@@ -54,7 +77,21 @@ document.addEventListener('DOMContentLoaded', () => {
     
     // Logout function
     function logout() {
+        // Revoke both tokens server-side; the cookies go regardless
+        const refreshToken = getCookie('refresh_token');
+        if (authToken) {
+            fetch(`${API_BASE_URL}/auth/logout`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Authorization': `Bearer ${authToken}`
+                },
+                body: JSON.stringify({ refresh_token: refreshToken }),
+                keepalive: true
+            }).catch(() => {});
+        }
         deleteCookie('token');
+        deleteCookie('refresh_token');
         authToken = null;
         alert('Logged out successfully');
         window.location.href = 'index.html';
@@ -118,11 +155,8 @@ document.addEventListener('DOMContentLoaded', () => {
     // Update auth UI on all pages
     updateAuthUI();
     
-    // Store places data globally for filtering
-    let allPlaces = [];
-    
-    // Function to fetch places from API
-    async function fetchPlaces() {
+    // Function to fetch a page of places from API (filtered on the server)
+    async function fetchPlaces(append = false) {
         try {
             const headers = {};
             // Include token if available (optional for viewing places)
@@ -130,37 +164,47 @@ document.addEventListener('DOMContentLoaded', () => {
                 headers['Authorization'] = `Bearer ${authToken}`;
             }
             
-            const response = await fetch(`${API_BASE_URL}/places/`, {
+            const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+            if (currentMaxPrice) {
+                params.set('max_price', currentMaxPrice);
+            }
+            if (append && nextCursor) {
+                params.set('cursor', nextCursor);
+            }
+            
+            const response = await fetch(`${API_BASE_URL}/places/?${params}`, {
                 method: 'GET',
                 headers: headers
             });
             
             if (response.ok) {
-                const places = await response.json();
-                allPlaces = places; // Store for filtering
-                displayPlaces(places);
-                setupPriceFilterOptions(places);
+                const page = await response.json();
+                nextCursor = page.next_cursor;
+                displayPlaces(page.places, append);
+                updateLoadMoreButton();
             } else {
                 console.error('Failed to fetch places');
-                displayPlaces([]);
+                displayPlaces([], append);
             }
         } catch (error) {
             console.error('Error fetching places:', error);
-            displayPlaces([]);
+            displayPlaces([], append);
         }
     }
     
     // Function to display places
-    function displayPlaces(places) {
+    function displayPlaces(places, append = false) {
         const placesList = document.getElementById('places-list');
         if (!placesList) return;
         
-        // Clear current content
-        placesList.innerHTML = '';
-        
-        if (places.length === 0) {
-            placesList.innerHTML = '<p style="text-align: center; grid-column: 1/-1;">No places available.</p>';
-            return;
+        if (!append) {
+            // Clear current content
+            placesList.innerHTML = '';
+            
+            if (places.length === 0) {
+                placesList.innerHTML = '<p style="text-align: center; grid-column: 1/-1;">No places available.</p>';
+                return;
+            }
         }
         
         // Create and append place elements
@@ -182,28 +226,13 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
     
-    // Function to setup price filter options
-    function setupPriceFilterOptions(places) {
-        const priceFilter = document.getElementById('price-filter');
-        if (!priceFilter) return;
-        
-        // Clear existing options
-        priceFilter.innerHTML = '';
+    // Show the "Load more" button only while more pages exist
+    function updateLoadMoreButton() {
+        const loadMoreButton = document.getElementById('load-more');
+        if (!loadMoreButton) return;
         
-        // Add filter options
-        const filterOptions = [
-            { value: '', text: 'All' },
-            { value: '10', text: 'Up to $10' },
-            { value: '50', text: 'Up to $50' },
-            { value: '100', text: 'Up to $100' }
-        ];
-        
-        filterOptions.forEach(option => {
-            const optionElement = document.createElement('option');
-            optionElement.value = option.value;
-            optionElement.textContent = option.text;
-            priceFilter.appendChild(optionElement);
-        });
+        loadMoreButton.style.display = nextCursor ? 'block' : 'none';
+        loadMoreButton.onclick = () => fetchPlaces(true);
     }
     
     // Function to setup price filter event listener
@@ -212,23 +241,10 @@ document.addEventListener('DOMContentLoaded', () => {
         if (!priceFilter) return;
         
         priceFilter.addEventListener('change', (event) => {
-            const selectedPrice = event.target.value;
-            filterPlacesByPrice(selectedPrice);
-        });
-    }
-    
-    // Function to filter places by price
-    function filterPlacesByPrice(maxPrice) {
-        const placeCards = document.querySelectorAll('.place-card');
-        
-        placeCards.forEach(card => {
-            const placePrice = parseFloat(card.dataset.price) || 0;
-            
-            if (maxPrice === '' || placePrice <= parseFloat(maxPrice)) {
-                card.style.display = 'block';
-            } else {
-                card.style.display = 'none';
-            }
+            // Re-query the server with the new max price, starting from the first page
+            currentMaxPrice = event.target.value;
+            nextCursor = null;
+            fetchPlaces();
         });
     }
     
@@ -240,7 +256,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 headers['Authorization'] = `Bearer ${token}`;
             }
             
-            const response = await fetch(`${API_BASE_URL}/places/${placeId}`, {
+            // Expand owner, amenities and reviews so the page renders from one request
+            const response = await fetch(`${API_BASE_URL}/places/${placeId}?include=owner,amenities,reviews`, {
                 method: 'GET',
                 headers: headers
             });
@@ -248,8 +265,7 @@ document.addEventListener('DOMContentLoaded', () => {
             if (response.ok) {
                 const place = await response.json();
                 displayPlaceDetails(place);
-                // Fetch reviews separately
-                fetchPlaceReviews(placeId);
+                displayReviews(place.reviews || []);
             } else {
                 console.error('Failed to fetch place details');
                 document.getElementById('place-details').innerHTML = 
@@ -349,7 +365,7 @@ document.addEventListener('DOMContentLoaded', () => {
     // Function to load place info for review page
     async function loadPlaceForReview(placeId) {
         try {
-            const response = await fetch(`${API_BASE_URL}/places/${placeId}`);
+            const response = await fetch(`${API_BASE_URL}/places/${placeId}?include=owner`);
             if (response.ok) {
                 const place = await response.json();
                 displayPlaceForReview(place);
@@ -406,7 +422,7 @@ document.addEventListener('DOMContentLoaded', () => {
     }
     
     // Function to submit review
-    async function submitReview(token, placeId, reviewText, rating) {
+    async function submitReview(token, placeId, reviewText, rating, retry = true) {
         const response = await fetch(`${API_BASE_URL}/reviews/`, {
             method: 'POST',
             headers: {
@@ -420,6 +436,11 @@ document.addEventListener('DOMContentLoaded', () => {
             })
         });
         
+        // Expired access token: renew it once and resend
+        if (response.status === 401 && retry) {
+            const renewed = await refreshAccessToken();
+            if (renewed) return submitReview(renewed, placeId, reviewText, rating, false);
+        }
         return response;
     }
     
@@ -463,6 +484,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     const data = await response.json();
                     // Store JWT token in cookie as required
                     setCookie('token', data.access_token, 1); // 1 day expiration
+                    setCookie('refresh_token', data.refresh_token, 30);
                     authToken = data.access_token;
                     alert('Login successful!');
                     window.location.href = 'index.html';
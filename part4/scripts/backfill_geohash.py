@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Backfill Geohash Script
+Fills in places.geohash for places that lack one.
+"""
+
+from app import create_app, db
+
+def backfill_geohash():
+    """Compute the geohash cell of every place that lacks one."""
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            from app.services import facade
+            updated = facade.place_repo.backfill_geohashes()
+            print(f"✅ Geohash computed for {updated} places")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Error backfilling geohashes: {e}")
+
+if __name__ == "__main__":
+    backfill_geohash()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Concurrency Benchmark Script
+Runs several worker processes (like gunicorn workers) against one SQLite file
+with a mix of place reads and writes, and compares the default connection
+settings with the ProductionConfig profile (WAL, pragmas), with and without
+reads routed to read-only engines.
+
+Usage: python -m scripts.benchmark_concurrency [--workers 4] [--requests 200] [--write-ratio 0.2]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+PROFILES = {
+    # Plain SQLite connections, as in DevelopmentConfig
+    'default': {'SQLITE_PRAGMAS': {}, 'SQLALCHEMY_READ_REPLICA_URIS': []},
+    # ProductionConfig pragmas, writes on the primary only
+    'production-primary': {'SQLALCHEMY_READ_REPLICA_URIS': []},
+    # ProductionConfig pragmas and reads routed to read-only engines
+    'production': {},
+}
+
+def profile_settings(profile, path):
+    """Config overrides for a profile on the database file at path."""
+    settings = {
+        'SECRET_KEY': 'benchmark-secret-key-0123456789abcdef',
+        'JWT_SECRET_KEY': 'benchmark-secret-key-0123456789abcdef', 'BCRYPT_LOG_ROUNDS': 4,
+        'SCHEMA_AUTO_MIGRATE': True,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'SQLALCHEMY_READ_REPLICA_URIS': [f'sqlite:///file:{path}?mode=ro&uri=true'] * 2,
+    }
+    settings.update(PROFILES[profile])
+    return settings
+
+def run_worker(profile, path, requests, write_ratio, seed, results):
+    """Issue requests through a test client and report latencies and errors."""
+    from app import create_app
+    app = create_app('config.ProductionConfig', **profile_settings(profile, path))
+    client = app.test_client()
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'admin123'
+    }).get_json()['access_token']
+    headers = {'Authorization': f'Bearer {token}'}
+
+    rng = random.Random(seed)
+    latencies = {'read': [], 'write': []}
+    errors = 0
+    for i in range(requests):
+        kind = 'write' if rng.random() < write_ratio else 'read'
+        start = time.perf_counter()
+        try:
+            if kind == 'write':
+                response = client.post('/api/v1/places/', headers=headers, json={
+                    'title': f'Benchmark {seed}-{i}', 'description': 'Load test',
+                    'price': rng.uniform(20, 300), 'latitude': rng.uniform(-60, 60),
+                    'longitude': rng.uniform(-180, 180)
+                })
+                ok = response.status_code == 201
+            else:
+                response = client.get('/api/v1/places/?limit=20&sort=price')
+                ok = response.status_code == 200
+        except Exception:
+            ok = False
+        latencies[kind].append(time.perf_counter() - start)
+        errors += not ok
+    results.put((latencies, errors))
+
+def run_profile(profile, workers, requests, write_ratio):
+    """Benchmark one profile on a fresh database and return its summary."""
+    from app import create_app
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'benchmark.db')
+        # Create the schema and admin user once, before the workers start
+        app = create_app('config.ProductionConfig', **profile_settings(profile, path))
+        with app.app_context():
+            from app.services import facade
+            facade.ensure_admin_user()
+
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(
+            target=run_worker, args=(profile, path, requests, write_ratio, seed, results)
+        ) for seed in range(workers)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+    summary = {'profile': profile, 'elapsed': elapsed, 'errors': sum(e for _, e in outcomes)}
+    for kind in ('read', 'write'):
+        samples = sorted(s for latencies, _ in outcomes for s in latencies[kind])
+        summary[kind] = (len(samples), statistics.median(samples) if samples else 0,
+                         samples[int(len(samples) * 0.95)] if samples else 0)
+    return summary
+
+def benchmark_concurrency():
+    """Compare request throughput and latency of the connection profiles."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per worker')
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"🏁 {args.workers} workers x {args.requests} requests, {args.write_ratio:.0%} writes")
+    for profile in PROFILES:
+        summary = run_profile(profile, args.workers, args.requests, args.write_ratio)
+        total = args.workers * args.requests
+        print(f"\n📊 {profile}: {total / summary['elapsed']:.0f} req/s, {summary['errors']} errors")
+        for kind in ('read', 'write'):
+            count, median, p95 = summary[kind]
+            print(f"   {kind:5} n={count:5}  median={median * 1000:7.2f}ms  p95={p95 * 1000:7.2f}ms")
+
+if __name__ == "__main__":
+    benchmark_concurrency()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Password Cost Benchmark Script
+Times password hashing at increasing cost on this machine and recommends the
+highest cost whose median hash time stays within the target latency. Run it
+on the deployment hardware and set the printed environment variable.
+
+Usage: python -m scripts.benchmark_password_cost [--algorithm bcrypt|argon2id] [--target-ms 250]
+"""
+
+import argparse
+import statistics
+import time
+from app.security.password_policy import ALGORITHMS, PasswordPolicy
+
+# Cost parameter varied per algorithm, with the range tried
+COST_RANGES = {
+    'bcrypt': ('BCRYPT_LOG_ROUNDS', 'rounds', range(8, 17)),
+    'argon2id': ('ARGON2_TIME_COST', 'time_cost', range(1, 11)),
+}
+
+def time_hash(policy, samples):
+    """Median seconds to hash one password under policy."""
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        policy.hash('benchmark-password')
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+def benchmark_password_cost():
+    """Find the highest cost that hashes within the target latency."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--algorithm', choices=ALGORITHMS, default='bcrypt')
+    parser.add_argument('--target-ms', type=float, default=250.0, help='Target median hash time')
+    parser.add_argument('--samples', type=int, default=5, help='Hashes timed per cost')
+    parser.add_argument('--memory-cost', type=int, default=65536, help='argon2id memory in KiB')
+    parser.add_argument('--parallelism', type=int, default=4, help='argon2id lanes')
+    args = parser.parse_args()
+
+    setting, parameter, costs = COST_RANGES[args.algorithm]
+    print(f"⏱️  {args.algorithm}: target {args.target_ms:.0f}ms per hash, {args.samples} samples per cost")
+    chosen = None
+    for cost in costs:
+        policy = PasswordPolicy(args.algorithm, memory_cost=args.memory_cost,
+                                parallelism=args.parallelism, **{parameter: cost})
+        median_ms = time_hash(policy, args.samples) * 1000
+        within = median_ms <= args.target_ms
+        print(f"   {parameter}={cost:2}  median={median_ms:8.1f}ms  {'✅' if within else '❌'}")
+        if not within:
+            # Cost grows monotonically; higher values are slower still
+            break
+        chosen = cost
+
+    if chosen is None:
+        print(f"\n⚠️  Even the lowest cost exceeds {args.target_ms:.0f}ms on this machine")
+        return
+    print(f"\n✅ Recommended: PASSWORD_HASH_ALGORITHM={args.algorithm} {setting}={chosen}")
+    print("   Existing hashes are upgraded to the new cost at each user's next login")
+
+if __name__ == "__main__":
+    benchmark_password_cost()
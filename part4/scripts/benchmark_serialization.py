@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark Script
+Compares the CPU time per 1,000 rows of flask-restx marshalling plus its JSON
+encoding with the compiled serializers (json, and orjson when installed).
+
+Usage: python -m scripts.benchmark_serialization [--rows 1000] [--repeat 50]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from flask_restx import marshal
+
+def sample_rows(count):
+    """User and place list rows shaped like the facade's projections."""
+    now = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    users = [{
+        'id': f'user-{i}', 'first_name': 'Ada', 'last_name': f'Lovelace {i}',
+        'email': f'ada{i}@example.com', 'is_admin': i % 10 == 0,
+        'created_at': now + timedelta(minutes=i), 'updated_at': now + timedelta(minutes=i)
+    } for i in range(count)]
+    places = {'places': [{
+        'id': f'place-{i}', 'title': f'Cottage {i}', 'latitude': 43.3 + i / 1e4,
+        'longitude': 5.37 - i / 1e4, 'price': 80.0 + i % 50, 'review_count': i % 7,
+        'average_rating': (i % 5) + 0.5
+    } for i in range(count)], 'limit': count, 'next_cursor': None}
+    return users, places
+
+def cpu_ms_per_1000(function, rows, repeat):
+    """CPU milliseconds per 1,000 rows of function()."""
+    start = time.process_time()
+    for _ in range(repeat):
+        function()
+    return (time.process_time() - start) * 1000 / repeat * 1000 / rows
+
+def benchmark_serialization():
+    """Time restx marshalling against the compiled serializers."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    from app import create_app
+    from app.api.v1 import serializers
+    from app.api.v1.serializers import compile_model, dumps
+    from app.api.v1.users import user_response
+    from app.api.v1.places import place_page_model
+
+    app = create_app('config.TestingConfig')
+    users, places = sample_rows(args.rows)
+    cases = [('users', users, user_response, True), ('places page', places, place_page_model, False)]
+    encoders = ['json'] + (['orjson'] if serializers.orjson is not None else [])
+
+    print(f"⏱️  CPU ms per 1,000 rows ({args.rows} rows x {args.repeat})")
+    with app.app_context():
+        for label, data, model, as_list in cases:
+            serialize = compile_model(model)
+            compiled = (lambda: [serialize(row) for row in data]) if as_list else (lambda: serialize(data))
+            baseline = cpu_ms_per_1000(lambda: json.dumps(marshal(data, model)), args.rows, args.repeat)
+            print(f"\n📊 {label}")
+            print(f"   {'restx marshal + json':28} {baseline:7.2f}ms")
+            for encoder in encoders:
+                app.config['JSON_SERIALIZER'] = encoder
+                fast = cpu_ms_per_1000(lambda: dumps(compiled()), args.rows, args.repeat)
+                print(f"   {'compiled + ' + encoder:28} {fast:7.2f}ms  ({baseline / fast:.1f}x)")
+
+if __name__ == "__main__":
+    benchmark_serialization()
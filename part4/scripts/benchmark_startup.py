@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup Time Benchmark Script
+Measures cold starts (a fresh interpreter importing the app and running
+create_app, as run.py and each pre-fork worker do) on a database set up by
+scripts.init_db, with and without the old per-boot migration and admin
+bootstrap, and the create_app cost paid by each test.
+
+Usage: python -m scripts.benchmark_startup [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statement run by a fresh interpreter per cold start
+COLD_START = """
+from app import create_app
+create_app('config.DevelopmentConfig', SQLALCHEMY_DATABASE_URI={uri!r}, BCRYPT_LOG_ROUNDS=12, **{overrides!r})
+"""
+
+PHASES = {
+    'per-boot setup (before)': {'SCHEMA_AUTO_MIGRATE': True, 'ADMIN_BOOTSTRAP_ON_STARTUP': True},
+    'schema check only': {},
+}
+
+def cold_start_ms(code, runs):
+    """Median wall-clock milliseconds of a fresh interpreter running code."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, check=True,
+                       stdout=subprocess.DEVNULL)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+def warm_create_app_ms(runs):
+    """Median milliseconds of create_app('config.TestingConfig') in a warm process."""
+    from app import create_app
+    create_app('config.TestingConfig')
+    durations = []
+    for _ in range(runs * 4):
+        start = time.perf_counter()
+        create_app('config.TestingConfig')
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+def benchmark_startup():
+    """Compare cold and per-test startup costs."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Starts timed per case')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        uri = f"sqlite:///{os.path.join(directory, 'startup.db')}"
+        # One-off setup, as python -m scripts.init_db does
+        cold_start_ms(COLD_START.format(uri=uri, overrides=PHASES['per-boot setup (before)']), 1)
+
+        print(f"🚀 Cold starts, median of {args.runs}")
+        imports = cold_start_ms('import app', args.runs)
+        print(f"   {'interpreter + imports':26} {imports:8.1f}ms")
+        for label, overrides in PHASES.items():
+            elapsed = cold_start_ms(COLD_START.format(uri=uri, overrides=overrides), args.runs)
+            print(f"   {label:26} {elapsed:8.1f}ms  (create_app {elapsed - imports:6.1f}ms)")
+
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            per_test = warm_create_app_ms(args.runs)
+        finally:
+            sys.stdout = stdout
+    print(f"\n🧪 create_app per test (TestingConfig, in-memory database): {per_test:.1f}ms")
+
+if __name__ == "__main__":
+    benchmark_startup()
@@ -1,29 +1,48 @@
 #!/usr/bin/env python3
-"""Initialize the database and create tables."""
+"""
+Database Setup Script
+Applies every pending schema migration and creates the admin account. Run it
+once per database (and after upgrades) instead of on every app start.
 
+Usage: python -m scripts.init_db [--config config.ProductionConfig] [--no-admin]
+"""
+
+import argparse
+import sys
 from app import create_app, db
 
-def init_database():
-    """Initialize the database and create all tables."""
-    app = create_app()
-    
+def init_database(config_class, create_admin=True):
+    """Migrate the primary database and make sure the admin account exists."""
+    # The startup schema check would refuse to start a database not set up yet
+    app = create_app(config_class, SCHEMA_AUTO_MIGRATE=False, SCHEMA_CHECK_ON_STARTUP=False)
+
     with app.app_context():
         try:
-            # Create all tables
-            db.create_all()
-            print("✅ Database initialized successfully!")
-            print("✅ Tables created:")
-            
-            # Show created tables
-            from sqlalchemy import inspect
-            inspector = inspect(db.engine)
-            tables = inspector.get_table_names()
-            for table in tables:
-                print(f"   - {table}")
-                
+            from app.persistence.migrations import check_schema, migrate
+            applied = migrate(db.engine, log=lambda message: print(f"   🏗️  {message}"))
+            check_schema(db.engine)
+            print(f"✅ Database initialized successfully ({len(applied)} migrations applied)")
+
+            if create_admin:
+                from app.services import facade
+                admin, created = facade.ensure_admin_user()
+                print(f"✅ Admin user {'created' if created else 'ready'}")
+                print(f"   Email: {admin.email}")
+                if created:
+                    print(f"   Password: {facade.DEFAULT_ADMIN['password']}")
+            return True
         except Exception as e:
             print(f"❌ Error initializing database: {e}")
+            return False
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--config', default='config.DevelopmentConfig', help='Configuration class')
+    parser.add_argument('--no-admin', action='store_true', help='Skip the admin account')
+    args = parser.parse_args()
+
+    if not init_database(args.config, create_admin=not args.no_admin):
+        sys.exit(1)
 
 if __name__ == "__main__":
-    init_database()
-    
\ No newline at end of file
+    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Rebuild Search Index Script
+Rebuilds the places full-text index from the places table (creating it on
+databases that predate it, or repairing one that no longer matches).
+"""
+
+from app import create_app, db
+
+def rebuild_search_index():
+    """Create the places_fts table and triggers if missing and repopulate it."""
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            from app.services import facade
+            facade.place_repo.rebuild_search_index()
+            print("✅ Place search index rebuilt")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Error rebuilding search index: {e}")
+
+if __name__ == "__main__":
+    rebuild_search_index()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Recompute Place Ratings Script
+Rebuilds the denormalized review_count and rating_sum columns on places.
+"""
+
+from app import create_app, db
+
+def recompute_place_ratings():
+    """Recompute rating aggregates for every place in bulk."""
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            from app.services import facade
+            updated = facade.recompute_place_ratings()
+            print(f"✅ Rating aggregates recomputed for {updated} places")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Error recomputing rating aggregates: {e}")
+
+if __name__ == "__main__":
+    recompute_place_ratings()
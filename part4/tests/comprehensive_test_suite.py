@@ -257,7 +257,7 @@ class HBnBTester:
             # Test user-place relationship
             response = requests.get(f"{BASE_URL}/places/")
             if response.status_code == 200:
-                places = response.json()
+                places = response.json()['places']
                 self.log_test('relationships', 'Places endpoint returns data', len(places) > 0,
                              f"{len(places)} places found")
                 
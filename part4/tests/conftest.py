@@ -22,3 +22,93 @@ def app():
 def client(app):
     """Create test client."""
     return app.test_client()
+
+@pytest.fixture
+def testing_app():
+    """Create an application backed by a fresh in-memory database."""
+    from app import create_app
+    return create_app("config.TestingConfig")
+
+@pytest.fixture
+def testing_client(testing_app):
+    """Create a test client for the in-memory application."""
+    return testing_app.test_client()
+
+@pytest.fixture
+def sql_statements(testing_app):
+    """Record every SQL statement executed against the in-memory database.
+
+    The BEGIN opening each transaction is not a query and is left out.
+    """
+    from sqlalchemy import event
+    from app import db
+    
+    with testing_app.app_context():
+        engine = db.engine
+    
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement != 'BEGIN':
+            statements.append(statement)
+    
+    event.listen(engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', record)
+
+# Account created by the admin bootstrap, and the password of test guests
+ADMIN_EMAIL, ADMIN_PASSWORD = 'admin@hbnb.com', 'admin123'
+GUEST_PASSWORD = 'password123'
+
+def _in_app_context(app, function):
+    """Run function in an app context, reusing the current one (and its session)."""
+    from flask import has_app_context
+    if has_app_context():
+        return function()
+    with app.app_context():
+        return function()
+
+@pytest.fixture
+def login():
+    """Post credentials to /api/v1/auth/login with a test client; returns the response."""
+    def post(client, email=ADMIN_EMAIL, password=ADMIN_PASSWORD, ip=None):
+        environ = {'REMOTE_ADDR': ip} if ip else {}
+        return client.post('/api/v1/auth/login', json={'email': email, 'password': password},
+                           environ_base=environ)
+    return post
+
+@pytest.fixture
+def auth_headers(login):
+    """Authorization header with a fresh access token (the admin's by default)."""
+    def headers(client, email=ADMIN_EMAIL, password=ADMIN_PASSWORD):
+        token = login(client, email, password).get_json()['access_token']
+        return {'Authorization': f'Bearer {token}'}
+    return headers
+
+@pytest.fixture
+def create_guests(testing_app):
+    """Create users with the given emails (password GUEST_PASSWORD); returns their ids."""
+    def create(*emails):
+        from app.services import facade
+        return _in_app_context(testing_app, lambda: [facade.create_user({
+            'first_name': 'Guest', 'last_name': 'User', 'email': email, 'password': GUEST_PASSWORD
+        }).id for email in emails])
+    return create
+
+@pytest.fixture
+def create_place(testing_app):
+    """Create a place through the facade; returns its id.
+    
+    The admin owns it unless owner_id is given; keyword arguments override
+    the other place fields.
+    """
+    def create(title='Cabin', **fields):
+        from app.services import facade
+        def run():
+            data = {'title': title, 'description': 'Mountain cabin', 'price': 90.0,
+                    'latitude': 45.0, 'longitude': 7.0, **fields}
+            if 'owner_id' not in data:
+                data['owner_id'] = facade.get_user_by_email(ADMIN_EMAIL).id
+            return facade.create_place(data).id
+        return _in_app_context(testing_app, run)
+    return create
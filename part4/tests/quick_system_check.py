@@ -91,7 +91,7 @@ def quick_check():
     try:
         response = requests.get("http://127.0.0.1:5000/api/v1/places/")
         if response.status_code == 200:
-            places = response.json()
+            places = response.json()['places']
             print(f"   ✅ {len(places)} places available")
             
             if places:
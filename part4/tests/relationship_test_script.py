@@ -269,7 +269,7 @@ def test_relationships_via_api():
     
     # Get all entities and verify relationships
     all_users = requests.get(f"{BASE_URL}/users/").json()
-    all_places = requests.get(f"{BASE_URL}/places/").json()
+    all_places = requests.get(f"{BASE_URL}/places/").json()['places']
     all_amenities = requests.get(f"{BASE_URL}/amenities/").json()
     all_reviews = requests.get(f"{BASE_URL}/reviews/").json()
     
@@ -330,7 +330,7 @@ def quick_relationship_demo():
             print("✅ Connected to HBnB API")
             
             # Get some sample data
-            places = requests.get(f"{BASE_URL}/places/").json()
+            places = requests.get(f"{BASE_URL}/places/").json()['places']
             if places:
                 place_id = places[0]['id']
                 place_detail = requests.get(f"{BASE_URL}/places/{place_id}").json()
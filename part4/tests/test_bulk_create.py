@@ -0,0 +1,107 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Bulk create endpoint tests (JSON array and NDJSON bodies, per-row results).
+"""
+import json
+
+
+def _place_row(title, **extra):
+    return {'title': title, 'description': 'Bulk loaded', 'price': 50.0,
+            'latitude': 10.0, 'longitude': 20.0, **extra}
+
+
+def test_bulk_amenities_report_duplicates(testing_client, auth_headers):
+    headers = auth_headers(testing_client)
+    testing_client.post('/api/v1/amenities/', json={'name': 'WiFi'}, headers=headers)
+    response = testing_client.post('/api/v1/amenities/bulk', headers=headers, json=[
+        {'name': 'Pool'}, {'name': 'wifi'}, {'name': 'pool'}, {'name': ''}, 'Sauna'
+    ])
+    assert response.status_code == 207
+    body = response.get_json()
+    assert (body['created'], body['failed']) == (1, 4)
+    assert [r['status'] for r in body['results']] == [201, 409, 409, 400, 400]
+    names = [a['name'] for a in testing_client.get('/api/v1/amenities/').get_json()]
+    assert sorted(names) == ['Pool', 'WiFi']
+
+
+def test_bulk_places_from_ndjson_resolve_amenities(testing_app, testing_client, sql_statements,
+                                                   auth_headers):
+    headers = auth_headers(testing_client)
+    wifi = testing_client.post('/api/v1/amenities/', json={'name': 'WiFi'},
+                               headers=headers).get_json()['id']
+    rows = [_place_row(f'Flat {i}', amenities=[wifi]) for i in range(50)]
+    rows.append(_place_row('Broken', amenities=['missing']))
+    rows.append(_place_row('Free', price=-1))
+    body = '\n'.join(json.dumps(row) for row in rows) + '\n'
+
+    sql_statements.clear()
+    response = testing_client.post('/api/v1/places/bulk', data=body, headers={
+        **headers, 'Content-Type': 'application/x-ndjson'})
+    assert response.status_code == 207
+    results = response.get_json()['results']
+    assert [r['status'] for r in results[-2:]] == [404, 400]
+    assert all(r['status'] == 201 for r in results[:50])
+    # Owner and amenities are each resolved by one query, not one per row
+    lookups = [s for s in sql_statements if s.startswith('SELECT') and ' IN ' in s]
+    assert len(lookups) == 2
+
+    from app.services import facade
+    with testing_app.app_context():
+        place = facade.get_place(results[0]['id'])
+        assert [a['id'] for a in place['amenities']] == [wifi]
+        assert place['owner']['email'] == 'admin@hbnb.com'
+
+
+def test_bulk_places_owner_is_current_user_for_non_admins(testing_app, testing_client,
+                                                          auth_headers):
+    from app.services import facade
+    with testing_app.app_context():
+        guest = facade.create_user({'first_name': 'Guest', 'last_name': 'User',
+                                    'email': 'guest@example.com', 'password': 'password123'})
+        admin_id = facade.get_user_by_email('admin@hbnb.com').id
+        guest_id = guest.id
+    headers = auth_headers(testing_client, 'guest@example.com', 'password123')
+    response = testing_client.post('/api/v1/places/bulk', headers=headers,
+                                   json=[_place_row('Mine', owner_id=admin_id)])
+    assert response.status_code == 201
+    with testing_app.app_context():
+        place = facade.get_place(response.get_json()['results'][0]['id'])
+        assert place['owner']['id'] == guest_id
+
+
+def test_bulk_reviews_apply_review_rules_and_aggregates(testing_app, testing_client, auth_headers):
+    from app.services import facade
+    with testing_app.app_context():
+        admin_id = facade.get_user_by_email('admin@hbnb.com').id
+        facade.create_user({'first_name': 'Guest', 'last_name': 'User',
+                            'email': 'guest@example.com', 'password': 'password123'})
+        places = [facade.create_place({**_place_row(f'Place {i}'), 'owner_id': admin_id}).id
+                  for i in range(2)]
+    headers = auth_headers(testing_client, 'guest@example.com', 'password123')
+    response = testing_client.post('/api/v1/reviews/bulk', headers=headers, json=[
+        {'place_id': places[0], 'text': 'Great', 'rating': 5},
+        {'place_id': places[1], 'text': 'Fine', 'rating': 3},
+        {'place_id': places[0], 'text': 'Again', 'rating': 1},
+        {'place_id': 'missing', 'text': 'Lost', 'rating': 4},
+        {'place_id': places[1], 'text': 'Bad rating', 'rating': 9},
+    ])
+    assert [r['status'] for r in response.get_json()['results']] == [201, 201, 400, 404, 400]
+    with testing_app.app_context():
+        details = facade.get_place(places[0])
+        assert (details['review_count'], details['average_rating']) == (1, 5.0)
+
+    own = testing_client.post('/api/v1/reviews/bulk', headers=auth_headers(testing_client),
+                              json=[{'place_id': places[0], 'text': 'Mine', 'rating': 5}])
+    assert own.get_json()['results'][0]['error'] == 'You cannot review your own place'
+
+
+def test_bulk_rejects_unreadable_bodies(testing_client, auth_headers):
+    headers = auth_headers(testing_client)
+    assert testing_client.post('/api/v1/places/bulk', headers=headers,
+                               json={'title': 'Not a list'}).status_code == 400
+    assert testing_client.post('/api/v1/places/bulk', headers=headers, json=[]).status_code == 400
+    response = testing_client.post('/api/v1/places/bulk', data='{"title": "ok"}\n{oops\n', headers={
+        **headers, 'Content-Type': 'application/x-ndjson'})
+    assert response.status_code == 400
+    assert 'line 2' in response.get_json()['message']
+    assert testing_client.post('/api/v1/places/bulk', json=[_place_row('Anon')]).status_code == 401
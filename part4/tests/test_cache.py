@@ -0,0 +1,109 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Read-through cache tests.
+"""
+
+import time
+
+from app.persistence.cache import InMemoryCacheBackend, ReadThroughCache, RedisCacheBackend
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set('a', 1, ttl=60)
+    backend.set('b', 2, ttl=60)
+    backend.get('a')
+    backend.set('c', 3, ttl=60)
+
+    assert backend.get('a') == 1
+    assert backend.get('b') is None
+    assert backend.stats()['evictions'] == 1
+
+
+def test_in_memory_backend_expires_entries():
+    backend = InMemoryCacheBackend()
+    backend.set('a', {'x': 1}, ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get('a') is None
+
+
+def test_redis_backend_rounds_short_ttls_up():
+    class Client:
+        def set(self, key, value, px):
+            self.expiry = px
+
+    client = Client()
+    backend = RedisCacheBackend(client)
+    backend.set('a', True, ttl=0.4)
+    assert client.expiry == 400
+    backend.set('a', True, ttl=0.0001)
+    assert client.expiry == 1
+
+
+def test_read_through_counts_hits_and_misses():
+    cache = ReadThroughCache()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return {'value': 42}
+
+    assert cache.get_or_load('k', loader) == {'value': 42}
+    assert cache.get_or_load('k', loader) == {'value': 42}
+    assert len(loads) == 1
+    assert (cache.stats()['hits'], cache.stats()['misses']) == (1, 1)
+
+
+def test_place_details_are_cached_and_invalidated(testing_app, testing_client, sql_statements):
+    from app.services import facade
+    with testing_app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        place_id = facade.create_place({
+            'title': 'Old title', 'description': 'Cached place', 'price': 50.0,
+            'latitude': 1.0, 'longitude': 2.0, 'owner_id': owner.id
+        }).id
+
+    testing_client.get(f'/api/v1/places/{place_id}')
+    sql_statements.clear()
+    cached = testing_client.get(f'/api/v1/places/{place_id}').get_json()
+    assert cached['title'] == 'Old title'
+    assert sql_statements == []
+
+    with testing_app.app_context():
+        facade.update_place(place_id, {'title': 'New title'})
+
+    assert testing_client.get(f'/api/v1/places/{place_id}').get_json()['title'] == 'New title'
+
+
+def test_owner_change_invalidates_place_details(testing_app, testing_client, sql_statements,
+                                                create_place):
+    from app.services import facade
+    place_id = create_place()
+    assert testing_client.get(f'/api/v1/places/{place_id}').get_json()['owner']['first_name'] == 'Admin'
+
+    sql_statements.clear()
+    with testing_app.app_context():
+        facade.update_user(facade.get_user_by_email('admin@hbnb.com').id, {'first_name': 'Ada'})
+    # Only the ids of the owner's places are read to find the keys to drop
+    assert [s for s in sql_statements if s.startswith('SELECT places.id AS places_id \nFROM places')]
+    assert not [s for s in sql_statements if 'places.title' in s]
+    assert testing_client.get(f'/api/v1/places/{place_id}').get_json()['owner']['first_name'] == 'Ada'
+
+
+def test_amenity_list_invalidated_on_create(testing_app, testing_client):
+    from app.services import facade
+    assert testing_client.get('/api/v1/amenities/').get_json() == []
+
+    with testing_app.app_context():
+        facade.create_amenity({'name': 'Sauna'})
+
+    names = [a['name'] for a in testing_client.get('/api/v1/amenities/').get_json()]
+    assert names == ['Sauna']
+
+
+def test_cache_metrics_require_admin(testing_client, auth_headers):
+    assert testing_client.get('/api/v1/metrics/cache').status_code == 401
+
+    response = testing_client.get('/api/v1/metrics/cache', headers=auth_headers(testing_client))
+    assert response.status_code == 200
+    assert {'hits', 'misses', 'hit_ratio'} <= set(response.get_json())
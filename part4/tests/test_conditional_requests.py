@@ -0,0 +1,47 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+ETag / Last-Modified conditional request tests.
+"""
+
+
+def test_place_detail_revalidates_with_etag(testing_app, testing_client, create_place):
+    place_id = create_place('Studio')
+
+    first = testing_client.get(f'/api/v1/places/{place_id}')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+
+    cached = testing_client.get(f'/api/v1/places/{place_id}', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+    from app.services import facade
+    with testing_app.app_context():
+        facade.update_place(place_id, {'title': 'Renamed studio'})
+
+    changed = testing_client.get(f'/api/v1/places/{place_id}', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+
+def test_collection_etag_changes_when_rows_are_added(testing_client, create_place):
+    create_place('Studio')
+    etag = testing_client.get('/api/v1/places/').headers['ETag']
+
+    assert testing_client.get('/api/v1/places/', headers={'If-None-Match': etag}).status_code == 304
+    # A different page is a different representation
+    assert testing_client.get('/api/v1/places/?limit=5', headers={'If-None-Match': etag}).status_code == 200
+
+    create_place('Second')
+    assert testing_client.get('/api/v1/places/', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_if_modified_since_on_users_and_amenities(testing_client):
+    users = testing_client.get('/api/v1/users/')
+    last_modified = users.headers['Last-Modified']
+    response = testing_client.get('/api/v1/users/', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+
+    amenities = testing_client.get('/api/v1/amenities/')
+    response = testing_client.get('/api/v1/amenities/', headers={'If-None-Match': amenities.headers['ETag']})
+    assert response.status_code == 304
@@ -0,0 +1,70 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for the streaming NDJSON/CSV collection exports.
+"""
+
+import csv
+import io
+import json
+
+
+def _places(app, count):
+    from app.services import facade
+    with app.app_context():
+        owner_id = facade.get_user_by_email('admin@hbnb.com').id
+        rows = [{'title': f'Place {i}', 'description': 'Exported', 'price': 10.0 + i,
+                 'latitude': 1.0, 'longitude': 2.0} for i in range(count)]
+        facade.bulk_create_places(rows, owner_id)
+        return owner_id
+
+
+def test_ndjson_export_streams_in_chunks(testing_app, testing_client, auth_headers):
+    owner_id = _places(testing_app, 1200)
+    response = testing_client.get('/api/v1/export/places', headers=auth_headers(testing_client))
+    
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=places.ndjson'
+    chunks = list(response.response)
+    assert len(chunks) == 3
+    
+    places = [json.loads(line) for line in b''.join(chunks).splitlines()]
+    assert len(places) == 1200
+    assert [p['id'] for p in places] == sorted(p['id'] for p in places)
+    assert places[0]['owner_id'] == owner_id and places[0]['review_count'] == 0
+
+
+def test_csv_export_has_a_header_and_no_passwords(testing_client, auth_headers):
+    admin = auth_headers(testing_client)
+    response = testing_client.get('/api/v1/export/users?format=csv', headers=admin)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row['email'] for row in rows] == ['admin@hbnb.com']
+    assert 'password' not in rows[0]
+    
+    empty = testing_client.get('/api/v1/export/reviews?format=csv', headers=admin)
+    assert empty.get_data(as_text=True) == 'id,text,rating,user_id,place_id,created_at,updated_at\n'
+
+
+def test_export_rows_stay_out_of_the_session(testing_app):
+    from app import db
+    from app.services import facade
+    _places(testing_app, 50)
+    with testing_app.app_context():
+        columns, rows = facade.export_collection('places')
+        assert sum(1 for _ in rows) == 50
+        assert len(db.session.identity_map) == 0
+
+
+def test_export_requires_admin_and_a_known_collection(testing_client, auth_headers, create_guests):
+    create_guests('guest@example.com')
+    
+    assert testing_client.get('/api/v1/export/users').status_code == 401
+    guest = auth_headers(testing_client, 'guest@example.com', 'password123')
+    assert testing_client.get('/api/v1/export/users', headers=guest).status_code == 403
+    admin = auth_headers(testing_client)
+    assert testing_client.get('/api/v1/export/passwords', headers=admin).status_code == 404
+    assert testing_client.get('/api/v1/export/users?format=xml', headers=admin).status_code == 400
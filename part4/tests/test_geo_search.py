@@ -0,0 +1,116 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Geohash proximity search tests.
+"""
+
+import random
+
+from app.models.geo import encode_geohash, haversine_km, covering_cells
+
+
+def test_geohash_and_haversine():
+    assert encode_geohash(57.64911, 10.40744) == 'u4pruydqq'
+    # Paris to London is about 344 km
+    assert abs(haversine_km(48.8566, 2.3522, 51.5074, -0.1278) - 343.5) < 1.0
+    assert len(covering_cells(48.8566, 2.3522, 5)) == 9
+
+
+def _seed_random(app, count=200, seed=7):
+    """Create places scattered around western Europe; returns {id: (lat, lng)}."""
+    from app.models.place import Place
+    from app import db
+    rng = random.Random(seed)
+    with app.app_context():
+        from app.services import facade
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        coords = {}
+        for i in range(count):
+            lat, lng = rng.uniform(40, 55), rng.uniform(-5, 15)
+            place = Place(title=f'P{i}', description='d', price=10, latitude=lat,
+                          longitude=lng, owner_id=owner.id)
+            db.session.add(place)
+            db.session.flush()
+            coords[place.id] = (lat, lng)
+        db.session.commit()
+        return coords
+
+
+def test_nearest_matches_brute_force(testing_app):
+    coords = _seed_random(testing_app)
+    from app.services import facade
+    with testing_app.app_context():
+        for lat, lng in [(48.85, 2.35), (41.0, -4.9), (54.9, 14.9)]:
+            expected = sorted(coords, key=lambda pid: haversine_km(lat, lng, *coords[pid]))[:5]
+            found = facade.get_nearby_places(lat, lng, limit=5)
+            assert [place['id'] for place in found] == expected
+            distances = [place['distance_km'] for place in found]
+            assert distances == sorted(distances)
+
+
+def test_radius_search_and_geohash_sync(testing_app):
+    coords = _seed_random(testing_app)
+    from app.services import facade
+    with testing_app.app_context():
+        found = facade.get_nearby_places(50.0, 5.0, limit=100, radius_km=150)
+        expected = {pid for pid, c in coords.items() if haversine_km(50.0, 5.0, *c) <= 150}
+        assert {place['id'] for place in found} == expected
+
+        place_id = next(iter(coords))
+        facade.update_place(place_id, {'latitude': 10.0, 'longitude': 10.0})
+        assert facade.place_repo.get(place_id).geohash == encode_geohash(10.0, 10.0)
+
+
+def test_nearby_endpoint(testing_app, testing_client):
+    _seed_random(testing_app, count=20)
+    response = testing_client.get('/api/v1/places/nearby?lat=48.85&lng=2.35&limit=3')
+    assert response.status_code == 200
+    places = response.get_json()
+    assert len(places) == 3
+    assert places[0]['distance_km'] <= places[2]['distance_km']
+
+    assert testing_client.get('/api/v1/places/nearby?lat=99&lng=0').status_code == 400
+
+
+def test_proximity_queries_are_bounded_in_sql(testing_app, testing_client, sql_statements):
+    _seed_random(testing_app)
+    from app.services import facade
+    with testing_app.app_context():
+        del sql_statements[:]
+        facade.get_nearby_places(48.85, 2.35, limit=5, radius_km=300)
+        facade.get_nearby_places(48.85, 2.35, limit=5)
+    candidate_queries = [s for s in sql_statements if 'ORDER BY' in s]
+    assert candidate_queries and all('LIMIT' in s for s in candidate_queries)
+    assert all('geohash' in s for s in sql_statements if 'FROM places' in s)
+
+    # Radii no geohash cell can cover are rejected instead of scanning the table
+    response = testing_client.get('/api/v1/places/nearby?lat=0&lng=0&radius_km=20000')
+    assert response.status_code == 400
+
+
+def test_radius_search_across_the_antimeridian(testing_app):
+    from app.models.place import Place
+    from app import db
+    from app.services import facade
+    with testing_app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        for title, lng in (('East', 179.9), ('West', -179.9), ('Far', 170.0)):
+            db.session.add(Place(title=title, description='d', price=10, latitude=-17.0,
+                                 longitude=lng, owner_id=owner.id))
+        db.session.commit()
+        found = facade.get_nearby_places(-17.0, 179.95, limit=10, radius_km=50)
+        assert [place['title'] for place in found] == ['East', 'West']
+
+
+def test_place_list_near_filter_across_the_antimeridian(testing_app, testing_client):
+    from app.services import facade
+    with testing_app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        for title, lng in (('East', 179.9), ('West', -179.9), ('Far', 170.0)):
+            facade.create_place({'title': title, 'description': 'd', 'price': 10.0,
+                                 'latitude': -17.0, 'longitude': lng, 'owner_id': owner.id})
+    response = testing_client.get('/api/v1/places/?near=-17,179.95&radius_km=50&sort=price')
+    assert response.status_code == 200
+    assert sorted(place['title'] for place in response.get_json()['places']) == ['East', 'West']
+    # Same limit as /nearby: radii no geohash cell can cover are rejected
+    response = testing_client.get('/api/v1/places/?near=0,0&radius_km=20000')
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Column-projected list endpoint tests.
+"""
+
+
+def _data_statements(statements):
+    """Drop the count/max(updated_at) version queries issued for ETags."""
+    return [s for s in statements if not s.startswith('SELECT count(')]
+
+
+def _seed(app):
+    """Create a place with two amenities."""
+    from app.services import facade
+    with app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        wifi = facade.create_amenity({'name': 'WiFi'})
+        pool = facade.create_amenity({'name': 'Pool'})
+        facade.create_place({
+            'title': 'Beach House',
+            'description': 'A lovely beach house',
+            'price': 150.0,
+            'latitude': 25.7,
+            'longitude': -80.1,
+            'owner_id': owner.id,
+            'amenities': [wifi.id, pool.id]
+        })
+
+
+def test_place_list_is_a_single_query(testing_app, testing_client, sql_statements):
+    _seed(testing_app)
+    sql_statements.clear()
+
+    response = testing_client.get('/api/v1/places/')
+    assert response.status_code == 200
+    assert response.get_json()['places'][0]['title'] == 'Beach House'
+    # No amenity subquery and no per-row lazy loads
+    statements = _data_statements(sql_statements)
+    assert len(statements) == 1
+    assert 'amenities' not in statements[0]
+
+
+def test_user_and_amenity_lists_use_projections(testing_app, testing_client, sql_statements):
+    _seed(testing_app)
+    sql_statements.clear()
+
+    users = testing_client.get('/api/v1/users/').get_json()
+    assert [user['email'] for user in users] == ['admin@hbnb.com']
+    assert 'password' not in users[0]
+    assert users[0]['created_at']
+
+    amenities = testing_client.get('/api/v1/amenities/').get_json()
+    assert sorted(amenity['name'] for amenity in amenities) == ['Pool', 'WiFi']
+
+    statements = _data_statements(sql_statements)
+    assert len(statements) == 2
+    assert 'password' not in statements[0]
@@ -0,0 +1,103 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Login rate limiting and unknown-email short-circuit tests.
+"""
+
+import pytest
+from app.security.rate_limit import InMemoryRateLimitBackend, LoginRateLimiter
+
+
+def test_sliding_window_forgets_old_failures():
+    backend = InMemoryRateLimitBackend()
+    for now in (0, 10, 20):
+        backend.add('ip:x', now, window=30)
+    
+    assert backend.events('ip:x', 25, window=30) == [0, 10, 20]
+    assert backend.events('ip:x', 35, window=30) == [10, 20]
+    assert backend.events('ip:x', 60, window=30) == []
+
+
+def test_retry_after_counts_from_the_oldest_failure_in_the_limit():
+    limiter = LoginRateLimiter(max_per_ip=10, max_per_email=2, window=60)
+    limiter.record_failure('1.2.3.4', 'Bob@Example.com ')
+    assert limiter.retry_after('1.2.3.4', 'bob@example.com') == 0
+    limiter.record_failure('5.6.7.8', 'bob@example.com')
+    
+    assert 59 <= limiter.retry_after('9.9.9.9', 'bob@example.com') <= 60
+    limiter.record_success('9.9.9.9', 'bob@example.com')
+    assert limiter.retry_after('9.9.9.9', 'bob@example.com') == 0
+
+
+def test_email_limit_rejects_before_password_check(testing_client, login):
+    from app import password_hasher
+    for _ in range(5):
+        assert login(testing_client, 'admin@hbnb.com', 'wrong').status_code == 401
+    checks = password_hasher.stats()['completed']
+    
+    # Even the right password is refused, from another IP, without hashing
+    response = login(testing_client, 'admin@hbnb.com', 'admin123', ip='10.0.0.2')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+    assert password_hasher.stats()['completed'] == checks
+
+
+def test_ip_limit_spans_emails(login):
+    from app import create_app
+    client = create_app('config.TestingConfig', LOGIN_MAX_FAILURES_PER_IP=3).test_client()
+    for index in range(3):
+        assert login(client, f'user{index}@example.com', 'guess').status_code == 401
+    
+    assert login(client, 'admin@hbnb.com', 'admin123').status_code == 429
+    assert login(client, 'admin@hbnb.com', 'admin123', ip='10.0.0.2').status_code == 200
+
+
+def test_success_clears_email_failures(testing_client, login):
+    for _ in range(4):
+        login(testing_client, 'admin@hbnb.com', 'wrong')
+    assert login(testing_client, 'admin@hbnb.com', 'admin123').status_code == 200
+    for _ in range(4):
+        assert login(testing_client, 'admin@hbnb.com', 'wrong').status_code == 401
+
+
+def test_unknown_email_is_cached_and_takes_a_check_time(testing_app, testing_client, sql_statements,
+                                                        login):
+    from app import password_hasher
+    assert login(testing_client, 'ghost@example.com', 'guess').status_code == 401
+    checks = password_hasher.stats()['completed']
+    
+    sql_statements.clear()
+    assert login(testing_client, 'ghost@example.com', 'guess').status_code == 401
+    assert not [s for s in sql_statements if 'FROM users' in s]
+    # The wait replaces the password check instead of running one
+    assert password_hasher.stats()['completed'] == checks
+    assert password_hasher.check_seconds > 0
+    # Kept apart from the read-through cache, which attackers cannot flood
+    from app import cache, unknown_emails
+    assert unknown_emails.get('unknown-email:ghost@example.com')
+    assert cache.get('unknown-email:ghost@example.com') is None
+    
+    # Creating the account drops the negative cache entry
+    from app.services import facade
+    with testing_app.app_context():
+        facade.create_user({'first_name': 'Ghost', 'last_name': 'User',
+                            'email': 'ghost@example.com', 'password': 'boo12345'})
+    assert login(testing_client, 'ghost@example.com', 'boo12345').status_code == 200
+
+
+def test_unknown_email_cache_can_be_turned_off(login):
+    from app import create_app
+    client = create_app('config.TestingConfig', UNKNOWN_EMAIL_CACHE_DEFAULT_TTL=0).test_client()
+    assert login(client, 'ghost@example.com', 'guess').status_code == 401
+    from app import unknown_emails
+    assert unknown_emails.get('unknown-email:ghost@example.com') is None
+
+
+def test_malformed_login_body_is_rejected(testing_client):
+    for body in ({'password': 'guess'}, {'email': 42, 'password': 'guess'}, {}):
+        assert testing_client.post('/api/v1/auth/login', json=body).status_code == 400
+
+
+def test_unknown_backend_is_rejected():
+    from app import create_app
+    with pytest.raises(ValueError):
+        create_app('config.TestingConfig', LOGIN_RATE_LIMIT_BACKEND='carrier-pigeon')
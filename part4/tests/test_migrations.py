@@ -0,0 +1,105 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Versioned schema migration tests: upgrading a legacy database in place and the startup check.
+"""
+import sqlite3
+import pytest
+
+# Schema created by db.create_all() before the migrations existed
+LEGACY_SCHEMA = """
+CREATE TABLE users (id VARCHAR(36) PRIMARY KEY, created_at DATETIME, updated_at DATETIME,
+    first_name VARCHAR(50) NOT NULL, last_name VARCHAR(50) NOT NULL, email VARCHAR(120) NOT NULL UNIQUE,
+    password VARCHAR(128) NOT NULL, is_admin BOOLEAN);
+CREATE TABLE amenities (id VARCHAR(36) PRIMARY KEY, created_at DATETIME, updated_at DATETIME,
+    name VARCHAR(50) NOT NULL UNIQUE);
+CREATE TABLE places (id VARCHAR(36) PRIMARY KEY, created_at DATETIME, updated_at DATETIME,
+    title VARCHAR(100) NOT NULL, description TEXT, price FLOAT NOT NULL, latitude FLOAT NOT NULL,
+    longitude FLOAT NOT NULL, owner_id VARCHAR(36) NOT NULL REFERENCES users (id));
+CREATE TABLE reviews (id VARCHAR(36) PRIMARY KEY, created_at DATETIME, updated_at DATETIME,
+    text TEXT NOT NULL, rating INTEGER NOT NULL, user_id VARCHAR(36) NOT NULL REFERENCES users (id),
+    place_id VARCHAR(36) NOT NULL REFERENCES places (id));
+CREATE TABLE place_amenity (place_id VARCHAR(36) NOT NULL REFERENCES places (id),
+    amenity_id VARCHAR(36) NOT NULL REFERENCES amenities (id), PRIMARY KEY (place_id, amenity_id));
+INSERT INTO users VALUES ('u1', '2024-01-01 00:00:00', '2024-01-01 00:00:00', 'Ann', 'Lee',
+    'ann@example.com', 'x', 0);
+INSERT INTO places VALUES ('p1', '2024-01-01 00:00:00', '2024-01-01 00:00:00', 'Harbour loft',
+    'Loft over the harbour', 120.0, 43.2965, 5.3698, 'u1');
+INSERT INTO reviews VALUES ('r1', '2024-01-02 00:00:00', '2024-01-02 00:00:00', 'Lovely', 4, 'u1', 'p1');
+INSERT INTO reviews VALUES ('r2', '2024-01-03 00:00:00', '2024-01-03 00:00:00', 'Twice', 2, 'u1', 'p1');
+"""
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    path = tmp_path / 'legacy.db'
+    connection = sqlite3.connect(path)
+    connection.executescript(LEGACY_SCHEMA)
+    connection.close()
+    return path
+
+
+def _app(path, **overrides):
+    from app import create_app
+    return create_app('config.ProductionConfig', SECRET_KEY='test-secret', BCRYPT_LOG_ROUNDS=4,
+                      SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}', SQLALCHEMY_READ_REPLICA_URIS=[],
+                      **overrides)
+
+
+def test_startup_fails_until_migrated(legacy_db):
+    with pytest.raises(RuntimeError, match='pending migrations'):
+        _app(legacy_db)
+
+
+def test_migrations_upgrade_legacy_database_in_place(legacy_db):
+    from app import db
+    from app.persistence.migrations import MIGRATIONS, migrate, missing_indexes, pending_migrations
+    app = _app(legacy_db, SCHEMA_CHECK_ON_STARTUP=False)
+    with app.app_context():
+        assert [version for version, _ in pending_migrations(db.engine)] == [v for v, _, _ in MIGRATIONS]
+        assert 'idx_reviews_place_id' in missing_indexes(db.engine)
+        
+        assert len(migrate(db.engine)) == len(MIGRATIONS)
+        assert missing_indexes(db.engine) == []
+        assert migrate(db.engine) == []
+    
+    # The migrated database passes the startup check and kept its data
+    app = _app(legacy_db)
+    with app.app_context():
+        from app.services import facade
+        # The later duplicate review was dropped before the unique index was built
+        place = facade.get_place('p1', include=('reviews',))
+        assert [review['id'] for review in place['reviews']] == ['r1']
+        assert (place['review_count'], place['average_rating']) == (1, 4.0)
+        assert facade.get_nearby_places(43.2965, 5.3698, limit=1)[0]['id'] == 'p1'
+        assert [p['id'] for p in facade.search_places('harbour')['places']] == ['p1']
+        assert all(facade.get_user_principal(user.id)['token_version'] == 0
+                   for user in facade.user_repo.get_all())
+
+
+def test_startup_fails_when_an_index_is_missing(tmp_path):
+    from app import db
+    path = tmp_path / 'hbnb.db'
+    app = _app(path, SCHEMA_AUTO_MIGRATE=True)
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('DROP INDEX idx_places_owner_id')
+    with pytest.raises(RuntimeError, match='missing indexes: idx_places_owner_id'):
+        _app(path)
+
+
+def test_failed_migration_rolls_back_its_ddl(tmp_path, monkeypatch):
+    from app import db
+    from app.persistence import migrations
+    path = tmp_path / 'hbnb.db'
+    app = _app(path, SCHEMA_AUTO_MIGRATE=True)
+
+    def broken(connection):
+        connection.execute(db.text("ALTER TABLE places ADD COLUMN broken INTEGER"))
+        raise RuntimeError('migration failed')
+
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS + [(99, 'broken', broken)])
+    with app.app_context():
+        with pytest.raises(RuntimeError, match='migration failed'):
+            migrations.migrate(db.engine)
+        assert 'broken' not in migrations._columns(db.engine, 'places')
+        assert migrations.pending_migrations(db.engine) == [(99, 'broken')]
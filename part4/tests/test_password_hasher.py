@@ -0,0 +1,104 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for the bounded password hashing pool and its 503 fail-fast behaviour.
+"""
+
+import threading
+import time
+import bcrypt
+import pytest
+from app.security.password_hasher import PasswordHasher, PasswordHasherBusy
+from app.security.password_policy import PasswordPolicy
+
+
+def test_inline_hashes_are_plain_bcrypt():
+    hasher = PasswordHasher(PasswordPolicy(rounds=4))
+    hashed = hasher.hash('secret123')
+    
+    assert hashed.startswith('$2b$04$')
+    assert bcrypt.checkpw(b'secret123', hashed.encode('utf-8'))
+    assert hasher.check(hashed, 'secret123')
+    assert not hasher.check(hashed, 'wrong')
+    assert hasher.stats()['completed'] == 3
+
+
+def test_pool_rejects_calls_beyond_capacity():
+    hasher = PasswordHasher(PasswordPolicy(rounds=13), workers=1, queue_size=0)
+    try:
+        assert hasher.check(hasher.hash('warm-up'), 'warm-up')
+        
+        slow = threading.Thread(target=hasher.hash, args=('slow',))
+        slow.start()
+        while hasher.stats()['running'] == 0:
+            time.sleep(0.001)
+        
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash('rejected')
+        slow.join()
+        
+        stats = hasher.stats()
+        assert stats['rejected'] == 1
+        assert stats['completed'] == 3
+        assert stats['peak_pending'] == 1
+        assert stats['running'] == stats['queue_depth'] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_timed_out_jobs_keep_their_slot_until_done():
+    hasher = PasswordHasher(PasswordPolicy(rounds=4), workers=1, queue_size=0)
+    try:
+        # Start the worker before shortening the timeout
+        assert hasher.check(hasher.hash('warm-up'), 'warm-up')
+        hasher.timeout = 0.2
+        
+        with pytest.raises(PasswordHasherBusy, match='timed out'):
+            hasher._run(time.sleep, 1.0)
+        # The worker is still sleeping, so nothing else is admitted yet
+        assert hasher.stats()['running'] == 1
+        with pytest.raises(PasswordHasherBusy, match='saturated'):
+            hasher.hash('rejected')
+        
+        while hasher.stats()['running']:
+            time.sleep(0.01)
+        hasher.timeout = 10.0
+        assert hasher.check(hasher.hash('after'), 'after')
+        assert hasher.stats()['timeouts'] == 1
+    finally:
+        hasher.shutdown()
+
+
+def test_dead_worker_restarts_the_pool():
+    hasher = PasswordHasher(PasswordPolicy(rounds=4), workers=1, queue_size=0)
+    try:
+        with pytest.raises(PasswordHasherBusy, match='restarted'):
+            hasher._run(os._exit, 1)
+        
+        assert hasher.check(hasher.hash('after'), 'after')
+        stats = hasher.stats()
+        assert stats['pool_restarts'] == 1
+        assert stats['running'] == stats['queue_depth'] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_login_returns_503(testing_client, monkeypatch, login):
+    from app import password_hasher
+    monkeypatch.setattr(password_hasher, 'pending', password_hasher.capacity)
+    
+    response = login(testing_client)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+
+def test_password_hashing_metrics(testing_client, auth_headers):
+    assert testing_client.get('/api/v1/metrics/password-hashing').status_code == 401
+    
+    response = testing_client.get('/api/v1/metrics/password-hashing',
+                                  headers=auth_headers(testing_client))
+    assert response.status_code == 200
+    stats = response.get_json()
+    assert stats['policy'] == 'bcrypt rounds=4'
+    assert stats['queue_depth'] == 0
+    # The admin bootstrap hashed once and the login checked once
+    assert stats['completed'] == 2
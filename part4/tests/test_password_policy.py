@@ -0,0 +1,59 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for the password policy and the transparent rehash on login.
+"""
+
+import pytest
+from app.security.password_policy import PasswordPolicy
+
+
+def test_bcrypt_cost_changes_require_rehash():
+    old = PasswordPolicy(rounds=4).hash('secret123')
+    
+    assert not PasswordPolicy(rounds=4).needs_rehash(old)
+    assert PasswordPolicy(rounds=5).needs_rehash(old)
+    assert PasswordPolicy(rounds=5).verify(old, 'secret123')
+    assert PasswordPolicy().needs_rehash('not-a-hash')
+    assert not PasswordPolicy().verify('not-a-hash', 'secret123')
+
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        PasswordPolicy(algorithm='md5')
+
+
+def test_argon2id_migration_from_bcrypt():
+    pytest.importorskip('argon2')
+    old = PasswordPolicy(rounds=4).hash('secret123')
+    policy = PasswordPolicy('argon2id', time_cost=1, memory_cost=1024, parallelism=1)
+    
+    assert policy.needs_rehash(old)
+    assert policy.verify(old, 'secret123')
+    new = policy.hash('secret123')
+    assert new.startswith('$argon2id$')
+    assert policy.verify(new, 'secret123') and not policy.verify(new, 'wrong')
+    assert not policy.needs_rehash(new)
+
+
+def _stored_hash(app):
+    from app.services import facade
+    with app.app_context():
+        return facade.get_user_by_email('admin@hbnb.com').password
+
+
+def test_login_upgrades_outdated_hash(testing_app, testing_client, monkeypatch, login):
+    from app import password_hasher
+    assert _stored_hash(testing_app).startswith('$2b$04$')
+    monkeypatch.setattr(password_hasher, 'policy', PasswordPolicy(rounds=5))
+    
+    # A failed login leaves the hash alone
+    assert login(testing_client, password='wrong').status_code == 401
+    assert _stored_hash(testing_app).startswith('$2b$04$')
+    
+    assert login(testing_client, password='admin123').status_code == 200
+    upgraded = _stored_hash(testing_app)
+    assert upgraded.startswith('$2b$05$')
+    
+    # Up-to-date hashes are not rewritten
+    assert login(testing_client, password='admin123').status_code == 200
+    assert _stored_hash(testing_app) == upgraded
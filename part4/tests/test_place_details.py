@@ -0,0 +1,69 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Place detail loading tests (eager relationships and ?include= expansion).
+"""
+
+
+def _seed(app, amenity_count=3, review_count=4):
+    """Create a place with amenities and reviews from distinct users."""
+    from app.services import facade
+    with app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        amenity_ids = [facade.create_amenity({'name': f'Amenity {i}'}).id
+                       for i in range(amenity_count)]
+        place = facade.create_place({
+            'title': 'Loft',
+            'description': 'Downtown loft',
+            'price': 80.0,
+            'latitude': 40.7,
+            'longitude': -74.0,
+            'owner_id': owner.id,
+            'amenities': amenity_ids
+        })
+        for i in range(review_count):
+            reviewer = facade.create_user({
+                'first_name': 'Guest',
+                'last_name': str(i),
+                'email': f'guest{i}@example.com',
+                'password': 'password123'
+            })
+            facade.create_review({
+                'text': f'Review {i}',
+                'rating': 4,
+                'place_id': place.id,
+                'user_id': reviewer.id
+            })
+        return place.id
+
+
+def test_default_detail_includes_owner_and_amenities(testing_app, testing_client):
+    place_id = _seed(testing_app)
+
+    place = testing_client.get(f'/api/v1/places/{place_id}').get_json()
+    assert place['owner']['email'] == 'admin@hbnb.com'
+    assert len(place['amenities']) == 3
+    assert 'reviews' not in place
+
+
+def test_full_expansion_uses_bounded_statements(testing_app, testing_client, sql_statements):
+    place_id = _seed(testing_app, amenity_count=10, review_count=10)
+    sql_statements.clear()
+
+    response = testing_client.get(f'/api/v1/places/{place_id}?include=owner,amenities,reviews')
+    assert response.status_code == 200
+    place = response.get_json()
+    assert len(place['amenities']) == 10
+    assert len(place['reviews']) == 10
+    # Place + owner (joined), amenities (selectin), reviews (selectin)
+    assert len(sql_statements) == 3
+
+
+def test_include_reviews_and_unknown_include(testing_app, testing_client):
+    place_id = _seed(testing_app, review_count=2)
+
+    place = testing_client.get(f'/api/v1/places/{place_id}?include=reviews').get_json()
+    assert len(place['reviews']) == 2
+    assert 'owner' not in place and 'amenities' not in place
+
+    response = testing_client.get(f'/api/v1/places/{place_id}?include=photos')
+    assert response.status_code == 400
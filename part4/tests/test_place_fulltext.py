@@ -0,0 +1,110 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Full-text search tests for GET /api/v1/places/search.
+"""
+
+
+def _seed(app):
+    """Create places whose titles and descriptions mention beaches and cabins."""
+    from app.services import facade
+    with app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        specs = [
+            ('Beach house', 'Steps from the sand'),
+            ('City flat', 'Ten minutes from the beach by tram'),
+            ('Mountain cabin', 'Wood cabin with a fireplace'),
+            ('Beach bungalow', 'Quiet bungalow facing the beaches'),
+        ]
+        ids = {}
+        for title, description in specs:
+            ids[title] = facade.create_place({
+                'title': title, 'description': description, 'price': 100.0,
+                'latitude': 10.0, 'longitude': 10.0, 'owner_id': owner.id
+            }).id
+        return ids
+
+
+def _search(client, query):
+    response = client.get(f'/api/v1/places/search?{query}')
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_title_matches_rank_first_and_are_highlighted(testing_app, testing_client):
+    _seed(testing_app)
+    places = _search(testing_client, 'q=beach')['places']
+    titles = [place['title'] for place in places]
+    # Porter stemming matches "beaches"; title hits outrank description-only hits
+    assert set(titles) == {'Beach house', 'City flat', 'Beach bungalow'}
+    assert titles[-1] == 'City flat'
+    assert places[0]['title_highlight'].startswith('<mark>Beach</mark>')
+    assert '<mark>beach</mark>' in places[-1]['snippet']
+
+
+def test_highlights_escape_user_text(testing_app, testing_client):
+    from app.services import facade
+    with testing_app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        facade.create_place({
+            'title': '<img src=x onerror=alert(1)> Loft', 'price': 50.0,
+            'description': 'Quiet loft & <script>alert(2)</script> garden',
+            'latitude': 1.0, 'longitude': 2.0, 'owner_id': owner.id
+        })
+    place = _search(testing_client, 'q=loft')['places'][0]
+    assert place['title_highlight'] == '&lt;img src=x onerror=alert(1)&gt; <mark>Loft</mark>'
+    assert place['snippet'] == ('Quiet <mark>loft</mark> &amp; &lt;script&gt;alert(2)'
+                                '&lt;/script&gt; garden')
+
+
+def test_prefix_match_on_last_word(testing_app, testing_client):
+    _seed(testing_app)
+    assert [p['title'] for p in _search(testing_client, 'q=wood cab')['places']] == ['Mountain cabin']
+    assert _search(testing_client, 'q="quoted" OR -x')['places'] == []
+
+
+def test_pages_follow_cursor(testing_app, testing_client):
+    _seed(testing_app)
+    expected = [place['id'] for place in _search(testing_client, 'q=beach')['places']]
+    ids = []
+    cursor = None
+    while True:
+        page = _search(testing_client, 'q=beach&limit=1' + (f'&cursor={cursor}' if cursor else ''))
+        ids.extend(place['id'] for place in page['places'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert ids == expected
+
+
+def test_index_follows_updates_and_deletes(testing_app, testing_client):
+    ids = _seed(testing_app)
+    from app.services import facade
+    with testing_app.app_context():
+        facade.update_place(ids['Mountain cabin'], {'title': 'Beach cabin'})
+        facade.place_repo.delete(ids['Beach house'])
+    titles = {place['title'] for place in _search(testing_client, 'q=beach')['places']}
+    assert titles == {'Beach cabin', 'City flat', 'Beach bungalow'}
+
+    with testing_app.app_context():
+        facade.place_repo.rebuild_search_index()
+    assert len(_search(testing_client, 'q=beach')['places']) == 3
+
+
+def test_index_survives_renumbered_rowids(testing_app, testing_client):
+    _seed(testing_app)
+    from app import db
+    with testing_app.app_context():
+        # What VACUUM or a dump and restore may do to a table with a string primary key
+        db.session.execute(db.text("UPDATE places SET rowid = rowid + 100"))
+        db.session.commit()
+    titles = {place['title'] for place in _search(testing_client, 'q=beach')['places']}
+    assert titles == {'Beach house', 'City flat', 'Beach bungalow'}
+    titles = {place['title'] for place in _search(testing_client, 'q=fireplace')['places']}
+    assert titles == {'Mountain cabin'}
+
+
+def test_invalid_search_requests(testing_client):
+    assert testing_client.get('/api/v1/places/search').status_code == 400
+    assert testing_client.get('/api/v1/places/search?q=%20').status_code == 400
+    assert testing_client.get('/api/v1/places/search?q=x&cursor=bogus').status_code == 400
+    assert testing_client.get('/api/v1/places/search?q=x&limit=0').status_code == 400
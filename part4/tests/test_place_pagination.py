@@ -0,0 +1,86 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Keyset pagination tests for GET /api/v1/places/.
+"""
+
+from datetime import datetime, timedelta
+
+
+def _seed_places(app, count):
+    """Create `count` places with strictly increasing creation dates."""
+    from app.services import facade
+    with app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        start = datetime(2024, 1, 1)
+        ids = []
+        for i in range(count):
+            place = facade.create_place({
+                'title': f'Place {i}',
+                'description': 'Test place',
+                'price': 10 + i,
+                'latitude': 10.0,
+                'longitude': 20.0,
+                'owner_id': owner.id
+            })
+            place.created_at = start + timedelta(minutes=i)
+            place.save()
+            ids.append(place.id)
+        return ids
+
+
+def test_pages_cover_all_places_in_order(testing_app, testing_client):
+    ids = _seed_places(testing_app, 7)
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/v1/places/?limit=3' + (f'&cursor={cursor}' if cursor else '')
+        response = testing_client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert page['limit'] == 3
+        assert len(page['places']) <= 3
+        seen.extend(place['id'] for place in page['places'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    assert seen == ids
+
+
+def test_last_page_has_no_cursor(testing_app, testing_client):
+    _seed_places(testing_app, 2)
+
+    page = testing_client.get('/api/v1/places/?limit=2').get_json()
+    assert len(page['places']) == 2
+    assert page['next_cursor'] is None
+
+
+def test_invalid_parameters_are_rejected(testing_client):
+    assert testing_client.get('/api/v1/places/?limit=0').status_code == 400
+    assert testing_client.get('/api/v1/places/?limit=1000').status_code == 400
+    assert testing_client.get('/api/v1/places/?cursor=not-a-cursor').status_code == 400
+
+
+def test_sorted_pages_seek_their_index(testing_app, testing_client):
+    from sqlalchemy import event
+    from app import db
+    _seed_places(testing_app, 5)
+    with testing_app.app_context():
+        engine = db.engine
+    executed = []
+    record = lambda conn, cursor, statement, parameters, context, many: executed.append((statement, parameters))
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        for sort, index in (('rating', 'idx_places_rating_average_id'), ('price', 'idx_places_price_id')):
+            cursor = testing_client.get(f'/api/v1/places/?sort={sort}&limit=2').get_json()['next_cursor']
+            del executed[:]
+            assert testing_client.get(f'/api/v1/places/?sort={sort}&limit=2&cursor={cursor}').status_code == 200
+            statement, parameters = next(item for item in executed if 'ORDER BY' in item[0])
+            with testing_app.app_context():
+                plan = ' '.join(row[3] for row in db.session.connection().exec_driver_sql(
+                    'EXPLAIN QUERY PLAN ' + statement, parameters))
+            assert 'SEARCH places USING' in plan and index in plan
+            assert 'TEMP B-TREE' not in plan
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
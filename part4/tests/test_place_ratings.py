@@ -0,0 +1,57 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Denormalized place rating aggregate tests.
+"""
+
+
+def test_review_lifecycle_maintains_aggregates(testing_app, create_place, create_guests):
+    from app.services import facade
+    with testing_app.app_context():
+        place_id = create_place()
+        alice, bob = create_guests('rater0@example.com', 'rater1@example.com')
+
+        first = facade.create_review({'text': 'Great', 'rating': 5,
+                                      'place_id': place_id, 'user_id': alice})
+        facade.create_review({'text': 'Fine', 'rating': 3,
+                              'place_id': place_id, 'user_id': bob})
+        details = facade.get_place(place_id)
+        assert (details['review_count'], details['average_rating']) == (2, 4.0)
+
+        facade.update_review(first.id, {'rating': 1})
+        details = facade.get_place(place_id)
+        assert (details['review_count'], details['average_rating']) == (2, 2.0)
+
+        facade.delete_review(first.id)
+        details = facade.get_place(place_id)
+        assert (details['review_count'], details['average_rating']) == (1, 3.0)
+
+
+def test_place_list_exposes_ratings(testing_app, testing_client, create_place, create_guests):
+    from app.services import facade
+    with testing_app.app_context():
+        place_id = create_place()
+        alice, = create_guests('rater0@example.com')
+        facade.create_review({'text': 'Nice', 'rating': 4,
+                              'place_id': place_id, 'user_id': alice})
+
+    listed = testing_client.get('/api/v1/places/').get_json()['places'][0]
+    assert listed['review_count'] == 1
+    assert listed['average_rating'] == 4.0
+
+
+def test_recompute_repairs_drifted_aggregates(testing_app, create_place, create_guests):
+    from app import db
+    from app.models.place import Place
+    from app.services import facade
+    with testing_app.app_context():
+        place_id = create_place()
+        alice, = create_guests('rater0@example.com')
+        facade.create_review({'text': 'Ok', 'rating': 2,
+                              'place_id': place_id, 'user_id': alice})
+        Place.query.filter_by(id=place_id).update({'review_count': 9, 'rating_sum': 40})
+        db.session.commit()
+
+        assert facade.recompute_place_ratings() == 1
+        db.session.expire_all()
+        details = facade.get_place(place_id)
+        assert (details['review_count'], details['average_rating']) == (1, 2.0)
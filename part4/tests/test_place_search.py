@@ -0,0 +1,80 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Server-side filtering and sorting tests for GET /api/v1/places/.
+"""
+
+
+def _seed(app):
+    """Create places in Paris, Lyon and New York with different prices and amenities."""
+    from app.services import facade
+    with app.app_context():
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        wifi = facade.create_amenity({'name': 'WiFi'}).id
+        pool = facade.create_amenity({'name': 'Pool'}).id
+        specs = [
+            ('Paris flat', 'Cosy flat near the Louvre', 120.0, 48.8566, 2.3522, [wifi]),
+            ('Paris loft', 'Loft with rooftop pool', 250.0, 48.8600, 2.3400, [wifi, pool]),
+            ('Lyon house', 'Quiet house', 80.0, 45.7640, 4.8357, [pool]),
+            ('NYC studio', 'Studio in Manhattan', 200.0, 40.7128, -74.0060, []),
+        ]
+        ids = {}
+        for title, description, price, lat, lng, amenities in specs:
+            ids[title] = facade.create_place({
+                'title': title, 'description': description, 'price': price,
+                'latitude': lat, 'longitude': lng, 'owner_id': owner.id,
+                'amenities': amenities
+            }).id
+        return ids, wifi, pool
+
+
+def _titles(client, query):
+    response = client.get(f'/api/v1/places/?{query}')
+    assert response.status_code == 200, response.get_json()
+    return [place['title'] for place in response.get_json()['places']]
+
+
+def test_price_range_and_text_filters(testing_app, testing_client):
+    _seed(testing_app)
+    assert _titles(testing_client, 'min_price=100&max_price=200&sort=price') == ['Paris flat', 'NYC studio']
+    assert _titles(testing_client, 'q=pool') == ['Paris loft']
+
+
+def test_near_and_amenity_filters(testing_app, testing_client):
+    _, wifi, pool = _seed(testing_app)
+    assert sorted(_titles(testing_client, 'near=48.8566,2.3522&radius_km=5')) == ['Paris flat', 'Paris loft']
+    assert _titles(testing_client, 'near=48.8566,2.3522&radius_km=500&sort=price') == [
+        'Lyon house', 'Paris flat', 'Paris loft']
+    assert _titles(testing_client, f'amenities={wifi},{pool}') == ['Paris loft']
+
+
+def test_sorted_pages_follow_cursor(testing_app, testing_client):
+    _seed(testing_app)
+    titles = []
+    cursor = None
+    while True:
+        query = 'limit=1&sort=-price' + (f'&cursor={cursor}' if cursor else '')
+        page = testing_client.get(f'/api/v1/places/?{query}').get_json()
+        titles.extend(place['title'] for place in page['places'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert titles == ['Paris loft', 'NYC studio', 'Paris flat', 'Lyon house']
+
+    # A cursor only resumes the sort it was issued for
+    first = testing_client.get('/api/v1/places/?limit=1&sort=price').get_json()
+    response = testing_client.get(f"/api/v1/places/?sort=-price&cursor={first['next_cursor']}")
+    assert response.status_code == 400
+
+
+def test_rating_sort_and_invalid_parameters(testing_app, testing_client):
+    ids, _, _ = _seed(testing_app)
+    from app.services import facade
+    with testing_app.app_context():
+        guest = facade.create_user({'first_name': 'G', 'last_name': 'H',
+                                    'email': 'g@example.com', 'password': 'password123'})
+        facade.create_review({'text': 'Superb', 'rating': 5,
+                              'place_id': ids['Lyon house'], 'user_id': guest.id})
+    assert _titles(testing_client, 'sort=rating')[0] == 'Lyon house'
+
+    assert testing_client.get('/api/v1/places/?sort=name').status_code == 400
+    assert testing_client.get('/api/v1/places/?near=abc').status_code == 400
@@ -0,0 +1,62 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+PUT /api/v1/places/<id> authorization and query cost tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def villa(testing_app, create_guests, create_place):
+    """A place owned by guest@example.com with the first of three amenities.
+    
+    Returns (place_id, amenity_ids).
+    """
+    from app.services import facade
+    guest_id, = create_guests('guest@example.com')
+    with testing_app.app_context():
+        amenities = [facade.create_amenity({'name': name}).id for name in ('WiFi', 'Pool', 'Sauna')]
+    place_id = create_place('Villa', description='Sea view villa', price=300.0, latitude=37.0,
+                            longitude=25.0, owner_id=guest_id, amenities=amenities[:1])
+    return place_id, amenities
+
+
+def _update(title, amenities):
+    return {'title': title, 'description': 'Sea view villa', 'price': 320.0,
+            'latitude': 37.0, 'longitude': 25.0, 'amenities': amenities}
+
+
+def test_update_authorization(testing_client, villa, create_guests, auth_headers):
+    place_id, amenities = villa
+    create_guests('other@example.com')
+    
+    other = auth_headers(testing_client, 'other@example.com', 'password123')
+    assert testing_client.put(f'/api/v1/places/{place_id}', json=_update('Mine', []),
+                              headers=other).status_code == 403
+    assert testing_client.put('/api/v1/places/missing', json=_update('Gone', []),
+                              headers=other).status_code == 404
+    admin = auth_headers(testing_client)
+    assert testing_client.put(f'/api/v1/places/{place_id}', json=_update('Admin edit', []),
+                              headers=admin).status_code == 200
+    bad = testing_client.put(f'/api/v1/places/{place_id}', json=_update('Bad', ['missing']), headers=admin)
+    assert bad.status_code == 404
+
+
+def test_update_loads_the_place_once(testing_client, sql_statements, villa, auth_headers):
+    place_id, amenities = villa
+    guest = auth_headers(testing_client, 'guest@example.com', 'password123')
+    
+    sql_statements.clear()
+    response = testing_client.put(f'/api/v1/places/{place_id}', json=_update('Villa II', amenities),
+                                  headers=guest)
+    assert response.status_code == 200
+    
+    selects = [s for s in sql_statements if s.startswith('SELECT')]
+    # One full load of the place, an owner_id-only lookup, and one IN query for the amenities
+    assert len([s for s in selects if 'places.title' in s]) == 1
+    assert len([s for s in selects if s.startswith('SELECT places.owner_id')]) == 1
+    assert len([s for s in selects if 'FROM amenities' in s and ' IN ' in s]) == 1
+    
+    details = testing_client.get(f'/api/v1/places/{place_id}').get_json()
+    assert details['title'] == 'Villa II'
+    assert sorted(a['id'] for a in details['amenities']) == sorted(amenities)
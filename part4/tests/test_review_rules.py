@@ -0,0 +1,55 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Review creation rules (own place, duplicates) enforced by indexed lookups and the unique index.
+"""
+
+
+def _review(app, place_id, user_ids):
+    """Have each user review the place."""
+    from app.services import facade
+    with app.app_context():
+        for user_id in user_ids:
+            facade.create_review({'text': 'Nice', 'rating': 4,
+                                  'place_id': place_id, 'user_id': user_id})
+
+
+def test_review_rules(testing_client, create_place, create_guests, auth_headers):
+    place_id = create_place('chalet')
+    create_guests('guest@example.com')
+    guest = auth_headers(testing_client, 'guest@example.com', 'password123')
+    review = {'text': 'Great stay', 'rating': 5, 'place_id': place_id}
+    
+    assert testing_client.post('/api/v1/reviews/', json=review, headers=guest).status_code == 201
+    second = testing_client.post('/api/v1/reviews/', json=review, headers=guest)
+    assert second.status_code == 400
+    assert second.get_json()['message'] == 'You have already reviewed this place'
+    
+    own = testing_client.post('/api/v1/reviews/', json=review, headers=auth_headers(testing_client))
+    assert own.get_json()['message'] == 'You cannot review your own place'
+    missing = testing_client.post('/api/v1/reviews/', json={**review, 'place_id': 'nope'}, headers=guest)
+    assert missing.status_code == 404
+    
+    # The rejected duplicate left the aggregates untouched
+    place = testing_client.get(f'/api/v1/places/{place_id}').get_json()
+    assert (place['review_count'], place['average_rating']) == (1, 5.0)
+
+
+def test_review_creation_cost_does_not_grow_with_reviews(testing_app, testing_client,
+                                                         sql_statements, create_place,
+                                                         create_guests, auth_headers):
+    quiet = create_place('quiet')
+    popular = create_place('popular')
+    _review(testing_app, popular, create_guests(*[f'popular{i}@example.com' for i in range(20)]))
+    create_guests('guest@example.com')
+    guest = auth_headers(testing_client, 'guest@example.com', 'password123')
+    # Cache the guest's principal so both requests do the same lookups
+    testing_client.get('/api/v1/auth/protected', headers=guest)
+    
+    counts = []
+    for place_id in (quiet, popular):
+        sql_statements.clear()
+        response = testing_client.post('/api/v1/reviews/', headers=guest, json={
+            'text': 'Great stay', 'rating': 5, 'place_id': place_id})
+        assert response.status_code == 201
+        counts.append(len(sql_statements))
+    assert counts[0] == counts[1]
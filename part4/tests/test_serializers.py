@@ -0,0 +1,73 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests that the compiled serializers match flask-restx marshalling.
+"""
+
+import json
+from datetime import datetime
+from flask_restx import Model, fields, marshal
+from app.api.v1.serializers import compile_model
+
+
+owner = Model('Owner', {
+    'id': fields.String,
+    'email': fields.String(attribute='mail'),
+})
+
+listing = Model('Listing', {
+    'id': fields.String,
+    'price': fields.Float,
+    'rooms': fields.Integer(default=1),
+    'available': fields.Boolean,
+    'created_at': fields.DateTime,
+    'tags': fields.List(fields.String),
+    'owner': fields.Nested(owner),
+    'co_owners': fields.List(fields.Nested(owner)),
+    'label': fields.FormattedString('{id}!'),
+})
+
+
+class Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+def test_compiled_output_matches_marshal():
+    serialize = compile_model(listing)
+    rows = [
+        {'id': 'a', 'price': '12.5', 'rooms': 3, 'available': 1, 'created_at': datetime(2024, 5, 1, 8, 30),
+         'tags': ['sea', None], 'owner': {'id': 'u1', 'mail': 'u1@example.com'},
+         'co_owners': [Row(id='u2', mail='u2@example.com'), None]},
+        {'id': 'b', 'created_at': '2024-05-01T08:30:00.250000', 'owner': None},
+        Row(id=7, price=None, rooms=None, available=False, created_at=None, tags=None, co_owners=[]),
+    ]
+    for row in rows:
+        assert serialize(row) == json.loads(json.dumps(marshal(row, listing)))
+
+
+def test_inherited_models_include_parent_fields():
+    from app.api.v1.places import nearby_place_model
+    row = {'id': 'p1', 'title': 'Loft', 'latitude': 1.0, 'longitude': 2.0, 'price': 90,
+           'review_count': 2, 'average_rating': 4.5, 'distance_km': 0.4}
+    assert compile_model(nearby_place_model)(row) == marshal(row, nearby_place_model)
+
+
+def test_list_endpoints_encode_with_either_backend(testing_app, testing_client):
+    from app.services import facade
+    with testing_app.app_context():
+        facade.create_amenity({'name': 'Café'})
+    
+    responses = {}
+    for encoder in ('json', 'orjson'):
+        testing_app.config['JSON_SERIALIZER'] = encoder
+        response = testing_client.get('/api/v1/amenities/')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        responses[encoder] = response.get_json()
+    assert responses['json'] == responses['orjson']
+    assert [a['name'] for a in responses['json']] == ['Café']
+    
+    etag = testing_client.get('/api/v1/amenities/').headers['ETag']
+    not_modified = testing_client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
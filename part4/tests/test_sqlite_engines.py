@@ -0,0 +1,102 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Production SQLite profile tests: connection pragmas and read/write routing.
+"""
+import pytest
+from sqlalchemy import event, text
+
+
+@pytest.fixture
+def production_app(tmp_path):
+    """ProductionConfig on a temporary database file with two read-only engines."""
+    from app import create_app
+    path = tmp_path / 'hbnb.db'
+    return create_app(
+        'config.ProductionConfig',
+        SECRET_KEY='test-secret', JWT_SECRET_KEY='test-secret', BCRYPT_LOG_ROUNDS=4,
+        SCHEMA_AUTO_MIGRATE=True, ADMIN_BOOTSTRAP_ON_STARTUP=True,
+        SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}',
+        SQLALCHEMY_READ_REPLICA_URIS=[f'sqlite:///file:{path}?mode=ro&uri=true'] * 2
+    )
+
+
+@pytest.fixture
+def engines_used(production_app):
+    """Record the bind key ('primary' or a replica key) of every statement."""
+    from app import db
+    with production_app.app_context():
+        engines = dict(db.engines)
+    used = []
+    listeners = []
+    for key, engine in engines.items():
+        def record(*args, key=key or 'primary'):
+            used.append(key)
+        event.listen(engine, 'before_cursor_execute', record)
+        listeners.append((engine, record))
+    yield used
+    for engine, record in listeners:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def test_pragmas_applied_to_primary_and_replicas(production_app):
+    from app import db
+    with production_app.app_context():
+        with db.engines[None].connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1  # NORMAL
+            assert conn.execute(text('PRAGMA foreign_keys')).scalar() == 1
+            assert conn.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+        with db.engines['replica_1'].connect() as conn:
+            assert conn.execute(text('PRAGMA query_only')).scalar() == 1
+            assert conn.execute(text('PRAGMA temp_store')).scalar() == 2  # MEMORY
+            with pytest.raises(Exception):
+                conn.execute(text("DELETE FROM users"))
+
+
+def test_reads_use_one_replica_and_writes_the_primary(production_app, engines_used, auth_headers):
+    client = production_app.test_client()
+    headers = auth_headers(client)
+    
+    engines_used.clear()
+    assert client.get('/api/v1/places/?sort=price').status_code == 200
+    assert len(set(engines_used)) == 1 and engines_used[0].startswith('replica_')
+    
+    # The admin's principal is cached by the first authenticated request
+    assert client.get('/api/v1/auth/protected', headers=headers).status_code == 200
+    engines_used.clear()
+    response = client.post('/api/v1/amenities/', json={'name': 'WiFi'}, headers=headers)
+    assert response.status_code == 201
+    assert set(engines_used) == {'primary'}
+
+
+def test_reads_after_a_write_stick_to_the_primary(production_app, engines_used):
+    from app import db
+    from app.models.amenity import Amenity
+    from app.services import facade
+    with production_app.app_context():
+        facade.get_all_users()
+        assert engines_used[-1].startswith('replica_')
+        
+        db.session.add(Amenity(name='Sauna'))
+        db.session.flush()
+        engines_used.clear()
+        assert facade.amenity_repo.get_amenity_by_name('Sauna') is not None
+        assert set(engines_used) == {'primary'}
+        db.session.rollback()
+    
+    # A new request starts reading from a replica again
+    with production_app.app_context():
+        engines_used.clear()
+        facade.get_all_users()
+        assert engines_used[-1].startswith('replica_')
+
+
+def test_create_app_without_replicas(tmp_path):
+    from app import create_app, db
+    app = create_app('config.ProductionConfig', SECRET_KEY='s', BCRYPT_LOG_ROUNDS=4,
+                     SCHEMA_AUTO_MIGRATE=True,
+                     SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp_path}/hbnb.db',
+                     SQLALCHEMY_READ_REPLICA_URIS=[])
+    with app.app_context():
+        assert list(db.engines) == [None]
+    assert app.test_client().get('/api/v1/places/').status_code == 200
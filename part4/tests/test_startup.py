@@ -0,0 +1,52 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Startup phase tests: create_app leaves database setup to scripts.init_db.
+"""
+import pytest
+
+
+def _settings(path, **overrides):
+    settings = {'SECRET_KEY': 'test-secret-key-0123456789abcdef', 'BCRYPT_LOG_ROUNDS': 4,
+                'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', 'SQLALCHEMY_READ_REPLICA_URIS': []}
+    settings.update(overrides)
+    return settings
+
+
+def test_new_database_needs_init_db(tmp_path):
+    from app import create_app
+    with pytest.raises(RuntimeError, match='python -m scripts.init_db'):
+        create_app('config.ProductionConfig', **_settings(tmp_path / 'hbnb.db'))
+
+
+def test_init_db_sets_up_schema_and_admin_once(tmp_path, monkeypatch):
+    from app import create_app, db
+    from scripts import init_db
+    path = tmp_path / 'hbnb.db'
+    monkeypatch.setattr(init_db, 'create_app',
+                        lambda config_class, **overrides: create_app(config_class, **_settings(path, **overrides)))
+    assert init_db.init_database('config.ProductionConfig')
+    
+    # Later starts only check the schema; they neither migrate nor hash a password
+    app = create_app('config.ProductionConfig', **_settings(path))
+    from app import password_hasher
+    with app.app_context():
+        from app.services import facade
+        admin = facade.get_user_by_email('admin@hbnb.com')
+        assert admin.is_admin
+        assert password_hasher.completed == 0
+        
+        admin.is_admin = False
+        db.session.commit()
+        user, created = facade.ensure_admin_user()
+        assert (user.id, user.is_admin, created) == (admin.id, True, False)
+    
+    login = app.test_client().post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'admin123'})
+    assert login.status_code == 200
+
+
+def test_facade_repositories_are_created_on_first_use():
+    from app.services.facade import HBnBFacade
+    facade = HBnBFacade()
+    assert 'user_repo' not in vars(facade)
+    assert facade.user_repo is facade.user_repo
@@ -0,0 +1,95 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for the static asset pipeline and API response compression.
+"""
+
+import gzip
+import json
+import re
+
+
+def test_pages_reference_immutable_hashed_assets(testing_app, testing_client):
+    from app import assets
+    page = testing_client.get('/')
+    assert page.status_code == 200
+    assert page.headers['Cache-Control'] == 'no-cache'
+    html = page.get_data(as_text=True)
+    
+    hashed = assets.url_for('styles.css')
+    assert re.fullmatch(r'styles\.[0-9a-f]{10}\.css', hashed)
+    assert f'href="{hashed}"' in html and 'href="styles.css"' not in html
+    assert f'src="{assets.url_for("scripts.js")}"' in html
+    assert f'src="{assets.url_for("images/logo.png")}"' in html
+    
+    css = testing_client.get(f'/{hashed}')
+    assert css.status_code == 200
+    assert css.mimetype == 'text/css'
+    assert css.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    # The plain name still works but is revalidated
+    assert testing_client.get('/styles.css').headers['Cache-Control'] == 'no-cache'
+    assert testing_client.get('/missing.js').status_code == 404
+
+
+def test_repeat_page_load_transfers_no_bytes(testing_client):
+    headers = {'Accept-Encoding': 'gzip'}
+    first = testing_client.get('/place.html', headers=headers)
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert first.headers['Vary'] == 'Accept-Encoding'
+    assert '<html' in gzip.decompress(first.data).decode('utf-8').lower()
+    
+    repeat = testing_client.get('/place.html', headers={
+        **headers, 'If-None-Match': first.headers['ETag']})
+    assert repeat.status_code == 304
+    assert repeat.data == b''
+
+
+def test_hashed_names_follow_file_contents(tmp_path):
+    from app import create_app
+    (tmp_path / 'images').mkdir()
+    (tmp_path / 'images' / 'bg.png').write_bytes(b'first')
+    (tmp_path / 'styles.css').write_text('body { background: url("images/bg.png"); }')
+    (tmp_path / 'index.html').write_text('<link rel="stylesheet" href="styles.css">')
+    app = create_app('config.TestingConfig', FRONTEND_DIR=str(tmp_path), STATIC_ASSETS_RELOAD=True)
+    from app import assets
+    
+    client = app.test_client()
+    before = assets.url_for('styles.css')
+    assert assets.url_for('images/bg.png') in client.get(f'/{before}').get_data(as_text=True)
+    
+    # Changing an image renames it and, through the rewritten url(), the stylesheet
+    (tmp_path / 'images' / 'bg.png').write_bytes(b'second')
+    os.utime(tmp_path / 'images' / 'bg.png', ns=(0, 1))
+    assert assets.url_for('styles.css') == before
+    page = client.get('/').get_data(as_text=True)
+    assert assets.url_for('styles.css') != before
+    assert f'href="{assets.url_for("styles.css")}"' in page
+
+
+def test_large_json_responses_are_compressed(testing_app, testing_client):
+    from app.services import facade
+    with testing_app.app_context():
+        for i in range(30):
+            facade.create_amenity({'name': f'Amenity {i}'})
+    
+    plain = testing_client.get('/api/v1/amenities/')
+    assert 'Content-Encoding' not in plain.headers
+    
+    encoded = testing_client.get('/api/v1/amenities/', headers={'Accept-Encoding': 'gzip'})
+    assert encoded.headers['Content-Encoding'] == 'gzip'
+    assert len(encoded.data) < len(plain.data)
+    assert json.loads(gzip.decompress(encoded.data)) == plain.get_json()
+    assert encoded.headers['ETag'] == 'W/' + plain.headers['ETag']
+    
+    cached = testing_client.get('/api/v1/amenities/', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': encoded.headers['ETag']})
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == encoded.headers['ETag']
+    
+    # Below COMPRESS_MIN_SIZE the body is sent as is, and keeps its strong ETag
+    small = testing_client.get('/api/v1/places/', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small.headers
+    assert not small.headers['ETag'].startswith('W/')
+    cached = testing_client.get('/api/v1/places/', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': small.headers['ETag']})
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == small.headers['ETag']
@@ -0,0 +1,97 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for the verified-token cache, refresh tokens and logout revocation.
+"""
+
+import time
+import pytest
+
+
+def _bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_repeat_requests_skip_verification(testing_client, auth_headers):
+    from app import jwt
+    headers = auth_headers(testing_client)
+    
+    for _ in range(3):
+        assert testing_client.get('/api/v1/auth/protected', headers=headers).status_code == 200
+    stats = jwt.verified_tokens.stats()
+    assert (stats['misses'], stats['hits'], stats['entries']) == (1, 2, 1)
+
+
+def test_tampered_tokens_are_still_rejected(testing_client, login):
+    token = login(testing_client).get_json()['access_token']
+    assert testing_client.get('/api/v1/auth/protected', headers=_bearer(token)).status_code == 200
+    
+    header, payload, signature = token.split('.')
+    forged = '.'.join((header, payload, signature[::-1]))
+    assert testing_client.get('/api/v1/auth/protected', headers=_bearer(forged)).status_code == 422
+
+
+def test_cached_tokens_still_expire(auth_headers):
+    from datetime import timedelta
+    from app import create_app
+    client = create_app('config.TestingConfig',
+                        JWT_ACCESS_TOKEN_EXPIRES=timedelta(seconds=1)).test_client()
+    headers = auth_headers(client)
+    assert client.get('/api/v1/auth/protected', headers=headers).status_code == 200
+    
+    time.sleep(1.1)
+    response = client.get('/api/v1/auth/protected', headers=headers)
+    assert response.status_code == 401
+    assert 'expired' in response.get_json()['msg']
+
+
+def test_refresh_issues_a_new_access_token(testing_client, login):
+    tokens = login(testing_client).get_json()
+    # Refresh tokens do not open protected endpoints, access tokens do not refresh
+    assert testing_client.get('/api/v1/auth/protected',
+                              headers=_bearer(tokens['refresh_token'])).status_code == 422
+    assert testing_client.post('/api/v1/auth/refresh',
+                               headers=_bearer(tokens['access_token'])).status_code == 422
+    
+    response = testing_client.post('/api/v1/auth/refresh', headers=_bearer(tokens['refresh_token']))
+    assert response.status_code == 200
+    renewed = _bearer(response.get_json()['access_token'])
+    assert testing_client.get('/api/v1/auth/protected', headers=renewed).get_json()['is_admin'] is True
+
+
+def test_logout_revokes_access_and_refresh_tokens(testing_client, login, auth_headers):
+    tokens = login(testing_client).get_json()
+    access, refresh = _bearer(tokens['access_token']), _bearer(tokens['refresh_token'])
+    other = auth_headers(testing_client)
+    
+    response = testing_client.post('/api/v1/auth/logout', headers=access,
+                                   json={'refresh_token': tokens['refresh_token']})
+    assert response.status_code == 200
+    assert testing_client.get('/api/v1/auth/protected', headers=access).status_code == 401
+    assert testing_client.post('/api/v1/auth/refresh', headers=refresh).status_code == 401
+    # Other sessions of the same user are unaffected
+    assert testing_client.get('/api/v1/auth/protected', headers=other).status_code == 200
+
+
+def test_logout_rejects_foreign_refresh_tokens(testing_client, login, auth_headers, create_guests):
+    create_guests('other@example.com')
+    other = login(testing_client, 'other@example.com', 'password123').get_json()
+    
+    response = testing_client.post('/api/v1/auth/logout', headers=auth_headers(testing_client),
+                                   json={'refresh_token': other['refresh_token']})
+    assert response.status_code == 400
+    assert testing_client.post('/api/v1/auth/refresh',
+                               headers=_bearer(other['refresh_token'])).status_code == 200
+
+
+def test_password_change_revokes_refresh_tokens(testing_app, testing_client, login):
+    from app.services import facade
+    refresh = _bearer(login(testing_client).get_json()['refresh_token'])
+    with testing_app.app_context():
+        facade.update_user(facade.get_user_by_email('admin@hbnb.com').id, {'password': 'rotated123'})
+    assert testing_client.post('/api/v1/auth/refresh', headers=refresh).status_code == 401
+
+
+def test_unknown_denylist_backend_is_rejected():
+    from app import create_app
+    with pytest.raises(ValueError):
+        create_app('config.TestingConfig', TOKEN_DENYLIST_BACKEND='floppy')
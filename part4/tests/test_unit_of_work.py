@@ -0,0 +1,84 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Unit-of-work transaction tests: one commit per use case, rollback and savepoints.
+"""
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture
+def commits(testing_app):
+    """Count transactions committed on the in-memory database."""
+    from app import db
+    with testing_app.app_context():
+        engine = db.engine
+    count = []
+    
+    def record(conn):
+        count.append(1)
+    
+    event.listen(engine, 'commit', record)
+    yield count
+    event.remove(engine, 'commit', record)
+
+
+def test_update_place_commits_once(testing_app, commits, create_place):
+    from app.services import facade
+    with testing_app.app_context():
+        amenities = [facade.create_amenity({'name': name}).id for name in ('WiFi', 'Pool', 'Sauna')]
+        place_id = create_place('Barn', amenities=amenities[:1])
+        commits.clear()
+        facade.update_place(place_id, {'title': 'Loft', 'amenities': amenities})
+        assert len(commits) == 1
+
+
+def test_failed_use_case_rolls_back_everything(testing_app, create_place):
+    from app.services import facade
+    with testing_app.app_context():
+        wifi = facade.create_amenity({'name': 'WiFi'}).id
+        place_id = create_place('Barn', amenities=[wifi])
+        
+        # The amenities were already cleared and the title changed when this fails
+        with pytest.raises(ValueError):
+            facade.update_place(place_id, {'title': 'Loft', 'amenities': [wifi, 'missing']})
+        
+        details = facade.get_place(place_id)
+        assert details['title'] == 'Barn'
+        assert [a['id'] for a in details['amenities']] == [wifi]
+
+
+def test_nested_unit_of_work_uses_savepoint(testing_app):
+    from app import db
+    from app.models.amenity import Amenity
+    from app.persistence.unit_of_work import unit_of_work, after_commit
+    from app.services import facade
+    with testing_app.app_context():
+        calls = []
+        with unit_of_work():
+            db.session.add(Amenity(name='Kept'))
+            after_commit(lambda: calls.append('outer'))
+            with pytest.raises(ValueError):
+                with unit_of_work():
+                    db.session.add(Amenity(name='Dropped'))
+                    after_commit(lambda: calls.append('inner'))
+                    raise ValueError('inner failure')
+            assert calls == []
+        
+        assert calls == ['outer']
+        assert [a.name for a in facade.amenity_repo.get_all()] == ['Kept']
+
+
+def test_nested_unit_of_work_rolls_back_with_reading_outer_block(testing_app):
+    from app import db
+    from app.models.amenity import Amenity
+    from app.persistence.unit_of_work import unit_of_work
+    with testing_app.app_context():
+        # The outer block has only read when the SAVEPOINT is taken
+        with pytest.raises(ValueError):
+            with unit_of_work():
+                Amenity.query.all()
+                with unit_of_work():
+                    db.session.add(Amenity(name='Inner'))
+                raise ValueError('outer failure')
+        
+        assert Amenity.query.all() == []
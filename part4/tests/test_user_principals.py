@@ -0,0 +1,63 @@
+import sys, os; sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""
+Tests for authorization from cached user principals instead of JWT claims.
+"""
+
+import time
+
+
+def test_admin_revocation_applies_to_existing_tokens(testing_app, testing_client, create_guests,
+                                                     auth_headers):
+    from app.services import facade
+    user_id, = create_guests('guest@example.com')
+    with testing_app.app_context():
+        facade.make_user_admin(user_id)
+    headers = auth_headers(testing_client, 'guest@example.com', 'password123')
+    assert testing_client.get('/api/v1/metrics/cache', headers=headers).status_code == 200
+    
+    # The token still claims is_admin, but the principal no longer does
+    with testing_app.app_context():
+        facade.update_user(user_id, {'is_admin': False})
+    assert testing_client.get('/api/v1/metrics/cache', headers=headers).status_code == 403
+
+
+def test_principal_lookups_are_cached(testing_client, sql_statements, auth_headers):
+    headers = auth_headers(testing_client)
+    testing_client.get('/api/v1/auth/protected', headers=headers)
+    
+    sql_statements.clear()
+    response = testing_client.get('/api/v1/auth/protected', headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['is_admin'] is True
+    assert sql_statements == []
+
+
+def test_changes_from_other_workers_apply_within_the_ttl(auth_headers):
+    from app import create_app, db
+    from sqlalchemy import text
+    app = create_app('config.TestingConfig', PRINCIPAL_CACHE_DEFAULT_TTL=0.05)
+    client = app.test_client()
+    headers = auth_headers(client)
+    assert client.get('/api/v1/metrics/cache', headers=headers).status_code == 200
+    
+    # Another process demotes the admin directly in the database
+    with app.app_context():
+        db.session.execute(text("UPDATE users SET is_admin = 0"))
+        db.session.commit()
+    assert client.get('/api/v1/metrics/cache', headers=headers).status_code == 200
+    time.sleep(0.06)
+    assert client.get('/api/v1/metrics/cache', headers=headers).status_code == 403
+
+
+def test_password_change_revokes_tokens(testing_app, testing_client, create_guests, auth_headers):
+    from app.services import facade
+    user_id, = create_guests('guest@example.com')
+    old = auth_headers(testing_client, 'guest@example.com', 'password123')
+    
+    with testing_app.app_context():
+        facade.update_user(user_id, {'password': 'new-password'})
+    
+    response = testing_client.get('/api/v1/auth/protected', headers=old)
+    assert response.status_code == 401
+    new = auth_headers(testing_client, 'guest@example.com', 'new-password')
+    assert testing_client.get('/api/v1/auth/protected', headers=new).status_code == 200
@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """
 Generate Password Hash Script
-Creates bcrypt hash for admin password and generates UUIDs.
+Creates a password hash for the admin password (using the application's
+password policy, e.g. BCRYPT_LOG_ROUNDS) and generates UUIDs.
 """
 
-import bcrypt
+import os
+import sys
 import uuid
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from app.security.password_policy import PasswordPolicy
+
+# Same algorithm and cost as the application's new hashes
+policy = PasswordPolicy.from_config(vars(Config))
+
 def generate_password_hash(password):
-    """Generate bcrypt hash for a password."""
-    # Generate salt and hash password
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    """Generate a hash for a password under the configured policy."""
+    return policy.hash(password)
 
 def generate_uuids(count=5):
     """Generate multiple UUIDs."""
@@ -20,7 +26,7 @@ def generate_uuids(count=5):
 
 def verify_password(password, hashed):
     """Verify a password against its hash."""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    return policy.verify(hashed, password)
 
 def main():
     """Generate and display password hashes and UUIDs."""
@@ -31,6 +37,7 @@ def main():
     admin_password = "admin1234"
     admin_hash = generate_password_hash(admin_password)
     
+    print(f"Policy: {policy.describe()}")
     print(f"Admin Password: {admin_password}")
     print(f"Admin Hash: {admin_hash}")
     